@@ -0,0 +1,40 @@
+"""Add quest search vector
+
+Revision ID: 0a6d2f8c4e91
+Revises: f5c9d3a7b2e4
+Create Date: 2026-10-17 14:05:52.861273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.quest import SEARCH_VECTOR_EXPRESSION
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a6d2f8c4e91'
+down_revision: Union[str, None] = 'f5c9d3a7b2e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        'quests',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True),
+    )
+    op.create_index('ix_quests_search_vector', 'quests', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_quests_title_trgm', 'quests', ['title'], unique=False,
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quests_title_trgm', table_name='quests')
+    op.drop_index('ix_quests_search_vector', table_name='quests')
+    op.drop_column('quests', 'search_vector')
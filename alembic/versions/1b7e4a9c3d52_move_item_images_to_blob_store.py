@@ -0,0 +1,63 @@
+"""Move item images to blob store
+
+Revision ID: 1b7e4a9c3d52
+Revises: 0a6d2f8c4e91
+Create Date: 2026-10-17 15:21:37.045981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.blobstore import blob_store
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7e4a9c3d52'
+down_revision: Union[str, None] = '0a6d2f8c4e91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 100
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('image_sha256', sa.String(length=64), nullable=True))
+    op.add_column('items', sa.Column('image_size', sa.Integer(), nullable=True))
+
+    # Copy blobs out a few at a time to bound memory; each pass claims rows not yet moved.
+    conn = op.get_bind()
+    while True:
+        rows = conn.execute(sa.text(
+            "SELECT item_id, image_data FROM items "
+            "WHERE image_data IS NOT NULL AND image_sha256 IS NULL LIMIT :limit"
+        ), {"limit": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            image_sha256, image_size = blob_store.put(bytes(row.image_data))
+            updates.append({"item_id": row.item_id, "image_sha256": image_sha256, "image_size": image_size})
+        conn.execute(
+            sa.text("UPDATE items SET image_sha256 = :image_sha256, image_size = :image_size WHERE item_id = :item_id"),
+            updates,
+        )
+
+    op.drop_column('items', 'image_data')
+
+
+def downgrade() -> None:
+    op.add_column('items', sa.Column('image_data', sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT item_id, image_sha256 FROM items WHERE image_sha256 IS NOT NULL")).fetchall()
+    for row in rows:
+        if blob_store.exists(row.image_sha256):
+            conn.execute(
+                sa.text("UPDATE items SET image_data = :image_data WHERE item_id = :item_id"),
+                {"item_id": row.item_id, "image_data": blob_store.read(row.image_sha256)},
+            )
+
+    op.drop_column('items', 'image_size')
+    op.drop_column('items', 'image_sha256')
@@ -0,0 +1,26 @@
+"""Add item image content type
+
+Revision ID: 2c8f5b1d7e63
+Revises: 1b7e4a9c3d52
+Create Date: 2026-10-17 16:02:11.478526
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c8f5b1d7e63'
+down_revision: Union[str, None] = '1b7e4a9c3d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('items', sa.Column('image_content_type', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('items', 'image_content_type')
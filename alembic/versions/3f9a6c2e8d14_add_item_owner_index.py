@@ -0,0 +1,29 @@
+"""Add item owner index
+
+Revision ID: 3f9a6c2e8d14
+Revises: 2c8f5b1d7e63
+Create Date: 2026-10-17 16:27:45.031962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a6c2e8d14'
+down_revision: Union[str, None] = '2c8f5b1d7e63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_items_owner_wallet_created_at_item_id', 'items',
+        ['owner_wallet', 'created_at', 'item_id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_owner_wallet_created_at_item_id', table_name='items')
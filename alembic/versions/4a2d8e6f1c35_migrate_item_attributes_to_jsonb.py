@@ -0,0 +1,46 @@
+"""Migrate item attributes to JSONB
+
+Revision ID: 4a2d8e6f1c35
+Revises: 3f9a6c2e8d14
+Create Date: 2026-10-17 17:05:32.618440
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a2d8e6f1c35'
+down_revision: Union[str, None] = '3f9a6c2e8d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Attributes with a B-tree expression index, as declared on app.models.item.Item.
+HOT_ATTRIBUTES = ('damage', 'durability')
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'items', 'attributes',
+        existing_type=sa.JSON(), type_=postgresql.JSONB(),
+        postgresql_using='attributes::jsonb',
+    )
+    op.create_index('ix_items_attributes', 'items', ['attributes'], unique=False, postgresql_using='gin')
+    for key in HOT_ATTRIBUTES:
+        op.create_index(f'ix_items_attributes_{key}', 'items', [sa.text(f"(attributes -> '{key}')")], unique=False)
+    op.create_index('ix_items_created_at_item_id', 'items', ['created_at', 'item_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_items_created_at_item_id', table_name='items')
+    for key in HOT_ATTRIBUTES:
+        op.drop_index(f'ix_items_attributes_{key}', table_name='items')
+    op.drop_index('ix_items_attributes', table_name='items')
+    op.alter_column(
+        'items', 'attributes',
+        existing_type=postgresql.JSONB(), type_=sa.JSON(),
+        postgresql_using='attributes::json',
+    )
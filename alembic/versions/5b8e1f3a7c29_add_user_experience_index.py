@@ -0,0 +1,29 @@
+"""Add user experience index
+
+Revision ID: 5b8e1f3a7c29
+Revises: 4a2d8e6f1c35
+Create Date: 2026-10-17 17:41:09.528314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e1f3a7c29'
+down_revision: Union[str, None] = '4a2d8e6f1c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_experience_points_wallet_address', 'users',
+        [sa.text('experience_points DESC NULLS LAST'), 'wallet_address'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_experience_points_wallet_address', table_name='users')
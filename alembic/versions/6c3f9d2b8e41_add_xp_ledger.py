@@ -0,0 +1,41 @@
+"""Add xp ledger
+
+Revision ID: 6c3f9d2b8e41
+Revises: 5b8e1f3a7c29
+Create Date: 2026-10-17 18:14:52.307168
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c3f9d2b8e41'
+down_revision: Union[str, None] = '5b8e1f3a7c29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'xp_ledger',
+        sa.Column('entry_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('wallet_address', sa.String(), nullable=False),
+        sa.Column('amount', sa.Integer(), nullable=False),
+        sa.Column('reason', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('applied_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['wallet_address'], ['users.wallet_address'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('entry_id'),
+    )
+    op.create_index(
+        'ix_xp_ledger_pending', 'xp_ledger', ['wallet_address', 'entry_id'], unique=False,
+        postgresql_where=sa.text('applied_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_xp_ledger_pending', table_name='xp_ledger')
+    op.drop_table('xp_ledger')
@@ -0,0 +1,28 @@
+"""Add username prefix index
+
+Revision ID: 7d4a0e5c9f52
+Revises: 6c3f9d2b8e41
+Create Date: 2026-10-17 18:47:21.640935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4a0e5c9f52'
+down_revision: Union[str, None] = '6c3f9d2b8e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_username_lower', 'users', [sa.text('lower(username) text_pattern_ops')], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_username_lower', table_name='users')
@@ -0,0 +1,40 @@
+"""Migrate avatar documents to JSONB
+
+Revision ID: 8e5b1c7d3a60
+Revises: 7d4a0e5c9f52
+Create Date: 2026-10-17 19:23:06.814257
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e5b1c7d3a60'
+down_revision: Union[str, None] = '7d4a0e5c9f52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Patched in place with JSON merge patches, which need jsonb operators.
+DOCUMENT_COLUMNS = ('cosmetic_details', 'preferences')
+
+
+def upgrade() -> None:
+    for column in DOCUMENT_COLUMNS:
+        op.alter_column(
+            'avatars', column,
+            existing_type=sa.JSON(), type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    for column in DOCUMENT_COLUMNS:
+        op.alter_column(
+            'avatars', column,
+            existing_type=postgresql.JSONB(), type_=sa.JSON(),
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,54 @@
+"""Add quest geohash
+
+Revision ID: c4f1a2d9e8b3
+Revises: 6b514245334c
+Create Date: 2026-10-17 09:12:44.183502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.geo import encode_geohash
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f1a2d9e8b3'
+down_revision: Union[str, None] = '6b514245334c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    op.add_column('quests', sa.Column('geohash', sa.String(length=12), nullable=True))
+
+    # Backfill in keyset batches so large tables don't build one giant UPDATE.
+    conn = op.get_bind()
+    last_id = None
+    while True:
+        query = "SELECT quest_id, latitude, longitude FROM quests"
+        params = {"limit": BATCH_SIZE}
+        if last_id is not None:
+            query += " WHERE quest_id > :last_id"
+            params["last_id"] = last_id
+        rows = conn.execute(sa.text(query + " ORDER BY quest_id LIMIT :limit"), params).fetchall()
+        if not rows:
+            break
+        conn.execute(
+            sa.text("UPDATE quests SET geohash = :geohash WHERE quest_id = :quest_id"),
+            [{"quest_id": row.quest_id, "geohash": encode_geohash(row.latitude, row.longitude)} for row in rows],
+        )
+        last_id = rows[-1].quest_id
+
+    op.create_index(
+        'ix_quests_geohash', 'quests', ['geohash'], unique=False,
+        postgresql_ops={'geohash': 'text_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quests_geohash', table_name='quests')
+    op.drop_column('quests', 'geohash')
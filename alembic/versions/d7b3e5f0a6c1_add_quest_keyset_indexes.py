@@ -0,0 +1,32 @@
+"""Add quest keyset indexes
+
+Revision ID: d7b3e5f0a6c1
+Revises: c4f1a2d9e8b3
+Create Date: 2026-10-17 10:03:21.559034
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b3e5f0a6c1'
+down_revision: Union[str, None] = 'c4f1a2d9e8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_quests_created_at_quest_id', 'quests', ['created_at', 'quest_id'], unique=False)
+    op.create_index('ix_quests_status_created_at_quest_id', 'quests', ['status', 'created_at', 'quest_id'], unique=False)
+    op.create_index('ix_quests_creator_wallet_created_at_quest_id', 'quests', ['creator_wallet', 'created_at', 'quest_id'], unique=False)
+    op.create_index('ix_quests_participant_wallet_created_at_quest_id', 'quests', ['participant_wallet', 'created_at', 'quest_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quests_participant_wallet_created_at_quest_id', table_name='quests')
+    op.drop_index('ix_quests_creator_wallet_created_at_quest_id', table_name='quests')
+    op.drop_index('ix_quests_status_created_at_quest_id', table_name='quests')
+    op.drop_index('ix_quests_created_at_quest_id', table_name='quests')
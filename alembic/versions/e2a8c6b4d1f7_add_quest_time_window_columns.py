@@ -0,0 +1,43 @@
+"""Add quest time window columns
+
+Revision ID: e2a8c6b4d1f7
+Revises: d7b3e5f0a6c1
+Create Date: 2026-10-17 11:27:05.304118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8c6b4d1f7'
+down_revision: Union[str, None] = 'd7b3e5f0a6c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('quests', sa.Column('starts_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('quests', sa.Column('ends_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Malformed bounds are left NULL rather than failing the migration.
+    op.execute("""
+        UPDATE quests SET
+            starts_at = CASE WHEN pg_input_is_valid(time_window->>'start_time', 'timestamptz')
+                             THEN (time_window->>'start_time')::timestamptz END,
+            ends_at = CASE WHEN pg_input_is_valid(time_window->>'end_time', 'timestamptz')
+                           THEN (time_window->>'end_time')::timestamptz END
+        WHERE time_window IS NOT NULL
+    """)
+
+    op.create_index('ix_quests_starts_at', 'quests', ['starts_at'], unique=False)
+    op.create_index('ix_quests_ends_at_starts_at', 'quests', ['ends_at', 'starts_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quests_ends_at_starts_at', table_name='quests')
+    op.drop_index('ix_quests_starts_at', table_name='quests')
+    op.drop_column('quests', 'ends_at')
+    op.drop_column('quests', 'starts_at')
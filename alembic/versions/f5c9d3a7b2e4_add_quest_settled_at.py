@@ -0,0 +1,31 @@
+"""Add quest settled_at
+
+Revision ID: f5c9d3a7b2e4
+Revises: e2a8c6b4d1f7
+Create Date: 2026-10-17 12:48:39.720416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c9d3a7b2e4'
+down_revision: Union[str, None] = 'e2a8c6b4d1f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('quests', sa.Column('settled_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_quests_unsettled_updated_at', 'quests', ['updated_at'], unique=False,
+        postgresql_where=sa.text("status = 'completed' AND settled_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_quests_unsettled_updated_at', table_name='quests')
+    op.drop_column('quests', 'settled_at')
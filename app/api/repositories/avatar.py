@@ -1,9 +1,30 @@
 import operator
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.merge_patch import merge_patch_expression
 from app.models.avatar import Avatar as AvatarModel
-from app.schemas.avatar import AvatarCreate, AvatarUpdate
+from app.schemas.avatar import AvatarCreate, AvatarPatch, AvatarUpdate
+
+# Document columns merged key by key by a JSON merge patch.
+PATCHED_DOCUMENTS = ("cosmetic_details", "preferences")
+
+
+def _update_avatar(db: Session, wallet_address: str, values: dict) -> Optional[AvatarModel]:
+    if not values:
+        return AvatarRepository.get_avatar(db, wallet_address)
+    db_avatar = db.execute(
+        update(AvatarModel)
+        .where(AvatarModel.wallet_address == wallet_address)
+        .values(**values)
+        .returning(AvatarModel)
+        .execution_options(synchronize_session=False)
+    ).scalars().first()
+    db.commit()
+    return db_avatar
 
 
 class AvatarRepository:
@@ -27,50 +48,103 @@ class AvatarRepository:
         return db.query(AvatarModel).filter(AvatarModel.wallet_address == wallet_address).first()
 
     @staticmethod
-    def create_avatar(db: Session, avatar_create: AvatarCreate) -> AvatarModel:
+    def lock_avatar(db: Session, wallet_address: str) -> bool:
+        """
+        Check that an avatar exists, locking its row ``FOR UPDATE`` until the caller's transaction ends.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): User's wallet address.
+
+        Returns:
+            bool: True if the avatar exists.
+        """
+        return db.scalars(
+            select(AvatarModel.wallet_address).where(AvatarModel.wallet_address == wallet_address).with_for_update()
+        ).first() is not None
+
+    @staticmethod
+    def create_avatar(db: Session, avatar_create: AvatarCreate) -> Optional[AvatarModel]:
         """
-        Create a new avatar.
+        Create a new avatar with one ``INSERT ... ON CONFLICT DO NOTHING RETURNING``.
 
         Args:
             db (Session): Database session.
             avatar_create (AvatarCreate): Data for creating a new avatar.
 
         Returns:
-            AvatarModel: The newly created avatar model instance.
+            Optional[AvatarModel]: The newly created avatar model instance, or None if the wallet already has one.
+
+        Raises:
+            ValueError: If the wallet does not belong to a user.
         """
-        db_avatar = AvatarModel(**avatar_create.dict())
-        db.add(db_avatar)
-        db.commit()
-        db.refresh(db_avatar)
+        try:
+            db_avatar = db.execute(
+                insert(AvatarModel)
+                .values(**avatar_create.dict())
+                .on_conflict_do_nothing(index_elements=[AvatarModel.wallet_address])
+                .returning(AvatarModel)
+            ).scalars().first()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ValueError("User not found") from e
         return db_avatar
 
     @staticmethod
-    def update_avatar(db: Session, db_avatar: AvatarModel, avatar_update: AvatarUpdate) -> AvatarModel:
+    def update_avatar(db: Session, wallet_address: str, avatar_update: AvatarUpdate) -> Optional[AvatarModel]:
         """
-        Update an existing avatar.
+        Update an existing avatar with one ``UPDATE ... RETURNING``.
 
         Args:
             db (Session): Database session.
-            db_avatar (AvatarModel): The avatar model instance to update.
+            wallet_address (str): User's wallet address.
             avatar_update (AvatarUpdate): Data for updating the avatar.
 
         Returns:
-            AvatarModel: The updated avatar model instance.
+            Optional[AvatarModel]: The updated avatar model instance or None if not found.
         """
-        for key, value in avatar_update.dict(exclude_unset=True).items():
-            setattr(db_avatar, key, value)
-        db.commit()
-        db.refresh(db_avatar)
-        return db_avatar
+        return _update_avatar(db, wallet_address, avatar_update.dict(exclude_unset=True))
+
+    @staticmethod
+    def patch_avatar(db: Session, wallet_address: str, avatar_patch: AvatarPatch) -> Optional[AvatarModel]:
+        """
+        Apply a JSON merge patch to an avatar with one ``UPDATE ... RETURNING``.
+
+        ``cosmetic_details`` and ``preferences`` are patched in the database with
+        ``-``/``||`` on the stored documents, so only the patched keys change and
+        concurrent patches to other keys are kept.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): User's wallet address.
+            avatar_patch (AvatarPatch): The merge patch.
+
+        Returns:
+            Optional[AvatarModel]: The patched avatar model instance or None if not found.
+        """
+        values = avatar_patch.dict(exclude_unset=True)
+        for key in PATCHED_DOCUMENTS:
+            if key in values:
+                values[key] = merge_patch_expression(getattr(AvatarModel, key), values[key])
+        return _update_avatar(db, wallet_address, values)
 
     @staticmethod
-    def delete_avatar(db: Session, db_avatar: AvatarModel) -> None:
+    def delete_avatar(db: Session, wallet_address: str) -> bool:
         """
-        Delete an avatar.
+        Delete an avatar with one ``DELETE ... RETURNING``.
 
         Args:
             db (Session): Database session.
-            db_avatar (AvatarModel): The avatar model instance to delete.
+            wallet_address (str): User's wallet address.
+
+        Returns:
+            bool: True if the avatar existed and was deleted.
         """
-        db.delete(db_avatar)
+        deleted = db.execute(
+            delete(AvatarModel)
+            .where(AvatarModel.wallet_address == wallet_address)
+            .returning(AvatarModel.wallet_address)
+        ).first()
         db.commit()
+        return deleted is not None
@@ -0,0 +1,138 @@
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.progression import level_expression
+from app.models.experience import ExperienceLedgerEntry
+from app.models.user import User as UserModel
+from app.schemas.experience import ExperienceAward
+
+
+class ExperienceRepository:
+    """
+    Repository class for the experience ledger.
+    Awards are only ever appended; a periodic aggregator folds them into users.
+    """
+
+    @staticmethod
+    def append_entry(db: Session, wallet_address: str, award: ExperienceAward) -> Optional[ExperienceLedgerEntry]:
+        """
+        Append an award to the ledger with one ``INSERT ... RETURNING``.
+
+        Never touches the ``users`` row, so awards to a busy player don't contend with each other.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user to award.
+            award (ExperienceAward): Amount and reason.
+
+        Returns:
+            Optional[ExperienceLedgerEntry]: The new entry, or None if the user does not exist.
+        """
+        try:
+            entry = db.execute(
+                insert(ExperienceLedgerEntry)
+                .values(wallet_address=wallet_address, **award.dict())
+                .returning(ExperienceLedgerEntry)
+            ).scalars().first()
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return None
+        return entry
+
+    @staticmethod
+    def get_experience(db: Session, wallet_address: str) -> Optional[tuple[int, int]]:
+        """
+        Retrieve a user's settled and pending experience in one query.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user.
+
+        Returns:
+            Optional[tuple[int, int]]: ``(settled, pending)``, or None if the user does not exist.
+        """
+        pending = (
+            select(func.coalesce(func.sum(ExperienceLedgerEntry.amount), 0))
+            .where(
+                ExperienceLedgerEntry.wallet_address == UserModel.wallet_address,
+                ExperienceLedgerEntry.applied_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+        row = db.execute(
+            select(func.coalesce(UserModel.experience_points, 0), pending)
+            .where(UserModel.wallet_address == wallet_address)
+        ).first()
+        return None if row is None else (row[0], int(row[1]))
+
+    @staticmethod
+    def apply_pending(db: Session, batch_size: int) -> tuple[int, list[Row]]:
+        """
+        Fold one batch of pending ledger entries into users in a single statement.
+
+        One CTE claims the oldest pending entries with ``FOR UPDATE SKIP LOCKED``,
+        stamps them applied, sums them per user, locks those users in wallet order
+        and adds the sums to ``experience_points`` and ``level``. Concurrent aggregators therefore fold
+        disjoint batches, and each user row is written once per batch however many
+        awards it received.
+
+        Args:
+            db (Session): Database session.
+            batch_size (int): Maximum number of ledger entries to apply.
+
+        Returns:
+            tuple[int, list[Row]]: Number of entries applied, and the wallet address,
+            username and new experience total of every user they touched.
+        """
+        batch = (
+            select(ExperienceLedgerEntry.entry_id)
+            .where(ExperienceLedgerEntry.applied_at.is_(None))
+            .order_by(ExperienceLedgerEntry.entry_id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        stamped = (
+            update(ExperienceLedgerEntry)
+            .where(ExperienceLedgerEntry.entry_id == batch.c.entry_id)
+            .values(applied_at=func.now())
+            .returning(ExperienceLedgerEntry.wallet_address, ExperienceLedgerEntry.amount)
+            .cte("stamped")
+        )
+        totals = (
+            select(
+                stamped.c.wallet_address,
+                func.sum(stamped.c.amount).label("amount"),
+                func.count().label("entries"),
+            )
+            .group_by(stamped.c.wallet_address)
+            .cte("totals")
+        )
+        # Lock the users in wallet order before the UPDATE touches them, so concurrent
+        # aggregators (and settlement) queue on overlapping users instead of deadlocking.
+        locked = (
+            select(UserModel.wallet_address)
+            .where(UserModel.wallet_address.in_(select(totals.c.wallet_address)))
+            .order_by(UserModel.wallet_address)
+            .with_for_update()
+            .cte("locked")
+        )
+        new_total = func.coalesce(UserModel.experience_points, 0) + totals.c.amount
+        rows = db.execute(
+            update(UserModel)
+            .where(
+                UserModel.wallet_address == locked.c.wallet_address,
+                UserModel.wallet_address == totals.c.wallet_address,
+            )
+            .values(experience_points=new_total, level=level_expression(new_total))
+            .returning(UserModel.wallet_address, UserModel.username, UserModel.experience_points, totals.c.entries)
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+        return sum(row.entries for row in rows), rows
@@ -1,9 +1,96 @@
 import operator
+from datetime import datetime
+from sqlalchemy import (
+    ARRAY, Row, String, and_, any_, bindparam, delete, false, func, not_, or_, select, tuple_, type_coerce, update,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.events import item_events
+from app.core.filters import AttributeFilter
+from app.core.merge_patch import merge_patch_expression
 from app.models.item import Item as ItemModel
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.models.item import attribute_path
+from app.schemas.item import ItemCreate, ItemPatch, ItemUpdate
+
+# Item fields rendered into the metadata document at /metadata/{item_id}.json
+METADATA_FIELDS = {"name", "description", "attributes", "image_url"}
+
+_RANGE_COMPARATORS = {
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+def _attribute_condition(attribute_filter: AttributeFilter):
+    """
+    Compile an attribute filter to an index-friendly JSONB predicate.
+
+    Equality is a containment test (``attributes @> '{"key": value}'``) served by
+    the GIN index. Range comparisons compare ``attributes -> 'key'`` as JSONB,
+    which orders numbers numerically and can use the expression index on hot
+    attributes; the ``jsonb_typeof`` guard drops non-numeric values, which JSONB
+    would otherwise order against numbers by type.
+    """
+    key, op, value = attribute_filter
+    if op == "eq":
+        return ItemModel.attributes.contains({key: value})
+    if op == "ne":
+        return not_(ItemModel.attributes.contains({key: value}))
+    path = attribute_path(ItemModel.attributes, key)
+    return and_(
+        func.jsonb_typeof(path) == "number",
+        _RANGE_COMPARATORS[op](path, type_coerce(value, JSONB)),
+    )
+
+
+def _invalidate_metadata(db: Session, item_id: str) -> None:
+    """
+    Drop an item's cached metadata document in every worker, after the change has committed.
+    """
+    item_events.publish(db, [{"type": "metadata_invalidated", "item_id": item_id}])
+
+
+def _update_item(db: Session, item_id: str, values: dict) -> Optional[ItemModel]:
+    """
+    Run one ``UPDATE ... RETURNING`` for an item, dropping its cached metadata document if that changed.
+
+    When the update touches fields rendered into the metadata document, the
+    statement joins a locked snapshot of the old row and returns whether any
+    of them actually changed, so the cached document is only dropped then.
+    """
+    if not values:
+        return ItemRepository.get_item(db, item_id)
+    metadata_keys = [key for key in values if key in METADATA_FIELDS]
+    if metadata_keys:
+        old = (
+            select(ItemModel.item_id, *(getattr(ItemModel, key) for key in metadata_keys))
+            .where(ItemModel.item_id == item_id)
+            .with_for_update()
+            .subquery("old")
+        )
+        stmt = (
+            update(ItemModel)
+            .where(ItemModel.item_id == old.c.item_id)
+            .returning(
+                ItemModel,
+                or_(*(old.c[key].is_distinct_from(getattr(ItemModel, key)) for key in metadata_keys)),
+            )
+        )
+    else:
+        stmt = update(ItemModel).where(ItemModel.item_id == item_id).returning(ItemModel, false())
+    row = db.execute(stmt.values(**values).execution_options(synchronize_session=False)).first()
+    db.commit()
+    if row is None:
+        return None
+    db_item, metadata_changed = row
+    if metadata_changed:
+        _invalidate_metadata(db, item_id)
+    return db_item
 
 
 class ItemRepository:
@@ -27,50 +114,273 @@ class ItemRepository:
         return db.query(ItemModel).filter(ItemModel.item_id == item_id).first()
 
     @staticmethod
-    def create_item(db: Session, item_create: ItemCreate) -> ItemModel:
+    def get_owned_item_ids(db: Session, wallet_address: str, item_ids: list[str]) -> set[str]:
+        """
+        Return which of the given items the wallet owns, in one ``= ANY(:ids)`` query.
+
+        The rows are locked ``FOR SHARE`` until the caller's transaction ends, so they
+        cannot be transferred away between this check and the write that relies on it.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the owner.
+            item_ids (list[str]): Item IDs to check.
+
+        Returns:
+            set[str]: The subset of ``item_ids`` owned by the wallet.
+        """
+        if not item_ids:
+            return set()
+        return set(db.scalars(
+            select(ItemModel.item_id)
+            .where(
+                ItemModel.item_id == any_(bindparam("item_ids", item_ids, type_=ARRAY(String))),
+                ItemModel.owner_wallet == wallet_address,
+            )
+            .with_for_update(read=True)
+        ))
+
+    @staticmethod
+    def get_items_by_ids(db: Session, item_ids: list[str]) -> list[ItemModel]:
+        """
+        Retrieve the items with the given IDs in one ``= ANY(:ids)`` query.
+
+        Args:
+            db (Session): Database session.
+            item_ids (list[str]): Item IDs.
+
+        Returns:
+            list[ItemModel]: The items that exist, in no particular order.
+        """
+        return db.query(ItemModel).filter(
+            ItemModel.item_id == any_(bindparam("item_ids", item_ids, type_=ARRAY(String)))
+        ).all()
+
+    @staticmethod
+    def get_items(
+        db: Session,
+        limit: int,
+        after: Optional[tuple[datetime, str]] = None,
+        owner_wallet: Optional[str] = None,
+        attribute_filters: Optional[list[AttributeFilter]] = None,
+    ) -> list[ItemModel]:
+        """
+        Retrieve a page of items, newest first.
+
+        Pages are addressed by the ``(created_at, item_id)`` of the last row seen,
+        so each page is a bounded range scan of the owner index however large the
+        inventory is. Attribute filters are compiled to JSONB operators and
+        evaluated by the database.
+
+        Args:
+            db (Session): Database session.
+            limit (int): Maximum number of items to return.
+            after (Optional[tuple[datetime, str]]): Keyset position of the previous page's last item.
+            owner_wallet (Optional[str]): Only return items owned by this wallet.
+            attribute_filters (Optional[list[AttributeFilter]]): Only return items matching every filter.
+
+        Returns:
+            list[ItemModel]: Up to ``limit`` item model instances.
+        """
+        query = db.query(ItemModel)
+        if owner_wallet is not None:
+            query = query.filter(ItemModel.owner_wallet == owner_wallet)
+        for attribute_filter in attribute_filters or ():
+            query = query.filter(_attribute_condition(attribute_filter))
+        if after is not None:
+            query = query.filter(tuple_(ItemModel.created_at, ItemModel.item_id) < tuple_(*after))
+        return (
+            query.order_by(ItemModel.created_at.desc(), ItemModel.item_id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def create_item(db: Session, item_create: ItemCreate) -> Optional[ItemModel]:
         """
-        Create a new item.
+        Create a new item with one ``INSERT ... ON CONFLICT DO NOTHING RETURNING``.
 
         Args:
             db (Session): Database session.
             item_create (ItemCreate): Data for creating a new item.
 
         Returns:
-            ItemModel: The newly created item model instance.
+            Optional[ItemModel]: The newly created item model instance, or None if the item ID is taken.
+
+        Raises:
+            ValueError: If the owner wallet does not exist.
         """
-        db_item = ItemModel(**item_create.dict())
-        db.add(db_item)
-        db.commit()
-        db.refresh(db_item)
+        try:
+            db_item = db.execute(
+                insert(ItemModel)
+                .values(**item_create.dict())
+                .on_conflict_do_nothing(index_elements=[ItemModel.item_id])
+                .returning(ItemModel)
+            ).scalars().first()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ValueError("Owner wallet not found") from e
         return db_item
 
     @staticmethod
-    def update_item(db: Session, db_item: ItemModel, item_update: ItemUpdate) -> ItemModel:
+    def update_item(db: Session, item_id: str, item_update: ItemUpdate) -> Optional[ItemModel]:
         """
-        Update an existing item.
+        Update an existing item with one ``UPDATE ... RETURNING``.
+
+        The cached metadata document is dropped only if a field rendered into it changed.
 
         Args:
             db (Session): Database session.
-            db_item (ItemModel): The item model instance to update.
+            item_id (str): Item ID.
             item_update (ItemUpdate): Data for updating the item.
 
         Returns:
-            ItemModel: The updated item model instance.
+            Optional[ItemModel]: The updated item model instance or None if not found.
         """
-        for key, value in item_update.dict(exclude_unset=True).items():
-            setattr(db_item, key, value)
+        return _update_item(db, item_id, item_update.dict(exclude_unset=True))
+
+    @staticmethod
+    def patch_item(db: Session, item_id: str, item_patch: ItemPatch) -> Optional[ItemModel]:
+        """
+        Apply a JSON merge patch to an item with one ``UPDATE ... RETURNING``.
+
+        ``attributes`` is patched in the database with ``-``/``||`` on the stored
+        document, so only the patched keys change and concurrent patches to other
+        keys are kept.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+            item_patch (ItemPatch): The merge patch.
+
+        Returns:
+            Optional[ItemModel]: The patched item model instance or None if not found.
+        """
+        values = item_patch.dict(exclude_unset=True)
+        if "attributes" in values:
+            values["attributes"] = merge_patch_expression(ItemModel.attributes, values["attributes"])
+        return _update_item(db, item_id, values)
+
+    @staticmethod
+    def get_item_image(db: Session, item_id: str) -> Optional[Row]:
+        """
+        Retrieve only the image reference of an item.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+
+        Returns:
+            Optional[Row]: ``(image_sha256, image_size, image_content_type)`` or None if not found.
+        """
+        return db.execute(
+            select(ItemModel.image_sha256, ItemModel.image_size, ItemModel.image_content_type)
+            .where(ItemModel.item_id == item_id)
+        ).first()
+
+    @staticmethod
+    def get_image_hashes(db: Session) -> list[str]:
+        """
+        Retrieve the distinct blob store keys referenced by items.
+
+        Args:
+            db (Session): Database session.
+
+        Returns:
+            list[str]: SHA-256 of every image in use.
+        """
+        return list(db.execute(
+            select(ItemModel.image_sha256).where(ItemModel.image_sha256.is_not(None)).distinct()
+        ).scalars())
+
+    @staticmethod
+    def set_item_image(
+        db: Session, item_id: str, image_sha256: str, image_size: int, image_content_type: str
+    ) -> Optional[ItemModel]:
+        """
+        Point an item at an image in the blob store.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+            image_sha256 (str): Blob store key of the image.
+            image_size (int): Image size in bytes.
+            image_content_type (str): MIME type of the image.
+
+        Returns:
+            Optional[ItemModel]: The updated item model instance or None if not found.
+        """
+        db_item = db.execute(
+            update(ItemModel)
+            .where(ItemModel.item_id == item_id)
+            .values(image_sha256=image_sha256, image_size=image_size, image_content_type=image_content_type)
+            .returning(ItemModel)
+            .execution_options(synchronize_session=False)
+        ).scalars().first()
         db.commit()
-        db.refresh(db_item)
+        if db_item is not None:
+            _invalidate_metadata(db, item_id)
         return db_item
 
     @staticmethod
-    def delete_item(db: Session, db_item: ItemModel) -> None:
+    def transfer_items(db: Session, item_ids: list[str], from_wallet: str, to_wallet: str) -> set[str]:
         """
-        Delete an item.
+        Move items owned by ``from_wallet`` to ``to_wallet`` in one ``UPDATE``.
+
+        Items not owned by ``from_wallet`` are left untouched. Does not commit, so
+        the caller can roll back a partial transfer.
 
         Args:
             db (Session): Database session.
-            db_item (ItemModel): The item model instance to delete.
+            item_ids (list[str]): IDs of the items to move.
+            from_wallet (str): Current owner.
+            to_wallet (str): New owner.
+
+        Returns:
+            set[str]: IDs of the items that were moved.
+        """
+        return set(db.execute(
+            update(ItemModel)
+            .where(ItemModel.item_id.in_(item_ids), ItemModel.owner_wallet == from_wallet)
+            .values(owner_wallet=to_wallet)
+            .returning(ItemModel.item_id)
+            .execution_options(synchronize_session=False)
+        ).scalars())
+
+    @staticmethod
+    def get_item_owners(db: Session, item_ids: list[str]) -> dict[str, Optional[str]]:
+        """
+        Retrieve the owner of each of the given items.
+
+        Args:
+            db (Session): Database session.
+            item_ids (list[str]): Item IDs.
+
+        Returns:
+            dict[str, Optional[str]]: Owner wallet by item ID, for the items that exist.
+        """
+        return dict(db.execute(
+            select(ItemModel.item_id, ItemModel.owner_wallet).where(ItemModel.item_id.in_(item_ids))
+        ).tuples())
+
+    @staticmethod
+    def delete_item(db: Session, item_id: str) -> bool:
+        """
+        Delete an item with one ``DELETE ... RETURNING``.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+
+        Returns:
+            bool: True if the item existed and was deleted.
         """
-        db.delete(db_item)
+        deleted = db.execute(
+            delete(ItemModel).where(ItemModel.item_id == item_id).returning(ItemModel.item_id)
+        ).first()
         db.commit()
+        if deleted is None:
+            return False
+        _invalidate_metadata(db, item_id)
+        return True
@@ -0,0 +1,77 @@
+from typing import Optional
+
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.item import Item as ItemModel
+from app.models.quest import Quest as QuestModel
+from app.models.user import User as UserModel
+
+
+class ProfileRepository:
+    """
+    Repository class for player profiles.
+    Reads a user with everything a profile page shows in a fixed number of queries.
+    """
+
+    @staticmethod
+    def get_user_with_avatar(db: Session, wallet_address: str) -> Optional[tuple[UserModel, int]]:
+        """
+        Retrieve a user joined to their avatar, with their item count, in one query.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user.
+
+        Returns:
+            Optional[tuple[UserModel, int]]: The user (``avatar`` loaded) and the number of items they own,
+            or None if not found.
+        """
+        item_count = (
+            select(func.count())
+            .where(ItemModel.owner_wallet == UserModel.wallet_address)
+            .scalar_subquery()
+        )
+        row = db.execute(
+            select(UserModel, item_count)
+            .options(joinedload(UserModel.avatar))
+            .where(UserModel.wallet_address == wallet_address)
+        ).first()
+        return None if row is None else (row[0], row[1])
+
+    @staticmethod
+    def get_recent_quests(db: Session, wallet_address: str, limit: int) -> list[QuestModel]:
+        """
+        Retrieve the newest quests a wallet created and the newest it takes part in, in one query.
+
+        Each side is a ``LIMIT`` walk down its ``(wallet, created_at, quest_id)`` index; the
+        ``UNION ALL`` of the two ID lists is then joined back to quests.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user.
+            limit (int): Maximum number of quests per side.
+
+        Returns:
+            list[QuestModel]: Up to ``2 * limit`` quests, newest first.
+        """
+        if limit <= 0:
+            return []
+        created = (
+            select(QuestModel.quest_id)
+            .where(QuestModel.creator_wallet == wallet_address)
+            .order_by(QuestModel.created_at.desc(), QuestModel.quest_id.desc())
+            .limit(limit)
+        )
+        participating = (
+            select(QuestModel.quest_id)
+            .where(QuestModel.participant_wallet == wallet_address)
+            .order_by(QuestModel.created_at.desc(), QuestModel.quest_id.desc())
+            .limit(limit)
+        )
+        quest_ids = union_all(created, participating).subquery("recent")
+        return db.scalars(
+            select(QuestModel)
+            .where(QuestModel.quest_id.in_(select(quest_ids.c.quest_id)))
+            .order_by(QuestModel.created_at.desc(), QuestModel.quest_id.desc())
+        ).all()
@@ -1,12 +1,70 @@
 import operator
+from datetime import datetime
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import ARRAY, Float, any_, bindparam, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 
+from app.core.geo import EARTH_RADIUS_M, covering_geohashes, encode_geohash
 from app.models.quest import Quest as QuestModel
+from app.models.quest import QuestStatus
 from app.schemas.quest import QuestCreate, QuestUpdate
 
 
+_timestamp_adapter = TypeAdapter(datetime)
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """
+    Parse a ``time_window`` bound, returning None if it is missing or malformed.
+    """
+    if value is None:
+        return None
+    try:
+        return _timestamp_adapter.validate_python(value)
+    except ValidationError:
+        return None
+
+
+def _derived_columns(quest_data: dict) -> dict:
+    """
+    Compute the columns derived from a quest's user-supplied fields.
+
+    Only the columns whose sources are present are returned, so the result can be
+    applied to a partial update.
+
+    Args:
+        quest_data (dict): Quest fields, e.g. ``latitude`` and ``longitude`` or ``time_window``.
+
+    Returns:
+        dict: Column values to store alongside the quest.
+    """
+    derived = {}
+    if "latitude" in quest_data and "longitude" in quest_data:
+        derived["geohash"] = encode_geohash(quest_data["latitude"], quest_data["longitude"])
+    if "time_window" in quest_data:
+        time_window = quest_data["time_window"] or {}
+        derived["starts_at"] = _parse_timestamp(time_window.get("start_time"))
+        derived["ends_at"] = _parse_timestamp(time_window.get("end_time"))
+    return derived
+
+
+def _distance_m(latitude: float, longitude: float):
+    """
+    SQL expression for the haversine distance in metres from a quest to a point.
+    """
+    d_lat = func.radians(QuestModel.latitude - latitude, type_=Float) / 2
+    d_lon = func.radians(QuestModel.longitude - longitude, type_=Float) / 2
+    a = (
+        func.power(func.sin(d_lat), 2)
+        + func.cos(func.radians(latitude)) * func.cos(func.radians(QuestModel.latitude)) * func.power(func.sin(d_lon), 2)
+    )
+    return 2 * EARTH_RADIUS_M * func.asin(func.least(1.0, func.sqrt(a)))
+
+
 class QuestRepository:
     """
     Repository class for Quest model.
@@ -28,22 +86,208 @@ class QuestRepository:
         return db.query(QuestModel).filter(QuestModel.quest_id == quest_id).first()
 
     @staticmethod
-    def get_quests(db: Session) -> list[QuestModel]:
+    def get_quests_by_ids(db: Session, quest_ids: list[UUID]) -> list[QuestModel]:
+        """
+        Retrieve the quests with the given IDs in one ``= ANY(:ids)`` query.
+
+        Args:
+            db (Session): Database session.
+            quest_ids (list[UUID]): Quest IDs.
+
+        Returns:
+            list[QuestModel]: The quests that exist, in no particular order.
+        """
+        return db.query(QuestModel).filter(
+            QuestModel.quest_id == any_(bindparam("quest_ids", quest_ids, type_=ARRAY(PG_UUID(as_uuid=True))))
+        ).all()
+
+    @staticmethod
+    def get_quests(
+        db: Session,
+        limit: int,
+        after: Optional[tuple[datetime, UUID]] = None,
+        status: Optional[QuestStatus] = None,
+        creator_wallet: Optional[str] = None,
+        participant_wallet: Optional[str] = None,
+    ) -> list[QuestModel]:
+        """
+        Retrieve a page of quests, newest first.
+
+        Pages are addressed by the ``(created_at, quest_id)`` of the last row seen,
+        so each page is a bounded index range scan regardless of depth.
+
+        Args:
+            db (Session): Database session.
+            limit (int): Maximum number of quests to return.
+            after (Optional[tuple[datetime, UUID]]): Keyset position of the previous page's last quest.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            creator_wallet (Optional[str]): Only return quests created by this wallet.
+            participant_wallet (Optional[str]): Only return quests accepted by this wallet.
+
+        Returns:
+            list[QuestModel]: Up to ``limit`` quest model instances.
+        """
+        query = db.query(QuestModel)
+        if status is not None:
+            query = query.filter(QuestModel.status == status)
+        if creator_wallet is not None:
+            query = query.filter(QuestModel.creator_wallet == creator_wallet)
+        if participant_wallet is not None:
+            query = query.filter(QuestModel.participant_wallet == participant_wallet)
+        if after is not None:
+            query = query.filter(tuple_(QuestModel.created_at, QuestModel.quest_id) < tuple_(*after))
+        return (
+            query.order_by(QuestModel.created_at.desc(), QuestModel.quest_id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def get_nearby_quests(
+        db: Session,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        status: Optional[QuestStatus] = None,
+        limit: int = 100,
+    ) -> list[QuestModel]:
+        """
+        Retrieve quests within a radius of a point, nearest first.
+
+        The geohash index narrows the scan to the cells around the point, then
+        the exact haversine distance filters and orders the candidates.
+
+        Args:
+            db (Session): Database session.
+            latitude (float): Latitude of the centre.
+            longitude (float): Longitude of the centre.
+            radius_m (float): Search radius in metres.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Quests within the radius ordered by distance.
+        """
+        distance = _distance_m(latitude, longitude)
+        cells = sorted(covering_geohashes(latitude, longitude, radius_m))
+        query = db.query(QuestModel).filter(
+            or_(*(QuestModel.geohash.like(f"{cell}%") for cell in cells)),
+            distance <= radius_m,
+        )
+        if status is not None:
+            query = query.filter(QuestModel.status == status)
+        return query.order_by(distance).limit(limit).all()
+
+    @staticmethod
+    def search_quests(
+        db: Session,
+        q: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        distance_scale_m: float = 5000.0,
+        limit: int = 20,
+    ) -> list[QuestModel]:
+        """
+        Search quest titles and descriptions, best match first.
+
+        Candidates come from the full-text GIN index, or the title trigram index for
+        near-miss spellings. Text relevance is the sum of ``ts_rank_cd`` and title
+        similarity; when a location is given it is divided by ``1 + distance / scale``
+        so nearby matches outrank equally relevant distant ones.
+
+        Args:
+            db (Session): Database session.
+            q (str): Search text, in web search syntax.
+            latitude (Optional[float]): Latitude of the searcher.
+            longitude (Optional[float]): Longitude of the searcher.
+            distance_scale_m (float): Distance in metres at which relevance is halved.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Matching quests ordered by combined score.
+        """
+        tsquery = func.websearch_to_tsquery("english", q)
+        score = func.ts_rank_cd(QuestModel.search_vector, tsquery) + func.similarity(QuestModel.title, q)
+        if latitude is not None and longitude is not None:
+            score = score / (1 + _distance_m(latitude, longitude) / distance_scale_m)
+        return (
+            db.query(QuestModel)
+            .filter(or_(QuestModel.search_vector.bool_op("@@")(tsquery), QuestModel.title.bool_op("%")(q)))
+            .order_by(score.desc())
+            .limit(limit)
+            .all()
+        )
+
+    @staticmethod
+    def get_quest_positions(db: Session, statuses: set[QuestStatus]) -> list[tuple[str, float, float]]:
+        """
+        Retrieve only the ID and coordinates of quests with the given statuses.
+
+        Args:
+            db (Session): Database session.
+            statuses (set[QuestStatus]): Statuses to include.
+
+        Returns:
+            list[tuple[str, float, float]]: ``(quest_id, latitude, longitude)`` rows.
+        """
+        rows = db.execute(
+            select(QuestModel.quest_id, QuestModel.latitude, QuestModel.longitude)
+            .where(QuestModel.status.in_(statuses))
+            .execution_options(yield_per=10_000)
+        )
+        return [(str(quest_id), latitude, longitude) for quest_id, latitude, longitude in rows]
+
+    @staticmethod
+    def get_active_quests(
+        db: Session, at: datetime, status: Optional[QuestStatus] = None, limit: int = 100
+    ) -> list[QuestModel]:
         """
-        Retrieve all quests.
+        Retrieve quests whose time window contains a moment, ending soonest first.
 
         Args:
             db (Session): Database session.
+            at (datetime): The moment to check.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            limit (int): Maximum number of quests to return.
 
         Returns:
-            list[QuestModel]: List of all quest model instances.
+            list[QuestModel]: Quests active at ``at``.
+        """
+        query = db.query(QuestModel).filter(QuestModel.ends_at > at, QuestModel.starts_at <= at)
+        if status is not None:
+            query = query.filter(QuestModel.status == status)
+        return query.order_by(QuestModel.ends_at).limit(limit).all()
+
+    @staticmethod
+    def get_upcoming_quests(
+        db: Session,
+        start: datetime,
+        end: datetime,
+        status: Optional[QuestStatus] = None,
+        limit: int = 100,
+    ) -> list[QuestModel]:
         """
-        return db.query(QuestModel).all()
-    
+        Retrieve quests starting within a period, starting soonest first.
+
+        Args:
+            db (Session): Database session.
+            start (datetime): Beginning of the period (exclusive).
+            end (datetime): End of the period (inclusive).
+            status (Optional[QuestStatus]): Only return quests with this status.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Quests whose start time falls in the period.
+        """
+        query = db.query(QuestModel).filter(QuestModel.starts_at > start, QuestModel.starts_at <= end)
+        if status is not None:
+            query = query.filter(QuestModel.status == status)
+        return query.order_by(QuestModel.starts_at).limit(limit).all()
+
     @staticmethod
     def create_quest(db: Session, quest_create: QuestCreate) -> QuestModel:
         """
-        Create a new quest.
+        Create a new quest with one ``INSERT ... RETURNING``.
 
         Args:
             db (Session): Database session.
@@ -51,42 +295,193 @@ class QuestRepository:
 
         Returns:
             QuestModel: The newly created quest model instance.
-        """
 
+        Raises:
+            ValueError: If the creator wallet does not exist.
+        """
         quest_data = quest_create.dict()
-        db_quest = QuestModel(**quest_data)
-        db.add(db_quest)
-        db.commit()
-        db.refresh(db_quest)
+        quest_data.update(_derived_columns(quest_data))
+        try:
+            db_quest = db.scalars(insert(QuestModel).values(**quest_data).returning(QuestModel)).one()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ValueError("Creator wallet not found") from e
         return db_quest
 
     @staticmethod
-    def update_quest(db: Session, db_quest: QuestModel, quest_update: QuestUpdate) -> QuestModel:
+    def create_quests(db: Session, quests_data: list[dict]) -> list[QuestModel]:
         """
-        Update an existing quest.
+        Create many quests in one transaction with multi-row INSERT ... RETURNING.
 
         Args:
             db (Session): Database session.
-            db_quest (QuestModel): The quest model instance to update.
-            quest_update (QuestUpdate): Data for updating the quest.
+            quests_data (list[dict]): Column values for each quest, including ``quest_id``.
 
         Returns:
-            QuestModel: The updated quest model instance.
+            list[QuestModel]: The created quests, in the order given.
         """
-        for key, value in quest_update.dict(exclude_unset=True).items():
-            setattr(db_quest, key, value)
+        if not quests_data:
+            return []
+        rows = [{**quest_data, **_derived_columns(quest_data)} for quest_data in quests_data]
+        db_quests = db.scalars(
+            insert(QuestModel).returning(QuestModel, sort_by_parameter_order=True),
+            rows,
+        ).all()
         db.commit()
-        db.refresh(db_quest)
+        return db_quests
+
+    @staticmethod
+    def update_quest(
+        db: Session, quest_id: UUID, quest_update: QuestUpdate
+    ) -> Optional[tuple[QuestModel, QuestStatus, float, float]]:
+        """
+        Update an existing quest with one ``UPDATE ... RETURNING``.
+
+        ``location`` is stored as the ``latitude``/``longitude`` columns, and the
+        derived columns are recomputed from whichever fields changed. The
+        statement joins a locked snapshot of the old row to return the previous
+        status and coordinates alongside the updated quest.
+
+        Args:
+            db (Session): Database session.
+            quest_id (UUID): Quest ID.
+            quest_update (QuestUpdate): Data for updating the quest.
+
+        Returns:
+            Optional[tuple[QuestModel, QuestStatus, float, float]]: The updated quest and its
+            previous status, latitude and longitude, or None if not found.
+
+        Raises:
+            ValueError: If the participant wallet does not exist.
+        """
+        # JSON mode so ``time_window`` bounds are stored as ISO strings, like on create.
+        values = quest_update.model_dump(mode="json", exclude_unset=True)
+        location = values.pop("location", None)
+        if location is not None:
+            values["latitude"] = location["latitude"]
+            values["longitude"] = location["longitude"]
+        values.update(_derived_columns(values))
+        if not values:
+            db_quest = QuestRepository.get_quest(db, quest_id)
+            return (db_quest, db_quest.status, db_quest.latitude, db_quest.longitude) if db_quest is not None else None
+
+        old = (
+            select(QuestModel.quest_id, QuestModel.status, QuestModel.latitude, QuestModel.longitude)
+            .where(QuestModel.quest_id == quest_id)
+            .with_for_update()
+            .subquery("old")
+        )
+        try:
+            row = db.execute(
+                update(QuestModel)
+                .where(QuestModel.quest_id == old.c.quest_id)
+                .values(**values)
+                .returning(QuestModel, old.c.status, old.c.latitude, old.c.longitude)
+                .execution_options(synchronize_session=False)
+            ).first()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ValueError("Participant wallet not found") from e
+        return tuple(row) if row is not None else None
+
+    @staticmethod
+    def transition_quest(
+        db: Session,
+        quest_id: UUID,
+        from_statuses: set[QuestStatus],
+        to_status: QuestStatus,
+        participant_wallet: Optional[str] = None,
+        assign_participant: bool = False,
+    ) -> Optional[QuestModel]:
+        """
+        Move a quest to a new status with a single conditional UPDATE.
+
+        The status check and the write happen in one statement, so concurrent
+        transitions on the same quest cannot both succeed.
+
+        Args:
+            db (Session): Database session.
+            quest_id (UUID): Quest ID.
+            from_statuses (set[QuestStatus]): Statuses the quest must currently be in.
+            to_status (QuestStatus): Status to move the quest to.
+            participant_wallet (Optional[str]): Wallet to assign, or that must already hold the quest.
+            assign_participant (bool): Assign ``participant_wallet`` instead of requiring it.
+
+        Returns:
+            Optional[QuestModel]: The updated quest, or None if the quest does not exist or the
+            conditions did not hold.
+
+        Raises:
+            ValueError: If the assigned participant wallet does not exist.
+        """
+        stmt = update(QuestModel).where(
+            QuestModel.quest_id == quest_id, QuestModel.status.in_(from_statuses)
+        )
+        values = {"status": to_status}
+        if assign_participant:
+            values["participant_wallet"] = participant_wallet
+        elif participant_wallet is not None:
+            stmt = stmt.where(QuestModel.participant_wallet == participant_wallet)
+        stmt = stmt.values(**values).returning(QuestModel).execution_options(synchronize_session=False)
+        try:
+            db_quest = db.execute(stmt).scalars().first()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ValueError("Participant wallet not found") from e
         return db_quest
 
     @staticmethod
-    def delete_quest(db: Session, db_quest: QuestModel) -> None:
+    def expire_quests(db: Session, now: datetime, batch_size: int) -> list[QuestModel]:
         """
-        Delete a quest.
+        Cancel one batch of open quests whose time window has ended.
+
+        Rows are claimed with ``FOR UPDATE SKIP LOCKED`` and the batch commits
+        immediately, so the sweep never holds locks on more than ``batch_size``
+        rows and never waits on rows other transactions are using.
 
         Args:
             db (Session): Database session.
-            db_quest (QuestModel): The quest model instance to delete.
+            now (datetime): Quests ending before this moment are expired.
+            batch_size (int): Maximum number of quests to cancel.
+
+        Returns:
+            list[QuestModel]: The cancelled quests.
         """
-        db.delete(db_quest)
+        expirable = [QuestStatus.available, QuestStatus.accepted]
+        batch = (
+            select(QuestModel.quest_id)
+            .where(QuestModel.status.in_(expirable), QuestModel.ends_at < now)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(QuestModel)
+            .where(QuestModel.quest_id.in_(batch.scalar_subquery()), QuestModel.status.in_(expirable))
+            .values(status=QuestStatus.cancelled)
+            .returning(QuestModel)
+            .execution_options(synchronize_session=False)
+        )
+        expired = db.execute(stmt).scalars().all()
         db.commit()
+        return expired
+
+    @staticmethod
+    def delete_quest(db: Session, quest_id: UUID) -> Optional[QuestModel]:
+        """
+        Delete a quest with one ``DELETE ... RETURNING``.
+
+        Args:
+            db (Session): Database session.
+            quest_id (UUID): Quest ID.
+
+        Returns:
+            Optional[QuestModel]: The deleted quest, or None if not found.
+        """
+        db_quest = db.scalars(
+            delete(QuestModel).where(QuestModel.quest_id == quest_id).returning(QuestModel)
+        ).first()
+        db.commit()
+        return db_quest
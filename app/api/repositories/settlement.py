@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+from sqlalchemy import Integer, String, any_, column, func, select, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased
+
+from app.core.progression import level_expression
+from app.models.item import Item as ItemModel
+from app.models.quest import Quest as QuestModel
+from app.models.quest import QuestStatus
+from app.models.user import User as UserModel
+
+
+def _reward_experience(rewards: dict) -> int:
+    try:
+        return max(int(rewards.get("experience_points") or 0), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+class SettlementRepository:
+    """
+    Repository class for quest reward settlement.
+    Pays out completed quests with set-based statements across quests, users and items.
+    """
+
+    @staticmethod
+    def settle_completed_quests(db: Session, batch_size: int) -> tuple[int, list[Row]]:
+        """
+        Settle one batch of completed, unsettled quests in a single transaction.
+
+        The batch is claimed with ``FOR UPDATE SKIP LOCKED`` so concurrent workers
+        settle disjoint batches. The rewarded users are locked in wallet order, then
+        experience is applied with one ``UPDATE ... FROM (VALUES ...)``, reward
+        items are minted with one ``INSERT ... SELECT`` that copies the reward's
+        template item (sharing its stored image by hash), and the quests are
+        stamped settled.
+
+        Minted item IDs are ``<template_id>:<quest_id>:<n>``, so replaying a batch
+        never grants an item twice.
+
+        Args:
+            db (Session): Database session.
+            batch_size (int): Maximum number of quests to settle.
+
+        Returns:
+            tuple[int, list[Row]]: Number of quests settled, and the wallet address,
+            username and new experience total of every user who gained experience.
+        """
+        quests = db.execute(
+            select(QuestModel.quest_id, QuestModel.participant_wallet, QuestModel.rewards)
+            .where(QuestModel.status == QuestStatus.completed, QuestModel.settled_at.is_(None))
+            .order_by(QuestModel.updated_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not quests:
+            db.rollback()
+            return 0, []
+
+        experience = defaultdict(int)
+        grants = []
+        for quest in quests:
+            if quest.participant_wallet is None or not isinstance(quest.rewards, dict):
+                continue
+            experience[quest.participant_wallet] += _reward_experience(quest.rewards)
+            for n, template_id in enumerate(quest.rewards.get("items") or []):
+                grants.append((f"{template_id}:{quest.quest_id}:{n}", str(template_id), quest.participant_wallet))
+
+        awards = {wallet: xp for wallet, xp in experience.items() if xp > 0}
+        users = []
+        if awards:
+            # Lock the rows in wallet order first so workers settling overlapping users
+            # queue behind each other instead of deadlocking inside the UPDATE.
+            db.execute(
+                select(UserModel.wallet_address)
+                .where(UserModel.wallet_address == any_(sorted(awards)))
+                .order_by(UserModel.wallet_address)
+                .with_for_update()
+            )
+            award_values = values(
+                column("wallet_address", String), column("experience_points", Integer), name="awards"
+            ).data(list(awards.items()))
+            new_total = func.coalesce(UserModel.experience_points, 0) + award_values.c.experience_points
+            users = db.execute(
+                update(UserModel)
+                .where(UserModel.wallet_address == award_values.c.wallet_address)
+                .values(experience_points=new_total, level=level_expression(new_total))
+                .returning(UserModel.wallet_address, UserModel.username, UserModel.experience_points)
+            ).all()
+
+        if grants:
+            grant_values = values(
+                column("item_id", String), column("template_id", String), column("owner_wallet", String),
+                name="grants",
+            ).data(grants)
+            template = aliased(ItemModel)
+            db.execute(
+                insert(ItemModel)
+                .from_select(
+                    ["item_id", "owner_wallet", "name", "description", "attributes", "image_url", "image_sha256", "image_size"],
+                    select(
+                        grant_values.c.item_id,
+                        grant_values.c.owner_wallet,
+                        func.coalesce(template.name, grant_values.c.template_id),
+                        template.description,
+                        template.attributes,
+                        template.image_url,
+                        template.image_sha256,
+                        template.image_size,
+                    ).select_from(
+                        grant_values.outerjoin(template, template.item_id == grant_values.c.template_id)
+                    ),
+                )
+                .on_conflict_do_nothing(index_elements=["item_id"])
+            )
+
+        db.execute(
+            update(QuestModel)
+            .where(QuestModel.quest_id.in_([quest.quest_id for quest in quests]))
+            .values(settled_at=func.now())
+        )
+        db.commit()
+        return len(quests), users
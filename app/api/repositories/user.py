@@ -1,7 +1,12 @@
 import operator
+import re
+from sqlalchemy import ARRAY, String, any_, bindparam, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.errors import ConflictError
 from app.models.user import User as UserModel
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -31,33 +36,134 @@ class UserRepository:
         return db.query(UserModel).all()
 
     @staticmethod
-    def create_user(db: Session, user_create: UserCreate) -> UserModel:
+    def get_leaderboard(db: Session, offset: int, limit: int) -> list[UserModel]:
         """
-        Create a new user.
+        Retrieve users by experience, highest first, walking ``ix_users_experience_points_wallet_address``.
         """
-        db_user = UserModel(**user_create.dict())
-        db.add(db_user)
+        return db.scalars(
+            select(UserModel)
+            .order_by(UserModel.experience_points.desc().nulls_last(), UserModel.wallet_address)
+            .offset(offset)
+            .limit(limit)
+        ).all()
+
+    @staticmethod
+    def search_users(db: Session, prefix: str, limit: int) -> list[UserModel]:
+        """
+        Retrieve users whose username starts with ``prefix``, ignoring case, via ``ix_users_username_lower``.
+
+        Most experienced first, then by username, the same order as the hot-user trie.
+        """
+        pattern = re.sub(r"([\\%_])", r"\\\1", prefix.lower()) + "%"
+        username = func.lower(UserModel.username)
+        return db.scalars(
+            select(UserModel)
+            .where(username.like(pattern))
+            .order_by(func.coalesce(UserModel.experience_points, 0).desc(), username)
+            .limit(limit)
+        ).all()
+
+    @staticmethod
+    def get_hot_users(db: Session, limit: int) -> list[tuple[str, str, int]]:
+        """
+        Retrieve ``(wallet_address, username, experience_points)`` of the most experienced named users.
+        """
+        return db.execute(
+            select(UserModel.wallet_address, UserModel.username, func.coalesce(UserModel.experience_points, 0))
+            .where(UserModel.username.is_not(None))
+            .order_by(UserModel.experience_points.desc().nulls_last(), UserModel.wallet_address)
+            .limit(limit)
+        ).tuples().all()
+
+    @staticmethod
+    def get_experience(db: Session) -> list[tuple[str, int]]:
+        """
+        Retrieve every user's ``(wallet_address, experience_points)`` to seed the rank index.
+        """
+        return db.execute(
+            select(UserModel.wallet_address, func.coalesce(UserModel.experience_points, 0))
+        ).tuples().all()
+
+    @staticmethod
+    def get_users_by_wallets(db: Session, wallet_addresses: list[str]) -> list[UserModel]:
+        """
+        Retrieve the users with the given wallet addresses in one ``= ANY(:wallets)`` query.
+        """
+        return db.query(UserModel).filter(
+            UserModel.wallet_address == any_(bindparam("wallet_addresses", wallet_addresses, type_=ARRAY(String)))
+        ).all()
+
+    @staticmethod
+    def get_existing_wallets(db: Session, wallet_addresses: set[str]) -> set[str]:
+        """
+        Return which of the given wallet addresses belong to a user.
+        """
+        if not wallet_addresses:
+            return set()
+        return set(
+            db.scalars(
+                select(UserModel.wallet_address).where(
+                    UserModel.wallet_address.in_(wallet_addresses)
+                )
+            )
+        )
+
+    @staticmethod
+    def create_user(db: Session, user_create: UserCreate) -> Optional[UserModel]:
+        """
+        Create a new user with one ``INSERT ... ON CONFLICT DO NOTHING RETURNING``.
+
+        Returns None if the wallet address or email is already taken.
+        """
+        db_user = db.execute(
+            insert(UserModel).values(**user_create.dict()).on_conflict_do_nothing().returning(UserModel)
+        ).scalars().first()
         db.commit()
-        db.refresh(db_user)
         return db_user
 
     @staticmethod
     def update_user(
-        db: Session, db_user: UserModel, user_update: UserUpdate
-    ) -> UserModel:
+        db: Session, wallet_address: str, user_update: UserUpdate
+    ) -> Optional[UserModel]:
         """
-        Update an existing user.
+        Update an existing user with one ``UPDATE ... RETURNING``.
+
+        Returns None if the user does not exist. Raises ``ConflictError`` if the
+        new email belongs to another user.
         """
-        for key, value in user_update.dict(exclude_unset=True).items():
-            setattr(db_user, key, value)
-        db.commit()
-        db.refresh(db_user)
+        values = user_update.dict(exclude_unset=True)
+        if not values:
+            return UserRepository.get_user(db, wallet_address)
+        try:
+            db_user = db.execute(
+                update(UserModel)
+                .where(UserModel.wallet_address == wallet_address)
+                .values(**values)
+                .returning(UserModel)
+                .execution_options(synchronize_session=False)
+            ).scalars().first()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ConflictError("Email is already in use") from e
         return db_user
 
     @staticmethod
-    def delete_user(db: Session, db_user: UserModel) -> None:
+    def delete_user(db: Session, wallet_address: str) -> bool:
         """
-        Delete a user.
+        Delete a user with one ``DELETE ... RETURNING``.
+
+        Returns False if the user does not exist. Raises ``ConflictError`` if items,
+        quests or an avatar still reference the user.
         """
-        db.delete(db_user)
-        db.commit()
+        try:
+            deleted = db.execute(
+                delete(UserModel)
+                .where(UserModel.wallet_address == wallet_address)
+                .returning(UserModel.wallet_address)
+            ).first()
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise ConflictError("User still has items, quests or an avatar") from e
+        return deleted is not None
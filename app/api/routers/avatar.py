@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.services.avatar import AvatarService
+from app.api.services.avatar import AvatarService, EquippedItemsNotOwnedError
 from app.core.database import get_db
-from app.schemas.avatar import AvatarCreate, AvatarRead, AvatarUpdate
+from app.core.errors import ConflictError
+from app.schemas.avatar import AvatarCreate, AvatarPatch, AvatarRead, AvatarUpdate, AvatarWithItems
 
 router = APIRouter(prefix="/avatars", tags=["avatars"])
 
@@ -19,24 +22,38 @@ def create_avatar(avatar_create: AvatarCreate, db: Session = Depends(get_db)):
     Returns:
     - **AvatarRead**: The created avatar data.
     """
-    avatar = AvatarService.create_avatar(db, avatar_create)
+    try:
+        avatar = AvatarService.create_avatar(db, avatar_create)
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except EquippedItemsNotOwnedError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "item_ids": e.item_ids})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return avatar
 
 
-@router.get("/{wallet_address}", response_model=AvatarRead)
-def read_avatar(wallet_address: str, db: Session = Depends(get_db)):
+@router.get("/{wallet_address}", response_model=AvatarWithItems, response_model_exclude_unset=True)
+def read_avatar(
+    wallet_address: str,
+    expand: Optional[Literal["items"]] = Query(None),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve an avatar by wallet address.
 
     Parameters:
     - **wallet_address**: Ethereum wallet address of the user.
+    - **expand**: `items` to include the equipped item records, fetched in one query.
 
     Returns:
-    - **AvatarRead**: The avatar data.
+    - **AvatarWithItems**: The avatar data, with `equipped` when expanded.
     """
     avatar = AvatarService.get_avatar(db, wallet_address)
     if avatar is None:
         raise HTTPException(status_code=404, detail="Avatar not found")
+    if expand == "items":
+        return AvatarService.expand_avatar(db, avatar)
     return avatar
 
 
@@ -52,7 +69,37 @@ def update_avatar(wallet_address: str, avatar_update: AvatarUpdate, db: Session
     Returns:
     - **AvatarRead**: The updated avatar data.
     """
-    avatar = AvatarService.update_avatar(db, wallet_address, avatar_update)
+    try:
+        avatar = AvatarService.update_avatar(db, wallet_address, avatar_update)
+    except EquippedItemsNotOwnedError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "item_ids": e.item_ids})
+    if avatar is None:
+        raise HTTPException(status_code=404, detail="Avatar not found")
+    return avatar
+
+
+@router.patch("/{wallet_address}", response_model=AvatarRead)
+def patch_avatar(wallet_address: str, avatar_patch: AvatarPatch, db: Session = Depends(get_db)):
+    """
+    Apply an RFC 7396 JSON merge patch (`application/merge-patch+json`) to an avatar.
+
+    Only the keys in the patch change: members of `cosmetic_details` and
+    `preferences` set to null are removed and nested objects are merged, in the
+    database, so concurrent patches to different keys don't overwrite each other.
+
+    Parameters:
+    - **wallet_address**: Ethereum wallet address of the user.
+    - **avatar_patch**: AvatarPatch merge patch.
+
+    Returns:
+    - **AvatarRead**: The patched avatar data.
+    """
+    try:
+        avatar = AvatarService.patch_avatar(db, wallet_address, avatar_patch)
+    except EquippedItemsNotOwnedError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "item_ids": e.item_ids})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if avatar is None:
         raise HTTPException(status_code=404, detail="Avatar not found")
     return avatar
@@ -1,9 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from PIL.Image import DecompressionBombError
 from sqlalchemy.orm import Session
 
-from app.api.services.item import ItemService
+from app.api.services.item import ItemService, ItemTransferError
+from app.core.blobstore import blob_store
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.item import ItemCreate, ItemRead, ItemUpdate
+from app.core.derivatives import DERIVATIVE_SPECS, derivative_cache
+from app.core.errors import ConflictError
+from app.core.filters import parse_attribute_filters
+from app.schemas.common import BatchGetRequest, BatchGetResponse
+from app.schemas.item import (
+    ItemCreate, ItemPage, ItemPatch, ItemRead, ItemTransferConflict, ItemTransferConflictDetail, ItemTransferRequest,
+    ItemTransferResponse, ItemUpdate,
+)
 
 router = APIRouter(prefix="/items", tags=["items"])
 
@@ -19,10 +34,92 @@ def create_item(item_create: ItemCreate, db: Session = Depends(get_db)):
     Returns:
     - **ItemRead**: The created item data.
     """
-    item = ItemService.create_item(db, item_create)
+    try:
+        item = ItemService.create_item(db, item_create)
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return item
 
 
+@router.get("/", response_model=ItemPage)
+def read_items(
+    request: Request,
+    owner: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    Query items by owner and attributes, newest first, one page at a time.
+
+    Attribute filters are query parameters of the form `attr.<key>[<op>]=<value>`,
+    with `op` one of `eq` (the default when omitted), `ne`, `gt`, `gte`, `lt` or
+    `lte`, e.g. `?owner=0xabc&attr.damage[gt]=100&attr.type=sword`. Range
+    operators need a number and only match numeric attributes.
+
+    Parameters:
+    - **owner**: Only return items owned by this wallet.
+    - **cursor**: The `next_cursor` returned with the previous page.
+    - **limit**: Maximum number of items per page.
+
+    Returns:
+    - **ItemPage**: A page of items and the cursor for the next one.
+    """
+    try:
+        attribute_filters = parse_attribute_filters(request.query_params.multi_items())
+        items, next_cursor = ItemService.get_items(db, limit, cursor, owner, attribute_filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.post("/batch-get", response_model=BatchGetResponse[ItemRead])
+def batch_get_items(batch: BatchGetRequest, db: Session = Depends(get_db)):
+    """
+    Retrieve many items by ID in one request.
+
+    Parameters:
+    - **batch**: BatchGetRequest with the item IDs.
+
+    Returns:
+    - **BatchGetResponse[ItemRead]**: Items in request order, null where not found, plus the missing IDs.
+    """
+    items = ItemService.get_items_by_ids(db, batch.ids)
+    missing = [item_id for item_id, item in zip(batch.ids, items) if item is None]
+    return {"results": items, "missing": list(dict.fromkeys(missing))}
+
+
+@router.post(
+    "/transfer",
+    response_model=ItemTransferResponse,
+    responses={409: {"model": ItemTransferConflict, "description": "Some items are missing or not owned by the sender"}},
+)
+def transfer_items(transfer: ItemTransferRequest, db: Session = Depends(get_db)):
+    """
+    Move a set of items from one wallet to another in one transaction.
+
+    Either every item moves or none does. If any item is missing or not owned by
+    `from_wallet`, responds `409` with the failing items in `detail.failures`.
+
+    Parameters:
+    - **transfer**: ItemTransferRequest with the wallets and item IDs.
+
+    Returns:
+    - **ItemTransferResponse**: The moved item IDs.
+    """
+    try:
+        transferred = ItemService.transfer_items(db, transfer.item_ids, transfer.from_wallet, transfer.to_wallet)
+    except ItemTransferError as e:
+        raise HTTPException(
+            status_code=409, detail=ItemTransferConflictDetail(message=str(e), failures=e.failures).dict()
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"to_wallet": transfer.to_wallet, "transferred": transferred}
+
+
 @router.get("/{item_id}", response_model=ItemRead)
 def read_item(item_id: str, db: Session = Depends(get_db)):
     """
@@ -40,6 +137,121 @@ def read_item(item_id: str, db: Session = Depends(get_db)):
     return item
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+@router.put("/{item_id}/image", response_model=ItemRead)
+async def upload_item_image(item_id: str, request: Request, db: Session = Depends(get_db)):
+    """
+    Upload an item's image as the raw request body.
+
+    The body is streamed to the blob store in chunks and never held in memory whole.
+
+    Parameters:
+    - **item_id**: ID of the item.
+    - **Content-Type** header: one of the allowed image types.
+
+    Returns:
+    - **ItemRead**: The item data with the new image hash.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type not in settings.ITEM_IMAGE_CONTENT_TYPES:
+        raise HTTPException(status_code=415, detail=f"Content-Type must be one of {settings.ITEM_IMAGE_CONTENT_TYPES}")
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > settings.ITEM_IMAGE_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Image too large")
+    # Blobs are never deleted, so don't store one for an item that doesn't exist.
+    if await run_in_threadpool(ItemService.get_item, db, item_id) is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    writer = await run_in_threadpool(blob_store.writer, settings.ITEM_IMAGE_MAX_BYTES)
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(writer.write, chunk)
+        if writer.size == 0:
+            raise HTTPException(status_code=400, detail="Image body is empty")
+        image_sha256, image_size = await run_in_threadpool(writer.commit)
+    except ValueError:
+        writer.abort()
+        raise HTTPException(status_code=413, detail="Image too large")
+    except BaseException:
+        writer.abort()
+        raise
+
+    item = await run_in_threadpool(
+        ItemService.set_item_image, db, item_id, image_sha256, image_size, content_type
+    )
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
+
+@router.get("/{item_id}/image", response_class=FileResponse)
+def read_item_image(item_id: str, request: Request, db: Session = Depends(get_db)):
+    """
+    Download an item's image.
+
+    Supports `Range` requests and conditional `If-None-Match` requests against the
+    image's SHA-256 ETag.
+
+    Parameters:
+    - **item_id**: ID of the item.
+
+    Returns:
+    - The image bytes, `206 Partial Content` for ranges, or `304 Not Modified`.
+    """
+    image = ItemService.get_item_image(db, item_id)
+    if image is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    path, image_sha256, content_type = image
+    etag = f'"{image_sha256}"'
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=content_type, headers=headers)
+
+
+@router.get("/{item_id}/image/{preset}", response_class=FileResponse)
+async def read_item_image_derivative(item_id: str, preset: str, request: Request, db: Session = Depends(get_db)):
+    """
+    Download a resized variant of an item's image.
+
+    Variants are rendered on first request in a worker process and cached on disk
+    by source hash and parameters.
+
+    Parameters:
+    - **item_id**: ID of the item.
+    - **preset**: Name of a configured derivative, e.g. `thumb`, `small` or `medium`.
+
+    Returns:
+    - The resized image bytes or `304 Not Modified`.
+    """
+    spec = DERIVATIVE_SPECS.get(preset)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Unknown image preset, expected one of {list(DERIVATIVE_SPECS)}")
+    image = await run_in_threadpool(ItemService.get_item_image, db, item_id)
+    if image is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    _, image_sha256, _ = image
+    etag = f'"{image_sha256}-{spec.key}"'
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    try:
+        path = await derivative_cache.get(image_sha256, spec)
+    except DecompressionBombError:
+        raise HTTPException(status_code=422, detail="Image dimensions are too large to resize")
+    except OSError:
+        raise HTTPException(status_code=422, detail="Image could not be decoded")
+    except BrokenProcessPool:
+        raise HTTPException(status_code=503, detail="Image resizing is temporarily unavailable")
+    return FileResponse(path, media_type=spec.media_type, headers=headers)
+
+
 @router.put("/{item_id}", response_model=ItemRead)
 def update_item(item_id: str, item_update: ItemUpdate, db: Session = Depends(get_db)):
     """
@@ -58,6 +270,31 @@ def update_item(item_id: str, item_update: ItemUpdate, db: Session = Depends(get
     return item
 
 
+@router.patch("/{item_id}", response_model=ItemRead)
+def patch_item(item_id: str, item_patch: ItemPatch, db: Session = Depends(get_db)):
+    """
+    Apply an RFC 7396 JSON merge patch (`application/merge-patch+json`) to an item.
+
+    Only the keys in the patch change: `attributes` members set to null are
+    removed and nested objects are merged, in the database, so concurrent
+    patches to different attributes don't overwrite each other.
+
+    Parameters:
+    - **item_id**: ID of the item.
+    - **item_patch**: ItemPatch merge patch.
+
+    Returns:
+    - **ItemRead**: The patched item data.
+    """
+    try:
+        item = ItemService.patch_item(db, item_id, item_patch)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
+
 @router.delete("/{item_id}", response_model=dict)
 def delete_item(item_id: str, db: Session = Depends(get_db)):
     """
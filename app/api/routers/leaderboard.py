@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.api.services.leaderboard import LeaderboardService
+from app.core.database import get_db
+from app.schemas.user import LeaderboardPage
+
+router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
+
+
+@router.get("/", response_model=LeaderboardPage)
+def read_leaderboard(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve users ranked by experience points, highest first.
+
+    Users with equal experience share a rank and are listed by wallet address.
+    """
+    entries, total = LeaderboardService.get_leaderboard(db, offset, limit)
+    return {"entries": entries, "total": total}
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.api.services.metadata import MetadataService
+from app.core.config import settings
+from app.core.database import get_db
+
+router = APIRouter(prefix="/metadata", tags=["metadata"])
+
+
+def _accepted_encodings(accept_encoding: str) -> list[str]:
+    encodings = []
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q=") and quality[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        if coding:
+            encodings.append(coding.strip().lower())
+    return encodings
+
+
+@router.get("/{item_id}.json")
+def read_item_metadata(item_id: str, request: Request, db: Session = Depends(get_db)):
+    """
+    Retrieve an item's NFT metadata document, as referenced by its `metadata_uri`.
+
+    Served precompressed according to `Accept-Encoding`, with an ETag and
+    long-lived cache headers; answers `304 Not Modified` to a matching
+    `If-None-Match`.
+
+    Parameters:
+    - **item_id**: ID of the item.
+
+    Returns:
+    - The metadata JSON document.
+    """
+    document = MetadataService.get_metadata(
+        db, item_id, _accepted_encodings(request.headers.get("accept-encoding", ""))
+    )
+    if document is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    headers = {
+        "ETag": document.etag,
+        "Cache-Control": f"public, max-age={settings.METADATA_MAX_AGE_SECONDS}",
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and any(
+        candidate.strip().removeprefix("W/") in (document.etag, "*") for candidate in if_none_match.split(",")
+    ):
+        return Response(status_code=304, headers=headers)
+    if document.encoding is not None:
+        headers["Content-Encoding"] = document.encoding
+    return Response(content=document.body, media_type="application/json", headers=headers)
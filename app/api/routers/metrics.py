@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+from app.core.scheduler import scheduler
+from app.schemas.metrics import JobStatsRead
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/jobs", response_model=dict[str, JobStatsRead])
+def read_job_metrics():
+    """
+    Retrieve counters for the background jobs running in this worker.
+
+    Returns:
+    - **dict[str, JobStatsRead]**: Counters keyed by job name.
+    """
+    return scheduler.stats()
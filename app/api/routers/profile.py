@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.api.services.profile import ProfileService
+from app.core.database import get_db
+from app.schemas.profile import ProfileRead
+
+router = APIRouter(prefix="/profiles", tags=["profiles"])
+
+
+@router.get("/{wallet_address}", response_model=ProfileRead)
+def read_profile(
+    wallet_address: str,
+    quests: int = Query(5, ge=0, le=50, description="Recent quests to include per list."),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve everything a profile page shows in one request.
+
+    Returns the user, their avatar with equipped items, their item count and
+    their most recent created and participating quests.
+    """
+    profile = ProfileService.get_profile(db, wallet_address, quests)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return profile
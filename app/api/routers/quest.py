@@ -1,9 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 
 from app.api.services.quest import QuestService
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.quest import QuestCreate, QuestRead, QuestUpdate
+from app.core.errors import ConflictError
+from app.core.events import quest_events
+from app.core.geo import BoundingBox
+from app.schemas.common import BatchGetRequest, BatchGetResponse
+from app.schemas.quest import (
+    QuestBulkCreateResponse,
+    QuestCluster,
+    QuestCreate,
+    QuestPage,
+    QuestParticipant,
+    QuestRead,
+    QuestStatus,
+    QuestUpdate,
+)
 
 router = APIRouter(
     prefix="/quests",
@@ -27,11 +46,257 @@ def create_quest(quest_create: QuestCreate, db: Session = Depends(get_db)):
 
     **Returns:**
     - **QuestRead** (*QuestRead*): The newly created quest data.
+
+    **Raises:**
+    - **400 Bad Request**: If the creator wallet does not exist.
     """
-    quest = QuestService.create_quest(db, quest_create)
+    try:
+        quest = QuestService.create_quest(db, quest_create)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return quest
 
 
+@router.websocket("/feed")
+async def quest_feed(websocket: WebSocket, bbox: str):
+    """
+    **Live feed of quest changes inside a map viewport**.
+
+    Sends `created`, `updated`, `status_changed` and `deleted` events for quests
+    inside `bbox` (`min_lon,min_lat,max_lon,max_lat`). Events from quest updates
+    include `previous_latitude`/`previous_longitude` and are also sent when only
+    the previous position was inside, so clients can drop quests that moved away.
+    Send a new bbox string as a text message to move the viewport without reconnecting.
+    """
+    try:
+        viewport = BoundingBox.parse(bbox)
+    except ValueError as e:
+        await websocket.close(code=1008, reason=str(e))
+        return
+    await websocket.accept()
+
+    def in_viewport(event: dict) -> bool:
+        # Updates carry the previous position too, so a quest moving out of view is still sent.
+        if viewport.contains(event["latitude"], event["longitude"]):
+            return True
+        previous_latitude = event.get("previous_latitude")
+        return previous_latitude is not None and viewport.contains(previous_latitude, event["previous_longitude"])
+
+    subscription = quest_events.subscribe(in_viewport)
+
+    async def forward():
+        while True:
+            await websocket.send_json(await subscription.get())
+
+    sender = asyncio.create_task(forward())
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                viewport = BoundingBox.parse(message)
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        quest_events.unsubscribe(subscription)
+
+
+@router.get(
+    "/nearby",
+    response_model=list[QuestRead],
+    summary="Retrieve quests near a location",
+    description="Retrieve quests within a radius of a coordinate, nearest first.",
+)
+def read_nearby_quests(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_m: float = Query(1000, gt=0, le=50_000),
+    status: Optional[QuestStatus] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    **Retrieve quests near a location**.
+
+    **Parameters:**
+    - **lat** (*float*): Latitude of the search centre.
+    - **lon** (*float*): Longitude of the search centre.
+    - **radius_m** (*float*): Search radius in metres (max 50 km).
+    - **status** (*QuestStatus*, optional): Only return quests with this status.
+    - **limit** (*int*): Maximum number of quests to return.
+
+    **Returns:**
+    - **list[QuestRead]** (*list[QuestRead]*): Quests within the radius ordered by distance.
+    """
+    return QuestService.get_nearby_quests(db, lat, lon, radius_m, status, limit)
+
+
+@router.get(
+    "/clusters",
+    response_model=list[QuestCluster],
+    summary="Retrieve quest clusters for a map viewport",
+    description="Retrieve cluster centroids and counts of open quests for a bounding box and zoom level.",
+)
+def read_quest_clusters(
+    bbox: str = Query(..., description="min_lon,min_lat,max_lon,max_lat"),
+    zoom: int = Query(..., ge=0, le=22),
+    db: Session = Depends(get_db),
+):
+    """
+    **Retrieve quest clusters for a map viewport**.
+
+    **Parameters:**
+    - **bbox** (*str*): Viewport as `min_lon,min_lat,max_lon,max_lat`.
+    - **zoom** (*int*): Map zoom level.
+
+    **Returns:**
+    - **list[QuestCluster]** (*list[QuestCluster]*): Cluster centroids with counts; single quests carry their ID.
+
+    **Raises:**
+    - **400 Bad Request**: If the bbox is malformed or too large for the zoom level.
+    """
+    try:
+        viewport = BoundingBox.parse(bbox)
+        clusters = QuestService.get_clusters(db, viewport, zoom)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [cluster._asdict() for cluster in clusters]
+
+
+@router.get(
+    "/search",
+    response_model=list[QuestRead],
+    summary="Search quests",
+    description="Full-text search over quest titles and descriptions, ranked by relevance and distance.",
+)
+def search_quests(
+    q: str = Query(..., min_length=1, max_length=200),
+    lat: Optional[float] = Query(None, ge=-90, le=90),
+    lon: Optional[float] = Query(None, ge=-180, le=180),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    **Search quests by text**.
+
+    **Parameters:**
+    - **q** (*str*): Search text; supports quoted phrases, `or` and `-exclusions`.
+    - **lat** (*float*, optional): Latitude of the searcher, to favour nearby quests.
+    - **lon** (*float*, optional): Longitude of the searcher, to favour nearby quests.
+    - **limit** (*int*): Maximum number of quests to return.
+
+    **Returns:**
+    - **list[QuestRead]** (*list[QuestRead]*): Matching quests, best first.
+    """
+    return QuestService.search_quests(db, q, lat, lon, limit)
+
+
+@router.get(
+    "/active",
+    response_model=list[QuestRead],
+    summary="Retrieve active quests",
+    description="Retrieve quests whose time window contains the given moment.",
+)
+def read_active_quests(
+    at: Optional[datetime] = None,
+    status: Optional[QuestStatus] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    **Retrieve quests active at a moment**.
+
+    **Parameters:**
+    - **at** (*datetime*, optional): The moment to check, defaults to now.
+    - **status** (*QuestStatus*, optional): Only return quests with this status.
+    - **limit** (*int*): Maximum number of quests to return.
+
+    **Returns:**
+    - **list[QuestRead]** (*list[QuestRead]*): Active quests, ending soonest first.
+    """
+    return QuestService.get_active_quests(db, at, status, limit)
+
+
+@router.get(
+    "/upcoming",
+    response_model=list[QuestRead],
+    summary="Retrieve upcoming quests",
+    description="Retrieve quests starting within the given duration from now.",
+)
+def read_upcoming_quests(
+    within: timedelta = Query(timedelta(hours=1), description="ISO 8601 duration, e.g. PT1H or PT30M."),
+    status: Optional[QuestStatus] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    **Retrieve quests starting soon**.
+
+    **Parameters:**
+    - **within** (*timedelta*): How far ahead to look, defaults to one hour.
+    - **status** (*QuestStatus*, optional): Only return quests with this status.
+    - **limit** (*int*): Maximum number of quests to return.
+
+    **Returns:**
+    - **list[QuestRead]** (*list[QuestRead]*): Upcoming quests, starting soonest first.
+
+    **Raises:**
+    - **400 Bad Request**: If `within` is not positive.
+    """
+    if within <= timedelta(0):
+        raise HTTPException(status_code=400, detail="within must be positive")
+    return QuestService.get_upcoming_quests(db, within, status, limit)
+
+
+@router.post(
+    "/bulk",
+    response_model=QuestBulkCreateResponse,
+    summary="Create many quests",
+    description="Create up to several thousand quests in one transaction, reporting errors per row.",
+)
+def create_quests_bulk(
+    payloads: list[dict[str, Any]] = Body(..., max_length=settings.QUEST_BULK_CREATE_MAX),
+    db: Session = Depends(get_db),
+):
+    """
+    **Create many quests at once**.
+
+    Invalid rows are reported in `results` and do not prevent the valid rows from being created.
+
+    **Parameters:**
+    - **payloads** (*list[QuestCreate]*): The quests to create.
+
+    **Returns:**
+    - **QuestBulkCreateResponse** (*QuestBulkCreateResponse*): Per-row quest IDs or errors.
+    """
+    results = QuestService.create_quests_bulk(db, payloads)
+    failed = sum(1 for result in results if result["error"] is not None)
+    return {"created": len(results) - failed, "failed": failed, "results": results}
+
+
+@router.post(
+    "/batch-get",
+    response_model=BatchGetResponse[QuestRead],
+    summary="Retrieve many quests",
+    description="Retrieve up to several thousand quests by ID in one request.",
+)
+def batch_get_quests(batch: BatchGetRequest, db: Session = Depends(get_db)):
+    """
+    **Retrieve many quests by ID**.
+
+    **Parameters:**
+    - **batch** (*BatchGetRequest*): The quest UUIDs to fetch.
+
+    **Returns:**
+    - **BatchGetResponse[QuestRead]** (*BatchGetResponse*): Quests in request order, null where not found, plus the missing IDs.
+    """
+    quests = QuestService.get_quests_by_ids(db, batch.ids)
+    missing = [quest_id for quest_id, quest in zip(batch.ids, quests) if quest is None]
+    return {"results": quests, "missing": list(dict.fromkeys(missing))}
+
+
 @router.get(
     "/{quest_id}",
     response_model=QuestRead,
@@ -59,19 +324,41 @@ def read_quest(quest_id: str, db: Session = Depends(get_db)):
 
 @router.get(
     "/",
-    response_model=list[QuestRead],
-    summary="Retrieve all quests",
-    description="Retrieve details of all quests.",
+    response_model=QuestPage,
+    summary="Retrieve quests",
+    description="Retrieve quests newest first, one page at a time, optionally filtered.",
 )
-def read_quests(db: Session = Depends(get_db)):
+def read_quests(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    status: Optional[QuestStatus] = None,
+    creator_wallet: Optional[str] = None,
+    participant_wallet: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
     """
-    **Retrieve all quests**.
+    **Retrieve a page of quests**.
+
+    **Parameters:**
+    - **cursor** (*str*, optional): The `next_cursor` returned with the previous page.
+    - **limit** (*int*): Maximum number of quests per page.
+    - **status** (*QuestStatus*, optional): Only return quests with this status.
+    - **creator_wallet** (*str*, optional): Only return quests created by this wallet.
+    - **participant_wallet** (*str*, optional): Only return quests accepted by this wallet.
 
     **Returns:**
-    - **list[QuestRead]** (*list[QuestRead]*): A list of all quests.
+    - **QuestPage** (*QuestPage*): The quests on this page and the cursor for the next one.
+
+    **Raises:**
+    - **400 Bad Request**: If the cursor is malformed.
     """
-    quests = QuestService.get_quests(db)
-    return quests
+    try:
+        quests, next_cursor = QuestService.get_quests(
+            db, limit, cursor, status, creator_wallet, participant_wallet
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": quests, "next_cursor": next_cursor}
 
 
 @router.put(
@@ -81,39 +368,155 @@ def read_quests(db: Session = Depends(get_db)):
     description="Update the details of a specific quest by providing its UUID and update data.",
 )
 def update_quest(
-    quest_id: str, quest_update: QuestUpdate, db: Session = Depends(get_db)
+    quest_id: UUID, quest_update: QuestUpdate, db: Session = Depends(get_db)
 ):
     """
     **Update an existing quest**.
 
     **Parameters:**
-    - **quest_id** (*str*): The UUID of the quest to update.
+    - **quest_id** (*UUID*): The UUID of the quest to update.
     - **quest_update** (*QuestUpdate*): A schema containing the fields to update.
 
     **Returns:**
     - **QuestRead** (*QuestRead*): The updated quest data.
 
     **Raises:**
+    - **400 Bad Request**: If the participant wallet does not exist.
     - **404 Not Found**: If the quest with the specified UUID does not exist.
     """
-    quest = QuestService.update_quest(db, quest_id, quest_update)
+    try:
+        quest = QuestService.update_quest(db, quest_id, quest_update)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if quest is None:
+        raise HTTPException(status_code=404, detail="Quest not found")
+    return quest
+
+
+def _transition(db: Session, quest_id: UUID, action: str, participant_wallet: Optional[str] = None):
+    try:
+        quest = QuestService.transition_quest(db, quest_id, action, participant_wallet)
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if quest is None:
         raise HTTPException(status_code=404, detail="Quest not found")
     return quest
 
 
+@router.post(
+    "/{quest_id}/accept",
+    response_model=QuestRead,
+    summary="Accept a quest",
+    description="Assign an available quest to a participant.",
+    responses={409: {"description": "Quest is no longer available"}},
+)
+def accept_quest(quest_id: UUID, participant: QuestParticipant, db: Session = Depends(get_db)):
+    """
+    **Accept an available quest**.
+
+    **Parameters:**
+    - **quest_id** (*UUID*): The UUID of the quest.
+    - **participant** (*QuestParticipant*): The wallet accepting the quest.
+
+    **Returns:**
+    - **QuestRead** (*QuestRead*): The accepted quest.
+
+    **Raises:**
+    - **400 Bad Request**: If the participant wallet does not exist.
+    - **404 Not Found**: If the quest does not exist.
+    - **409 Conflict**: If the quest is not available, e.g. another player accepted it first.
+    """
+    return _transition(db, quest_id, "accept", participant.participant_wallet)
+
+
+@router.post(
+    "/{quest_id}/start",
+    response_model=QuestRead,
+    summary="Start a quest",
+    description="Move an accepted quest to in progress.",
+    responses={409: {"description": "Quest is not accepted by this participant"}},
+)
+def start_quest(quest_id: UUID, participant: QuestParticipant, db: Session = Depends(get_db)):
+    """
+    **Start an accepted quest**.
+
+    **Parameters:**
+    - **quest_id** (*UUID*): The UUID of the quest.
+    - **participant** (*QuestParticipant*): The wallet holding the quest.
+
+    **Returns:**
+    - **QuestRead** (*QuestRead*): The started quest.
+
+    **Raises:**
+    - **404 Not Found**: If the quest does not exist.
+    - **409 Conflict**: If the quest is not accepted or is held by another wallet.
+    """
+    return _transition(db, quest_id, "start", participant.participant_wallet)
+
+
+@router.post(
+    "/{quest_id}/complete",
+    response_model=QuestRead,
+    summary="Complete a quest",
+    description="Move an in-progress quest to completed.",
+    responses={409: {"description": "Quest is not in progress for this participant"}},
+)
+def complete_quest(quest_id: UUID, participant: QuestParticipant, db: Session = Depends(get_db)):
+    """
+    **Complete an in-progress quest**.
+
+    **Parameters:**
+    - **quest_id** (*UUID*): The UUID of the quest.
+    - **participant** (*QuestParticipant*): The wallet holding the quest.
+
+    **Returns:**
+    - **QuestRead** (*QuestRead*): The completed quest.
+
+    **Raises:**
+    - **404 Not Found**: If the quest does not exist.
+    - **409 Conflict**: If the quest is not in progress or is held by another wallet.
+    """
+    return _transition(db, quest_id, "complete", participant.participant_wallet)
+
+
+@router.post(
+    "/{quest_id}/cancel",
+    response_model=QuestRead,
+    summary="Cancel a quest",
+    description="Cancel a quest that has not been completed.",
+    responses={409: {"description": "Quest is already completed or cancelled"}},
+)
+def cancel_quest(quest_id: UUID, db: Session = Depends(get_db)):
+    """
+    **Cancel a quest**.
+
+    **Parameters:**
+    - **quest_id** (*UUID*): The UUID of the quest.
+
+    **Returns:**
+    - **QuestRead** (*QuestRead*): The cancelled quest.
+
+    **Raises:**
+    - **404 Not Found**: If the quest does not exist.
+    - **409 Conflict**: If the quest is already completed or cancelled.
+    """
+    return _transition(db, quest_id, "cancel")
+
+
 @router.delete(
     "/{quest_id}",
     response_model=dict,
     summary="Delete a quest",
     description="Delete a specific quest by providing its UUID.",
 )
-def delete_quest(quest_id: str, db: Session = Depends(get_db)):
+def delete_quest(quest_id: UUID, db: Session = Depends(get_db)):
     """
     **Delete a quest by its ID**.
 
     **Parameters:**
-    - **quest_id** (*str*): The UUID of the quest to delete.
+    - **quest_id** (*UUID*): The UUID of the quest to delete.
 
     **Returns:**
     - **dict**: A message indicating the deletion status.
@@ -1,11 +1,21 @@
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
+from app.api.services.experience import ExperienceService
+from app.api.services.item import ItemService
+from app.api.services.leaderboard import LeaderboardService
 from app.api.services.user import UserService
 from app.core.database import get_db
-from app.schemas.user import UserCreate, UserRead, UserUpdate
+from app.core.errors import ConflictError
+from app.core.filters import parse_attribute_filters
+from app.schemas.common import BatchGetRequest, BatchGetResponse
+from app.schemas.experience import ExperienceAward, ExperienceLedgerEntryRead, ExperienceRead
+from app.schemas.item import ItemPage
+from app.schemas.user import UserCreate, UserRank, UserRead, UserSuggestion, UserUpdate
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -18,8 +28,32 @@ def create_user(user_create: UserCreate, db: Session = Depends(get_db)):
     try:
         db_user = UserService.create_user(db, user_create)
         return db_user
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+@router.post("/batch-get", response_model=BatchGetResponse[UserRead])
+def batch_get_users(batch: BatchGetRequest, db: Session = Depends(get_db)):
+    """
+    Retrieve many users by wallet address in one request.
+
+    Results are in request order, with null for addresses that have no user.
+    """
+    users = UserService.get_users_by_wallets(db, batch.ids)
+    missing = [wallet_address for wallet_address, user in zip(batch.ids, users) if user is None]
+    return {"results": users, "missing": list(dict.fromkeys(missing))}
+
+
+@router.get("/search", response_model=list[UserSuggestion])
+def search_users(
+    prefix: str = Query(..., min_length=1, max_length=64),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Autocomplete usernames starting with `prefix`, ignoring case.
+    """
+    return [suggestion._asdict() for suggestion in UserService.search_users(db, prefix, limit)]
 
 
 @router.get("/{wallet_address}", response_model=UserRead)
@@ -33,6 +67,71 @@ def read_user(wallet_address: str, db: Session = Depends(get_db)):
     return db_user
 
 
+@router.post("/{wallet_address}/experience", response_model=ExperienceLedgerEntryRead, status_code=202)
+def award_experience(wallet_address: str, award: ExperienceAward, db: Session = Depends(get_db)):
+    """
+    Award experience points to a user.
+
+    The award is appended to the experience ledger and applied to the user's
+    total by a background job within a few seconds.
+    """
+    entry = ExperienceService.award_experience(db, wallet_address, award)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return entry
+
+
+@router.get("/{wallet_address}/experience", response_model=ExperienceRead)
+def read_user_experience(
+    wallet_address: str,
+    include_pending: bool = Query(False, description="Include awards not yet applied to the user."),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve a user's experience total, settled or including pending awards.
+    """
+    experience = ExperienceService.get_experience(db, wallet_address, include_pending)
+    if experience is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return experience
+
+
+@router.get("/{wallet_address}/rank", response_model=UserRank)
+def read_user_rank(wallet_address: str, db: Session = Depends(get_db)):
+    """
+    Retrieve a user's position on the experience leaderboard.
+    """
+    rank = LeaderboardService.get_rank(db, wallet_address)
+    if rank is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return rank
+
+
+@router.get("/{wallet_address}/items", response_model=ItemPage)
+def read_user_items(
+    wallet_address: str,
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve the items a wallet owns, newest first, one page at a time.
+
+    Filter on attributes with `attr.<key>=<value>` or `attr.<key>[<op>]=<value>`
+    query parameters, as for `GET /items`. Pass the returned `next_cursor` to get
+    the next page.
+    """
+    try:
+        attribute_filters = parse_attribute_filters(request.query_params.multi_items())
+        items, next_cursor = ItemService.get_items(
+            db, limit, cursor, wallet_address, attribute_filters
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
+
+
 @router.get("/", response_model=list[UserRead])
 def read_users(db: Session = Depends(get_db)):
     """
@@ -48,7 +147,10 @@ def update_user(
     """
     Update an existing user's information.
     """
-    db_user = UserService.update_user(db, wallet_address, user_update)
+    try:
+        db_user = UserService.update_user(db, wallet_address, user_update)
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return db_user
@@ -59,7 +161,10 @@ def delete_user(wallet_address: str, db: Session = Depends(get_db)):
     """
     Delete a user by wallet address.
     """
-    result = UserService.delete_user(db, wallet_address)
+    try:
+        result = UserService.delete_user(db, wallet_address)
+    except ConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if not result:
         raise HTTPException(status_code=404, detail="User not found")
     return {"detail": "User deleted successfully"}
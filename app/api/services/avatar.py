@@ -1,9 +1,44 @@
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.errors import ConflictError
 from app.models.avatar import Avatar as AvatarModel
-from app.schemas.avatar import AvatarCreate, AvatarUpdate
+from app.models.item import Item as ItemModel
+from app.schemas.avatar import AvatarCreate, AvatarPatch, AvatarUpdate, AvatarWithItems
+from app.schemas.item import ItemRead
 from app.api.repositories.avatar import AvatarRepository
+from app.api.repositories.item import ItemRepository
+
+
+class EquippedItemsNotOwnedError(ValueError):
+    """
+    Raised when an avatar would equip items its wallet does not own.
+    """
+
+    def __init__(self, item_ids: list[str]):
+        super().__init__("Equipped items must be owned by the avatar's wallet")
+        self.item_ids = item_ids
+
+
+def _lock_avatar(db: Session, wallet_address: str) -> bool:
+    """
+    Confirm the avatar exists before checking items, so an unknown avatar is a 404 rather than an ownership error.
+    """
+    if AvatarRepository.lock_avatar(db, wallet_address):
+        return True
+    db.rollback()
+    return False
+
+
+def _check_equipped_items(db: Session, wallet_address: str, item_ids: list[str]) -> None:
+    """
+    Verify in one query that the wallet owns every item to equip, locking them until the write commits.
+    """
+    owned = ItemRepository.get_owned_item_ids(db, wallet_address, list(set(item_ids)))
+    missing = [item_id for item_id in dict.fromkeys(item_ids) if item_id not in owned]
+    if missing:
+        db.rollback()
+        raise EquippedItemsNotOwnedError(missing)
 
 
 class AvatarService:
@@ -26,6 +61,47 @@ class AvatarService:
         """
         return AvatarRepository.get_avatar(db, wallet_address)
 
+    @staticmethod
+    def get_equipped_items(db: Session, avatar: AvatarModel) -> list[ItemModel]:
+        """
+        Resolve an avatar's equipped item IDs to item records in one query.
+
+        Args:
+            db (Session): Database session.
+            avatar (AvatarModel): The avatar.
+
+        Returns:
+            list[ItemModel]: Equipped items the wallet still owns, in equipped order.
+        """
+        item_ids = list(dict.fromkeys(avatar.equipped_items or []))
+        if not item_ids:
+            return []
+        items = {
+            item.item_id: item
+            for item in ItemRepository.get_items_by_ids(db, item_ids)
+            if item.owner_wallet == avatar.wallet_address
+        }
+        return [items[item_id] for item_id in item_ids if item_id in items]
+
+    @staticmethod
+    def expand_avatar(db: Session, avatar: AvatarModel) -> AvatarWithItems:
+        """
+        Attach an avatar's equipped item records, fetched in one query.
+
+        Args:
+            db (Session): Database session.
+            avatar (AvatarModel): The avatar.
+
+        Returns:
+            AvatarWithItems: The avatar with ``equipped`` filled in.
+        """
+        return AvatarWithItems.model_validate(avatar, from_attributes=True).model_copy(update={
+            "equipped": [
+                ItemRead.model_validate(item, from_attributes=True)
+                for item in AvatarService.get_equipped_items(db, avatar)
+            ],
+        })
+
     @staticmethod
     def create_avatar(db: Session, avatar_create: AvatarCreate) -> AvatarModel:
         """
@@ -39,12 +115,15 @@ class AvatarService:
             AvatarModel: The newly created avatar model instance.
 
         Raises:
-            ValueError: If the avatar already exists.
+            ConflictError: If the avatar already exists.
+            EquippedItemsNotOwnedError: If the wallet does not own every equipped item.
+            ValueError: If the wallet does not belong to a user.
         """
-        existing_avatar = AvatarRepository.get_avatar(db, avatar_create.wallet_address)
-        if existing_avatar:
-            raise ValueError("Avatar already exists")
-        return AvatarRepository.create_avatar(db, avatar_create)
+        _check_equipped_items(db, avatar_create.wallet_address, avatar_create.equipped_items)
+        db_avatar = AvatarRepository.create_avatar(db, avatar_create)
+        if db_avatar is None:
+            raise ConflictError("Avatar already exists")
+        return db_avatar
 
     @staticmethod
     def update_avatar(db: Session, wallet_address: str, avatar_update: AvatarUpdate) -> Optional[AvatarModel]:
@@ -58,11 +137,41 @@ class AvatarService:
 
         Returns:
             Optional[AvatarModel]: Updated avatar model instance or None if not found.
+
+        Raises:
+            EquippedItemsNotOwnedError: If the wallet does not own every equipped item.
         """
-        db_avatar = AvatarRepository.get_avatar(db, wallet_address)
-        if not db_avatar:
-            return None
-        return AvatarRepository.update_avatar(db, db_avatar, avatar_update)
+        if avatar_update.equipped_items:
+            if not _lock_avatar(db, wallet_address):
+                return None
+            _check_equipped_items(db, wallet_address, avatar_update.equipped_items)
+        return AvatarRepository.update_avatar(db, wallet_address, avatar_update)
+
+    @staticmethod
+    def patch_avatar(db: Session, wallet_address: str, avatar_patch: AvatarPatch) -> Optional[AvatarModel]:
+        """
+        Apply an RFC 7396 JSON merge patch to an avatar.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): User's wallet address.
+            avatar_patch (AvatarPatch): The merge patch.
+
+        Returns:
+            Optional[AvatarModel]: Patched avatar model instance or None if not found.
+
+        Raises:
+            EquippedItemsNotOwnedError: If the wallet does not own every equipped item.
+            ValueError: If the patch removes a required field.
+        """
+        removed = [key for key, value in avatar_patch.dict(exclude_unset=True).items() if value is None]
+        if removed:
+            raise ValueError(f"Cannot remove {', '.join(removed)}")
+        if avatar_patch.equipped_items:
+            if not _lock_avatar(db, wallet_address):
+                return None
+            _check_equipped_items(db, wallet_address, avatar_patch.equipped_items)
+        return AvatarRepository.patch_avatar(db, wallet_address, avatar_patch)
 
     @staticmethod
     def delete_avatar(db: Session, wallet_address: str) -> bool:
@@ -76,8 +185,4 @@ class AvatarService:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        db_avatar = AvatarRepository.get_avatar(db, wallet_address)
-        if not db_avatar:
-            return False
-        AvatarRepository.delete_avatar(db, db_avatar)
-        return True
+        return AvatarRepository.delete_avatar(db, wallet_address)
@@ -0,0 +1,86 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.api.repositories.experience import ExperienceRepository
+from app.api.services.leaderboard import publish_experience
+from app.core.logger import Logger
+from app.core.progression import level_for_experience
+from app.models.experience import ExperienceLedgerEntry
+from app.schemas.experience import ExperienceAward
+
+
+class ExperienceService:
+    """
+    Service class for experience awards.
+    Appends awards to the ledger and applies them in batches using ExperienceRepository.
+    """
+
+    @staticmethod
+    def award_experience(db: Session, wallet_address: str, award: ExperienceAward) -> Optional[ExperienceLedgerEntry]:
+        """
+        Record an award. It counts towards the user's total once the aggregator applies it.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user to award.
+            award (ExperienceAward): Amount and reason.
+
+        Returns:
+            Optional[ExperienceLedgerEntry]: The ledger entry, or None if the user does not exist.
+        """
+        return ExperienceRepository.append_entry(db, wallet_address, award)
+
+    @staticmethod
+    def get_experience(db: Session, wallet_address: str, include_pending: bool) -> Optional[dict]:
+        """
+        Retrieve a user's experience, either as settled or including awards not yet applied.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user.
+            include_pending (bool): Add pending ledger entries to the total.
+
+        Returns:
+            Optional[dict]: The total, the pending amount and the matching level, or None if not found.
+        """
+        experience = ExperienceRepository.get_experience(db, wallet_address)
+        if experience is None:
+            return None
+        settled, pending = experience
+        total = settled + pending if include_pending else settled
+        return {
+            "wallet_address": wallet_address,
+            "experience_points": total,
+            "pending_experience_points": pending,
+            "level": level_for_experience(total),
+            "include_pending": include_pending,
+        }
+
+    @staticmethod
+    def apply_pending(db: Session, batch_size: int, max_batches: Optional[int] = None) -> int:
+        """
+        Apply pending ledger entries until none are left.
+
+        Each batch commits on its own and publishes the new totals to the leaderboard.
+
+        Args:
+            db (Session): Database session.
+            batch_size (int): Maximum number of ledger entries per batch.
+            max_batches (Optional[int]): Stop after this many batches, or run until drained.
+
+        Returns:
+            int: Total number of ledger entries applied.
+        """
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            applied, users = ExperienceRepository.apply_pending(db, batch_size)
+            publish_experience(db, "updated", users)
+            total += applied
+            batches += 1
+            if applied < batch_size:
+                break
+        if total:
+            Logger.info(f"Applied {total} experience awards in {batches} batches")
+        return total
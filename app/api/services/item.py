@@ -1,9 +1,29 @@
+from pathlib import Path
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.blobstore import blob_store
+from app.core.errors import ConflictError
+from app.core.filters import AttributeFilter
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.item import Item as ItemModel
-from app.schemas.item import ItemCreate, ItemUpdate
+from app.schemas.item import ItemCreate, ItemPatch, ItemUpdate
 from app.api.repositories.item import ItemRepository
+from app.api.repositories.user import UserRepository
+
+
+# Fields a merge patch may not remove by setting them to null.
+REQUIRED_ITEM_FIELDS = {"name", "description", "attributes"}
+
+
+class ItemTransferError(ConflictError):
+    """
+    Raised when some items in a transfer are missing or not owned by the sender.
+    """
+
+    def __init__(self, failures: list[dict]):
+        super().__init__("Some items cannot be transferred")
+        self.failures = failures
 
 
 class ItemService:
@@ -26,6 +46,52 @@ class ItemService:
         """
         return ItemRepository.get_item(db, item_id)
 
+    @staticmethod
+    def get_items_by_ids(db: Session, item_ids: list[str]) -> list[Optional[ItemModel]]:
+        """
+        Retrieve many items by ID.
+
+        Args:
+            db (Session): Database session.
+            item_ids (list[str]): Item IDs.
+
+        Returns:
+            list[Optional[ItemModel]]: The item for each requested ID in request order, None where not found.
+        """
+        items = {item.item_id: item for item in ItemRepository.get_items_by_ids(db, list(set(item_ids)))}
+        return [items.get(item_id) for item_id in item_ids]
+
+    @staticmethod
+    def get_items(
+        db: Session,
+        limit: int,
+        cursor: Optional[str] = None,
+        owner_wallet: Optional[str] = None,
+        attribute_filters: Optional[list[AttributeFilter]] = None,
+    ) -> tuple[list[ItemModel], Optional[str]]:
+        """
+        Retrieve a page of items, newest first.
+
+        Args:
+            db (Session): Database session.
+            limit (int): Maximum number of items to return.
+            cursor (Optional[str]): Cursor returned with the previous page.
+            owner_wallet (Optional[str]): Only return items owned by this wallet.
+            attribute_filters (Optional[list[AttributeFilter]]): Attribute filters.
+
+        Returns:
+            tuple[list[ItemModel], Optional[str]]: The page of items and the cursor for the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        after = decode_cursor(cursor) if cursor is not None else None
+        items = ItemRepository.get_items(db, limit + 1, after, owner_wallet, attribute_filters)
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, encode_cursor(items[-1].created_at, items[-1].item_id)
+
     @staticmethod
     def create_item(db: Session, item_create: ItemCreate) -> ItemModel:
         """
@@ -39,12 +105,13 @@ class ItemService:
             ItemModel: The newly created item model instance.
 
         Raises:
-            ValueError: If the item already exists.
+            ConflictError: If the item already exists.
+            ValueError: If the owner wallet does not exist.
         """
-        existing_item = ItemRepository.get_item(db, item_create.item_id)
-        if existing_item:
-            raise ValueError("Item already exists")
-        return ItemRepository.create_item(db, item_create)
+        db_item = ItemRepository.create_item(db, item_create)
+        if db_item is None:
+            raise ConflictError("Item already exists")
+        return db_item
 
     @staticmethod
     def update_item(db: Session, item_id: str, item_update: ItemUpdate) -> Optional[ItemModel]:
@@ -59,10 +126,124 @@ class ItemService:
         Returns:
             Optional[ItemModel]: Updated item model instance or None if not found.
         """
-        db_item = ItemRepository.get_item(db, item_id)
-        if not db_item:
+        return ItemRepository.update_item(db, item_id, item_update)
+
+    @staticmethod
+    def patch_item(db: Session, item_id: str, item_patch: ItemPatch) -> Optional[ItemModel]:
+        """
+        Apply an RFC 7396 JSON merge patch to an item.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+            item_patch (ItemPatch): The merge patch.
+
+        Returns:
+            Optional[ItemModel]: Patched item model instance or None if not found.
+
+        Raises:
+            ValueError: If the patch removes a required field.
+        """
+        removed = [
+            key for key, value in item_patch.dict(exclude_unset=True).items()
+            if value is None and key in REQUIRED_ITEM_FIELDS
+        ]
+        if removed:
+            raise ValueError(f"Cannot remove {', '.join(removed)}")
+        return ItemRepository.patch_item(db, item_id, item_patch)
+
+    @staticmethod
+    def get_item_image(db: Session, item_id: str) -> Optional[tuple[Path, str, str]]:
+        """
+        Locate an item's image in the blob store.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+
+        Returns:
+            Optional[tuple[Path, str, str]]: Blob path, SHA-256 and content type, or None if
+            the item or its image does not exist.
+        """
+        image = ItemRepository.get_item_image(db, item_id)
+        if image is None or image.image_sha256 is None:
+            return None
+        path = blob_store.path(image.image_sha256)
+        if not path.exists():
             return None
-        return ItemRepository.update_item(db, db_item, item_update)
+        return path, image.image_sha256, image.image_content_type or "application/octet-stream"
+
+    @staticmethod
+    def get_image_hashes(db: Session) -> list[str]:
+        """
+        List the SHA-256 of every image referenced by an item.
+
+        Args:
+            db (Session): Database session.
+
+        Returns:
+            list[str]: Distinct blob store keys.
+        """
+        return ItemRepository.get_image_hashes(db)
+
+    @staticmethod
+    def set_item_image(
+        db: Session, item_id: str, image_sha256: str, image_size: int, image_content_type: str
+    ) -> Optional[ItemModel]:
+        """
+        Record an image already written to the blob store as the item's image.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+            image_sha256 (str): Blob store key of the image.
+            image_size (int): Image size in bytes.
+            image_content_type (str): MIME type of the image.
+
+        Returns:
+            Optional[ItemModel]: Updated item model instance or None if not found.
+        """
+        return ItemRepository.set_item_image(db, item_id, image_sha256, image_size, image_content_type)
+
+    @staticmethod
+    def transfer_items(db: Session, item_ids: list[str], from_wallet: str, to_wallet: str) -> list[str]:
+        """
+        Move a set of items between wallets, all or nothing.
+
+        The ownership check is part of the single ``UPDATE``; if it did not match
+        every item the transaction is rolled back and the failing items are reported.
+
+        Args:
+            db (Session): Database session.
+            item_ids (list[str]): IDs of the items to move.
+            from_wallet (str): Current owner.
+            to_wallet (str): New owner.
+
+        Returns:
+            list[str]: The moved item IDs, in request order without duplicates.
+
+        Raises:
+            ValueError: If the wallets are the same or the recipient does not exist.
+            ItemTransferError: If any item is missing or not owned by ``from_wallet``.
+        """
+        if from_wallet == to_wallet:
+            raise ValueError("Cannot transfer items to the same wallet")
+        if UserRepository.get_user(db, to_wallet) is None:
+            raise ValueError("Recipient wallet not found")
+        item_ids = list(dict.fromkeys(item_ids))
+
+        moved = ItemRepository.transfer_items(db, item_ids, from_wallet, to_wallet)
+        if len(moved) == len(item_ids):
+            db.commit()
+            return item_ids
+
+        db.rollback()
+        missing = [item_id for item_id in item_ids if item_id not in moved]
+        owners = ItemRepository.get_item_owners(db, missing)
+        raise ItemTransferError([
+            {"item_id": item_id, "reason": "not_owned" if item_id in owners else "not_found"}
+            for item_id in missing
+        ])
 
     @staticmethod
     def delete_item(db: Session, item_id: str) -> bool:
@@ -76,8 +257,4 @@ class ItemService:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        db_item = ItemRepository.get_item(db, item_id)
-        if not db_item:
-            return False
-        ItemRepository.delete_item(db, db_item)
-        return True
+        return ItemRepository.delete_item(db, item_id)
@@ -0,0 +1,119 @@
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from typing import Optional, Union
+
+from app.core.config import settings
+from app.core.events import user_events
+from app.core.ranking import ExperienceRankIndex
+from app.models.user import User as UserModel
+from app.api.repositories.user import UserRepository
+
+_ranks = ExperienceRankIndex(bucket_width=settings.LEADERBOARD_BUCKET_WIDTH)
+
+
+def _update_ranks(event: dict) -> None:
+    """
+    Keep the rank index in step with user events from every worker.
+    """
+    if event["type"] == "deleted":
+        _ranks.remove(event["wallet_address"])
+    else:
+        _ranks.set(event["wallet_address"], event["experience_points"] or 0)
+
+
+user_events.add_listener(_update_ranks)
+
+
+def publish_experience(db: Session, event_type: str, users: list[Union[UserModel, Row]]) -> None:
+    """
+    Publish users' experience and username so every worker's rank index and username search follow.
+
+    Takes user models or ``(wallet_address, username, experience_points)`` rows, and is the
+    only producer of non-delete user events, so every event has the same shape.
+    """
+    user_events.publish(db, [
+        {
+            "type": event_type,
+            "wallet_address": user.wallet_address,
+            "username": user.username,
+            "experience_points": user.experience_points,
+        }
+        for user in users
+    ])
+
+
+def _ensure_ranks(db: Session) -> None:
+    _ranks.ensure_built(lambda: UserRepository.get_experience(db))
+
+
+class LeaderboardService:
+    """
+    Service class for the experience leaderboard.
+    Pages come from the experience index in Postgres; ranks from the in-process rank index.
+    """
+
+    @staticmethod
+    def get_leaderboard(db: Session, offset: int, limit: int) -> tuple[list[dict], int]:
+        """
+        Retrieve one page of the leaderboard.
+
+        Args:
+            db (Session): Database session.
+            offset (int): Number of users to skip.
+            limit (int): Maximum number of users to return.
+
+        Returns:
+            tuple[list[dict], int]: The entries with their rank, and the number of ranked users.
+        """
+        _ensure_ranks(db)
+        users = UserRepository.get_leaderboard(db, offset, limit)
+        entries = [
+            {
+                "rank": _ranks.rank_of(user.experience_points or 0),
+                "wallet_address": user.wallet_address,
+                "username": user.username,
+                "experience_points": user.experience_points or 0,
+                "level": user.level or 1,
+            }
+            for user in users
+        ]
+        return entries, len(_ranks)
+
+    @staticmethod
+    def get_rank(db: Session, wallet_address: str) -> Optional[dict]:
+        """
+        Retrieve a user's rank in O(log n) without scanning the users table.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user.
+
+        Returns:
+            Optional[dict]: The user's experience, rank and the number of ranked users, or None if not found.
+        """
+        _ensure_ranks(db)
+        experience_points = _ranks.experience(wallet_address)
+        if experience_points is None:
+            return None
+        return {
+            "wallet_address": wallet_address,
+            "experience_points": experience_points,
+            "rank": _ranks.rank_of(experience_points),
+            "total": len(_ranks),
+        }
+
+    @staticmethod
+    def resync_ranks(db: Session) -> int:
+        """
+        Reload this process's rank index from the database.
+
+        User events only keep the index current while none are missed, e.g. across
+        a listener reconnect; a periodic resync bounds how long such drift lasts.
+
+        Args:
+            db (Session): Database session.
+
+        Returns:
+            int: Number of users in the index, or 0 if it has not been used yet.
+        """
+        return _ranks.rebuild(lambda: UserRepository.get_experience(db))
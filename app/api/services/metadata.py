@@ -0,0 +1,76 @@
+import hashlib
+import json
+from sqlalchemy.orm import Session
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.core.documents import CachedDocument, metadata_cache
+from app.models.item import Item as ItemModel
+from app.api.repositories.item import ItemRepository
+
+
+class MetadataService:
+    """
+    Service class for the NFT metadata documents that ``Item.metadata_uri`` points at.
+    Documents are rendered once from the item and served from ``metadata_cache``
+    until ``ItemRepository`` invalidates them.
+    """
+
+    @staticmethod
+    def render_metadata(item: ItemModel) -> bytes:
+        """
+        Render an item as an ERC-721 / OpenSea metadata document.
+
+        Args:
+            item (ItemModel): The item.
+
+        Returns:
+            bytes: Compact UTF-8 JSON.
+        """
+        if item.image_sha256 is not None:
+            image = f"{settings.PUBLIC_BASE_URL}/items/{item.item_id}/image"
+        else:
+            image = item.image_url
+        attributes = []
+        for key, value in (item.attributes or {}).items():
+            attribute = {"trait_type": key, "value": value}
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                attribute["display_type"] = "number"
+            attributes.append(attribute)
+        document = {
+            "name": item.name,
+            "description": item.description,
+            "image": image,
+            "attributes": attributes,
+        }
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode()
+
+    @staticmethod
+    def get_metadata(db: Session, item_id: str, accepted_encodings: Iterable[str] = ()) -> Optional[CachedDocument]:
+        """
+        Retrieve an item's metadata document, rendering and caching it on a miss.
+
+        Args:
+            db (Session): Database session.
+            item_id (str): Item ID.
+            accepted_encodings (Iterable[str]): Content codings the client accepts.
+
+        Returns:
+            Optional[CachedDocument]: The document in the best accepted encoding, or None if the item does not exist.
+        """
+        accepted_encodings = list(accepted_encodings)
+        document = metadata_cache.get(item_id, accepted_encodings)
+        if document is not None:
+            return document
+        # Read before the row, so an update committed after our SELECT voids the fill.
+        generation = metadata_cache.generation(item_id)
+        item = ItemRepository.get_item(db, item_id)
+        if item is None:
+            return None
+        body = MetadataService.render_metadata(item)
+        metadata_cache.put(item_id, body, generation)
+        document = metadata_cache.get(item_id, accepted_encodings)
+        if document is None:
+            # Invalidated while rendering: serve this render uncached.
+            document = CachedDocument(f'"{hashlib.sha256(body).hexdigest()[:32]}"', body, None)
+        return document
@@ -0,0 +1,47 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.api.repositories.profile import ProfileRepository
+from app.api.services.avatar import AvatarService
+
+
+class ProfileService:
+    """
+    Service class for player profiles.
+    Assembles the profile page from ProfileRepository in at most three queries.
+    """
+
+    @staticmethod
+    def get_profile(db: Session, wallet_address: str, quest_limit: int) -> Optional[dict]:
+        """
+        Retrieve a user's profile: the user, their avatar with equipped items resolved,
+        their item count and their most recent created and participating quests.
+
+        Args:
+            db (Session): Database session.
+            wallet_address (str): Wallet address of the user.
+            quest_limit (int): Maximum number of created and of participating quests.
+
+        Returns:
+            Optional[dict]: The profile, or None if the user does not exist.
+        """
+        found = ProfileRepository.get_user_with_avatar(db, wallet_address)
+        if found is None:
+            return None
+        user, item_count = found
+
+        avatar = None
+        if user.avatar is not None:
+            avatar = AvatarService.expand_avatar(db, user.avatar)
+
+        quests = ProfileRepository.get_recent_quests(db, wallet_address, quest_limit)
+        return {
+            "user": user,
+            "avatar": avatar,
+            "item_count": item_count,
+            "created_quests": [quest for quest in quests if quest.creator_wallet == wallet_address][:quest_limit],
+            "participating_quests": [
+                quest for quest in quests if quest.participant_wallet == wallet_address
+            ][:quest_limit],
+        }
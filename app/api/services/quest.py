@@ -1,10 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from app.core.clustering import Cluster, QuestClusterIndex
+from app.core.config import settings
+from app.core.errors import ConflictError
+from app.core.events import quest_events
+from app.core.geo import BoundingBox
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.quest import Quest as QuestModel
-from app.schemas.quest import QuestCreate, QuestUpdate
+from app.models.quest import QuestStatus
+from app.schemas.quest import QuestCreate, QuestRead, QuestUpdate
 from app.api.repositories.quest import QuestRepository
+from app.api.repositories.user import UserRepository
+
+
+# action -> (statuses the quest may be in, status it moves to)
+QUEST_TRANSITIONS: dict[str, tuple[set[QuestStatus], QuestStatus]] = {
+    "accept": ({QuestStatus.available}, QuestStatus.accepted),
+    "start": ({QuestStatus.accepted}, QuestStatus.in_progress),
+    "complete": ({QuestStatus.in_progress}, QuestStatus.completed),
+    "cancel": ({QuestStatus.available, QuestStatus.accepted, QuestStatus.in_progress}, QuestStatus.cancelled),
+}
+
+
+# Quests shown as map pins; the others are dropped from the cluster index.
+CLUSTERED_STATUSES = {QuestStatus.available, QuestStatus.accepted, QuestStatus.in_progress}
+
+_clusters = QuestClusterIndex(
+    max_zoom=settings.CLUSTER_MAX_ZOOM,
+    radius_px=settings.CLUSTER_RADIUS_PX,
+    max_cells=settings.CLUSTER_MAX_CELLS,
+)
+
+
+def _update_clusters(event: dict) -> None:
+    """
+    Keep the cluster index in step with quest events from every worker.
+    """
+    if event["type"] != "deleted" and event["status"] in {status.value for status in CLUSTERED_STATUSES}:
+        _clusters.upsert(event["quest_id"], event["latitude"], event["longitude"])
+    else:
+        _clusters.remove(event["quest_id"])
+
+
+quest_events.add_listener(_update_clusters)
+
+
+def _publish(
+    db: Session,
+    event_type: str,
+    quests: list[QuestModel],
+    with_data: bool = True,
+    previous_location: Optional[tuple[float, float]] = None,
+) -> None:
+    """
+    Publish quest events to feed subscribers in every worker.
+
+    ``previous_location`` is the ``(latitude, longitude)`` a single updated quest had
+    before the change, so viewers of the old position learn that it moved away.
+    """
+    events = [
+        {
+            "type": event_type,
+            "quest_id": str(quest.quest_id),
+            "latitude": quest.latitude,
+            "longitude": quest.longitude,
+            "status": quest.status.value if quest.status is not None else None,
+            "data": QuestRead.model_validate(quest, from_attributes=True).model_dump(mode="json") if with_data else None,
+        }
+        for quest in quests
+    ]
+    if previous_location is not None:
+        for event in events:
+            event["previous_latitude"], event["previous_longitude"] = previous_location
+    quest_events.publish(db, events)
 
 
 class QuestService:
@@ -28,17 +100,190 @@ class QuestService:
         return QuestRepository.get_quest(db, quest_id)
     
     @staticmethod
-    def get_quests(db: Session) -> list[QuestModel]:
+    def get_quests_by_ids(db: Session, quest_ids: list[str]) -> list[Optional[QuestModel]]:
         """
-        Retrieve all quests.
+        Retrieve many quests by ID.
 
         Args:
             db (Session): Database session.
+            quest_ids (list[str]): Quest IDs; strings that are not UUIDs are treated as not found.
 
         Returns:
-            list[QuestModel]: List of all quest model instances.
+            list[Optional[QuestModel]]: The quest for each requested ID in request order, None where not found.
         """
-        return QuestRepository.get_quests(db)
+        parsed = {}
+        for quest_id in quest_ids:
+            try:
+                parsed[quest_id] = UUID(quest_id)
+            except ValueError:
+                continue
+        quests = {quest.quest_id: quest for quest in QuestRepository.get_quests_by_ids(db, list(set(parsed.values())))}
+        return [quests.get(parsed.get(quest_id)) for quest_id in quest_ids]
+
+    @staticmethod
+    def get_quests(
+        db: Session,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[QuestStatus] = None,
+        creator_wallet: Optional[str] = None,
+        participant_wallet: Optional[str] = None,
+    ) -> tuple[list[QuestModel], Optional[str]]:
+        """
+        Retrieve a page of quests, newest first.
+
+        Args:
+            db (Session): Database session.
+            limit (int): Maximum number of quests to return.
+            cursor (Optional[str]): Cursor returned with the previous page.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            creator_wallet (Optional[str]): Only return quests created by this wallet.
+            participant_wallet (Optional[str]): Only return quests accepted by this wallet.
+
+        Returns:
+            tuple[list[QuestModel], Optional[str]]: The page of quests and the cursor for the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        after = None
+        if cursor is not None:
+            created_at, quest_id = decode_cursor(cursor)
+            after = (created_at, UUID(quest_id))
+        quests = QuestRepository.get_quests(
+            db, limit + 1, after, status, creator_wallet, participant_wallet
+        )
+        if len(quests) <= limit:
+            return quests, None
+        quests = quests[:limit]
+        return quests, encode_cursor(quests[-1].created_at, quests[-1].quest_id)
+
+    @staticmethod
+    def get_nearby_quests(
+        db: Session,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        status: Optional[QuestStatus] = None,
+        limit: int = 100,
+    ) -> list[QuestModel]:
+        """
+        Retrieve quests within a radius of a point, nearest first.
+
+        Args:
+            db (Session): Database session.
+            latitude (float): Latitude of the centre.
+            longitude (float): Longitude of the centre.
+            radius_m (float): Search radius in metres.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Quests within the radius ordered by distance.
+        """
+        return QuestRepository.get_nearby_quests(db, latitude, longitude, radius_m, status, limit)
+
+    @staticmethod
+    def search_quests(
+        db: Session,
+        q: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        limit: int = 20,
+    ) -> list[QuestModel]:
+        """
+        Search quests by text, optionally favouring ones near a location.
+
+        Args:
+            db (Session): Database session.
+            q (str): Search text.
+            latitude (Optional[float]): Latitude of the searcher.
+            longitude (Optional[float]): Longitude of the searcher.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Matching quests, best first.
+        """
+        return QuestRepository.search_quests(
+            db, q, latitude, longitude, settings.SEARCH_DISTANCE_SCALE_M, limit
+        )
+
+    @staticmethod
+    def get_clusters(db: Session, bbox: BoundingBox, zoom: int) -> list[Cluster]:
+        """
+        Cluster the open quests inside a map viewport.
+
+        The index is loaded from the database on first use and kept current from
+        quest events afterwards.
+
+        Args:
+            db (Session): Database session.
+            bbox (BoundingBox): The viewport.
+            zoom (int): Map zoom level.
+
+        Returns:
+            list[Cluster]: Cluster centroids with quest counts.
+
+        Raises:
+            ValueError: If the viewport is too large for the zoom level.
+        """
+        _clusters.ensure_built(lambda: QuestRepository.get_quest_positions(db, CLUSTERED_STATUSES))
+        return _clusters.query(bbox, zoom)
+
+    @staticmethod
+    def resync_clusters(db: Session) -> int:
+        """
+        Reload this process's cluster index from the database.
+
+        Quest events only keep the index current while none are missed, e.g. across
+        a listener reconnect; a periodic resync bounds how long such drift lasts.
+
+        Args:
+            db (Session): Database session.
+
+        Returns:
+            int: Number of quests in the index, or 0 if it has not been used yet.
+        """
+        return _clusters.rebuild(lambda: QuestRepository.get_quest_positions(db, CLUSTERED_STATUSES))
+
+    @staticmethod
+    def get_active_quests(
+        db: Session, at: Optional[datetime] = None, status: Optional[QuestStatus] = None, limit: int = 100
+    ) -> list[QuestModel]:
+        """
+        Retrieve quests whose time window contains a moment.
+
+        Args:
+            db (Session): Database session.
+            at (Optional[datetime]): The moment to check, defaults to now.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Quests active at ``at``, ending soonest first.
+        """
+        if at is None:
+            at = datetime.now(timezone.utc)
+        return QuestRepository.get_active_quests(db, at, status, limit)
+
+    @staticmethod
+    def get_upcoming_quests(
+        db: Session, within: timedelta, status: Optional[QuestStatus] = None, limit: int = 100
+    ) -> list[QuestModel]:
+        """
+        Retrieve quests starting between now and ``now + within``.
+
+        Args:
+            db (Session): Database session.
+            within (timedelta): How far ahead to look.
+            status (Optional[QuestStatus]): Only return quests with this status.
+            limit (int): Maximum number of quests to return.
+
+        Returns:
+            list[QuestModel]: Upcoming quests, starting soonest first.
+        """
+        now = datetime.now(timezone.utc)
+        return QuestRepository.get_upcoming_quests(db, now, now + within, status, limit)
 
     @staticmethod
     def create_quest(db: Session, quest_create: QuestCreate) -> QuestModel:
@@ -51,8 +296,52 @@ class QuestService:
 
         Returns:
             QuestModel: The newly created quest model instance.
+
+        Raises:
+            ValueError: If the creator wallet does not exist.
+        """
+        db_quest = QuestRepository.create_quest(db, quest_create)
+        _publish(db, "created", [db_quest])
+        return db_quest
+
+    @staticmethod
+    def create_quests_bulk(db: Session, payloads: list[dict]) -> list[dict]:
+        """
+        Create many quests at once, rejecting invalid rows without aborting the rest.
+
+        Rows are validated in one pass and creators are checked with a single query,
+        so the multi-row insert only ever sees rows that will succeed.
+
+        Args:
+            db (Session): Database session.
+            payloads (list[dict]): Raw ``QuestCreate`` payloads.
+
+        Returns:
+            list[dict]: One ``{"index", "quest_id", "error"}`` result per payload, in order.
         """
-        return QuestRepository.create_quest(db, quest_create)
+        results = [{"index": index, "quest_id": None, "error": None} for index in range(len(payloads))]
+        valid: list[tuple[int, QuestCreate]] = []
+        for index, payload in enumerate(payloads):
+            try:
+                valid.append((index, QuestCreate.model_validate(payload)))
+            except ValidationError as e:
+                results[index]["error"] = "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+                )
+
+        creators = UserRepository.get_existing_wallets(db, {quest.creator_wallet for _, quest in valid})
+        rows = []
+        for index, quest in valid:
+            if quest.creator_wallet not in creators:
+                results[index]["error"] = "creator_wallet: User not found"
+                continue
+            quest_id = uuid4()
+            results[index]["quest_id"] = quest_id
+            rows.append({"quest_id": quest_id, **quest.dict()})
+
+        db_quests = QuestRepository.create_quests(db, rows)
+        _publish(db, "created", db_quests)
+        return results
 
     @staticmethod
     def update_quest(db: Session, quest_id: UUID, quest_update: QuestUpdate) -> Optional[QuestModel]:
@@ -66,11 +355,84 @@ class QuestService:
 
         Returns:
             Optional[QuestModel]: Updated quest model instance or None if not found.
+
+        Raises:
+            ValueError: If the participant wallet does not exist.
+        """
+        updated = QuestRepository.update_quest(db, quest_id, quest_update)
+        if updated is None:
+            return None
+        db_quest, previous_status, previous_latitude, previous_longitude = updated
+        _publish(
+            db,
+            "status_changed" if db_quest.status != previous_status else "updated",
+            [db_quest],
+            previous_location=(previous_latitude, previous_longitude),
+        )
+        return db_quest
+
+    @staticmethod
+    def transition_quest(
+        db: Session, quest_id: UUID, action: str, participant_wallet: Optional[str] = None
+    ) -> Optional[QuestModel]:
+        """
+        Apply a state machine action to a quest.
+
+        ``accept`` assigns ``participant_wallet`` to an available quest; ``start`` and
+        ``complete`` require the quest to be held by ``participant_wallet``.
+
+        Args:
+            db (Session): Database session.
+            quest_id (UUID): Quest ID.
+            action (str): One of ``QUEST_TRANSITIONS``.
+            participant_wallet (Optional[str]): Wallet accepting or holding the quest.
+
+        Returns:
+            Optional[QuestModel]: Updated quest model instance or None if not found.
+
+        Raises:
+            ConflictError: If the quest is not in a state that allows the action.
+            ValueError: If the participant wallet does not exist.
         """
-        db_quest = QuestRepository.get_quest(db, quest_id)
-        if not db_quest:
+        from_statuses, to_status = QUEST_TRANSITIONS[action]
+        db_quest = QuestRepository.transition_quest(
+            db, quest_id, from_statuses, to_status, participant_wallet,
+            assign_participant=action == "accept",
+        )
+        if db_quest is not None:
+            _publish(db, "status_changed", [db_quest])
+            return db_quest
+
+        # Only the failure path pays for a second query to explain the conflict.
+        current = QuestRepository.get_quest(db, quest_id)
+        if current is None:
             return None
-        return QuestRepository.update_quest(db, db_quest, quest_update)
+        if current.status not in from_statuses:
+            raise ConflictError(f"Cannot {action} a quest that is {current.status.value}")
+        raise ConflictError("Quest is held by another participant")
+
+    @staticmethod
+    def expire_quests(db: Session, batch_size: int, max_batches: int) -> int:
+        """
+        Cancel open quests whose time window has ended, in bounded batches.
+
+        Args:
+            db (Session): Database session.
+            batch_size (int): Maximum number of quests per batch.
+            max_batches (int): Maximum number of batches in this run.
+
+        Returns:
+            int: Number of quests cancelled.
+        """
+        now = datetime.now(timezone.utc)
+        total = 0
+        for _ in range(max_batches):
+            expired = QuestRepository.expire_quests(db, now, batch_size)
+            _publish(db, "status_changed", expired, with_data=False)
+            total += len(expired)
+            if len(expired) < batch_size:
+                break
+        return total
 
     @staticmethod
     def delete_quest(db: Session, quest_id: UUID) -> bool:
@@ -84,8 +446,8 @@ class QuestService:
         Returns:
             bool: True if deletion was successful, False otherwise.
         """
-        db_quest = QuestRepository.get_quest(db, quest_id)
-        if not db_quest:
+        db_quest = QuestRepository.delete_quest(db, quest_id)
+        if db_quest is None:
             return False
-        QuestRepository.delete_quest(db, db_quest)
+        _publish(db, "deleted", [db_quest], with_data=False)
         return True
@@ -0,0 +1,43 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.api.repositories.settlement import SettlementRepository
+from app.api.services.leaderboard import publish_experience
+from app.core.logger import Logger
+
+
+class SettlementService:
+    """
+    Service class for quest reward settlement.
+    Drains the settlement backlog batch by batch using SettlementRepository.
+    """
+
+    @staticmethod
+    def settle_completed_quests(db: Session, batch_size: int, max_batches: Optional[int] = None) -> int:
+        """
+        Settle completed quests until the backlog is empty.
+
+        Each batch commits on its own, so a failure only rolls back the batch in flight.
+        New experience totals are published after each batch to keep leaderboard ranks current.
+
+        Args:
+            db (Session): Database session.
+            batch_size (int): Maximum number of quests per batch.
+            max_batches (Optional[int]): Stop after this many batches, or run until drained.
+
+        Returns:
+            int: Total number of quests settled.
+        """
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            settled, users = SettlementRepository.settle_completed_quests(db, batch_size)
+            publish_experience(db, "updated", users)
+            total += settled
+            batches += 1
+            if settled < batch_size:
+                break
+        if total:
+            Logger.info(f"Settled rewards for {total} quests in {batches} batches")
+        return total
@@ -1,9 +1,32 @@
 from sqlalchemy.orm import Session
 from typing import Optional
 
+from app.core.autocomplete import Suggestion, UsernameTrie
+from app.core.config import settings
+from app.core.errors import ConflictError
+from app.core.events import user_events
 from app.models.user import User as UserModel
 from app.schemas.user import UserCreate, UserUpdate
 from app.api.repositories.user import UserRepository
+from app.api.services.leaderboard import publish_experience
+
+_hot_users = UsernameTrie(capacity=settings.USER_SEARCH_HOT_USERS)
+
+
+def _update_hot_users(event: dict) -> None:
+    """
+    Keep the username trie in step with user events from every worker.
+    """
+    if event["type"] == "deleted":
+        _hot_users.remove(event["wallet_address"])
+    elif "username" in event:
+        _hot_users.upsert(event["wallet_address"], event["username"], event["experience_points"] or 0)
+    else:
+        _hot_users.set_experience(event["wallet_address"], event["experience_points"] or 0)
+
+
+if settings.USER_SEARCH_HOT_USERS > 0:
+    user_events.add_listener(_update_hot_users)
 
 
 class UserService:
@@ -19,6 +42,47 @@ class UserService:
         """
         return UserRepository.get_user(db, wallet_address)
 
+    @staticmethod
+    def get_users_by_wallets(db: Session, wallet_addresses: list[str]) -> list[Optional[UserModel]]:
+        """
+        Retrieve many users by wallet address, in request order with None where not found.
+        """
+        users = {
+            user.wallet_address: user
+            for user in UserRepository.get_users_by_wallets(db, list(set(wallet_addresses)))
+        }
+        return [users.get(wallet_address) for wallet_address in wallet_addresses]
+
+    @staticmethod
+    def search_users(db: Session, prefix: str, limit: int) -> list[Suggestion]:
+        """
+        Find users whose username starts with ``prefix``, ignoring case.
+
+        Answered from the in-memory trie of hot users when it has enough matches,
+        otherwise from the ``lower(username)`` index. Both order the matches most
+        experienced first, then by username, so results stay stable as the prefix grows.
+        """
+        if settings.USER_SEARCH_HOT_USERS > 0:
+            _hot_users.ensure_built(lambda: UserRepository.get_hot_users(db, settings.USER_SEARCH_HOT_USERS))
+            suggestions = _hot_users.search(prefix, limit)
+            if len(suggestions) >= limit:
+                return suggestions
+        return [
+            Suggestion(user.wallet_address, user.username, user.experience_points or 0)
+            for user in UserRepository.search_users(db, prefix, limit)
+        ]
+
+    @staticmethod
+    def resync_hot_users(db: Session) -> int:
+        """
+        Reload this process's username trie from the database.
+
+        Returns the number of users in the trie, or 0 if it has not been used yet.
+        """
+        if settings.USER_SEARCH_HOT_USERS <= 0:
+            return 0
+        return _hot_users.rebuild(lambda: UserRepository.get_hot_users(db, settings.USER_SEARCH_HOT_USERS))
+
     def get_users(db: Session) -> list[UserModel]:
         """
         Retrieve all users.
@@ -29,11 +93,14 @@ class UserService:
     def create_user(db: Session, user_create: UserCreate) -> UserModel:
         """
         Create a new user.
+
+        Raises ``ConflictError`` if the wallet address or email is already taken.
         """
-        existing_user = UserRepository.get_user(db, user_create.wallet_address)
-        if existing_user:
-            raise ValueError("User already exists")
-        return UserRepository.create_user(db, user_create)
+        db_user = UserRepository.create_user(db, user_create)
+        if db_user is None:
+            raise ConflictError("User already exists")
+        publish_experience(db, "created", [db_user])
+        return db_user
 
     @staticmethod
     def update_user(
@@ -42,18 +109,17 @@ class UserService:
         """
         Update an existing user.
         """
-        db_user = UserRepository.get_user(db, wallet_address)
-        if not db_user:
-            return None
-        return UserRepository.update_user(db, db_user, user_update)
+        db_user = UserRepository.update_user(db, wallet_address, user_update)
+        if db_user is not None and user_update.dict(exclude_unset=True).keys() & {"username", "experience_points"}:
+            publish_experience(db, "updated", [db_user])
+        return db_user
 
     @staticmethod
     def delete_user(db: Session, wallet_address: str) -> bool:
         """
         Delete a user.
         """
-        db_user = UserRepository.get_user(db, wallet_address)
-        if not db_user:
-            return False
-        UserRepository.delete_user(db, db_user)
-        return True
+        deleted = UserRepository.delete_user(db, wallet_address)
+        if deleted:
+            user_events.publish(db, [{"type": "deleted", "wallet_address": wallet_address, "experience_points": None}])
+        return deleted
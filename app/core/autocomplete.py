@@ -0,0 +1,181 @@
+import heapq
+import threading
+from typing import Callable, Iterable, NamedTuple, Optional
+
+
+class Suggestion(NamedTuple):
+    wallet_address: str
+    username: str
+    experience_points: int
+
+
+class _Node:
+    __slots__ = ("children", "members")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.members: set[str] = set()  # Wallets whose username has this node's prefix
+
+
+class UsernameTrie:
+    """
+    Case-insensitive prefix trie over the usernames of the most experienced users.
+
+    Every node keeps the wallets below it, so a lookup is a walk down the prefix
+    plus a sort of the matches, independent of the size of the users table. The
+    trie holds at most ``capacity`` users; when a user outside it gains enough
+    experience, the least experienced member makes room.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self._root = _Node()
+        self._users: dict[str, Suggestion] = {}
+        # (experience_points, wallet) of every member; stale entries are skipped on eviction.
+        self._heap: list[tuple[int, str]] = []
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._touched: Optional[set[str]] = None
+
+    def ensure_built(self, loader: Callable[[], Iterable[tuple[str, str, int]]]) -> None:
+        """
+        Load the initial users once. Events applied while loading win over the snapshot.
+        """
+        if self._built:
+            return
+        with self._build_lock:
+            if self._built:
+                return
+            with self._lock:
+                self._touched = set()
+            rows = list(loader())
+            with self._lock:
+                for wallet_address, username, experience_points in rows:
+                    if wallet_address not in self._touched:
+                        self._upsert(wallet_address, username, experience_points)
+                self._touched = None
+                self._built = True
+
+    def rebuild(self, loader: Callable[[], Iterable[tuple[str, str, int]]]) -> int:
+        """
+        Replace the members with a fresh snapshot, dropping any drift from missed events.
+
+        Events applied while loading win over the snapshot. Does nothing before the
+        first ``ensure_built``.
+
+        Returns:
+            int: Number of users in the trie, or 0 if it was never built.
+        """
+        if not self._built:
+            return 0
+        with self._build_lock:
+            with self._lock:
+                self._touched = set()
+            try:
+                rows = list(loader())
+            except BaseException:
+                with self._lock:
+                    self._touched = None
+                raise
+            with self._lock:
+                kept = [
+                    self._users[wallet_address] for wallet_address in self._touched if wallet_address in self._users
+                ]
+                self._root = _Node()
+                self._users = {}
+                self._heap = []
+                for wallet_address, username, experience_points in rows:
+                    if wallet_address not in self._touched:
+                        self._upsert(wallet_address, username, experience_points)
+                for user in kept:
+                    self._upsert(user.wallet_address, user.username, user.experience_points)
+                self._touched = None
+                return len(self._users)
+
+    def upsert(self, wallet_address: str, username: Optional[str], experience_points: int) -> None:
+        with self._lock:
+            self._touch(wallet_address)
+            self._upsert(wallet_address, username, experience_points)
+
+    def set_experience(self, wallet_address: str, experience_points: int) -> None:
+        """
+        Record a change of experience for a user whose username is unknown to the caller.
+        """
+        with self._lock:
+            self._touch(wallet_address)
+            current = self._users.get(wallet_address)
+            if current is not None:
+                self._upsert(wallet_address, current.username, experience_points)
+
+    def remove(self, wallet_address: str) -> None:
+        with self._lock:
+            self._touch(wallet_address)
+            self._remove(wallet_address)
+
+    def search(self, prefix: str, limit: int) -> list[Suggestion]:
+        """
+        Members whose username starts with ``prefix``, most experienced first.
+        """
+        with self._lock:
+            node = self._root
+            for char in prefix.lower():
+                node = node.children.get(char)
+                if node is None:
+                    return []
+            matches = [self._users[wallet_address] for wallet_address in node.members]
+        return heapq.nsmallest(limit, matches, key=lambda user: (-user.experience_points, user.username.lower()))
+
+    def _touch(self, wallet_address: str) -> None:
+        if self._touched is not None:
+            self._touched.add(wallet_address)
+
+    def _upsert(self, wallet_address: str, username: Optional[str], experience_points: int) -> None:
+        current = self._users.get(wallet_address)
+        if not username:
+            self._remove(wallet_address)
+            return
+        if current is None and len(self._users) >= self.capacity and not self._evict_below(experience_points):
+            return
+        if current is None or current.username != username:
+            self._remove(wallet_address)
+            node = self._root
+            node.members.add(wallet_address)
+            for char in username.lower():
+                node = node.children.setdefault(char, _Node())
+                node.members.add(wallet_address)
+        self._users[wallet_address] = Suggestion(wallet_address, username, experience_points)
+        heapq.heappush(self._heap, (experience_points, wallet_address))
+        if len(self._heap) > 4 * max(self.capacity, 1):
+            self._heap = [(user.experience_points, user.wallet_address) for user in self._users.values()]
+            heapq.heapify(self._heap)
+
+    def _evict_below(self, experience_points: int) -> bool:
+        """
+        Drop the least experienced member if it has fewer than ``experience_points``.
+        """
+        while self._heap:
+            lowest, wallet_address = self._heap[0]
+            member = self._users.get(wallet_address)
+            if member is None or member.experience_points != lowest:
+                heapq.heappop(self._heap)
+                continue
+            if lowest >= experience_points:
+                return False
+            self._remove(wallet_address)
+            return True
+        return False
+
+    def _remove(self, wallet_address: str) -> None:
+        user = self._users.pop(wallet_address, None)
+        if user is None:
+            return
+        node = self._root
+        node.members.discard(wallet_address)
+        for char in user.username.lower():
+            child = node.children[char]
+            child.members.discard(wallet_address)
+            if not child.members:
+                del node.children[char]
+                return
+            node = child
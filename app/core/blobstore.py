@@ -0,0 +1,105 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+
+class BlobWriter:
+    """
+    Streams bytes into a temporary file while hashing them, then moves the file
+    to its content address on :meth:`commit`.
+    """
+
+    def __init__(self, store: "BlobStore", max_size: Optional[int] = None):
+        self._store = store
+        self._max_size = max_size
+        self._hash = hashlib.sha256()
+        self._size = 0
+        store.tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=store.tmp_dir)
+        self._file = os.fdopen(fd, "wb")
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk.
+
+        Raises:
+            ValueError: If the blob grows past ``max_size``.
+        """
+        self._size += len(chunk)
+        if self._max_size is not None and self._size > self._max_size:
+            raise ValueError(f"Blob exceeds {self._max_size} bytes")
+        self._hash.update(chunk)
+        self._file.write(chunk)
+
+    def commit(self) -> tuple[str, int]:
+        """
+        Store the blob under its SHA-256, discarding it if an identical blob exists.
+
+        Returns:
+            tuple[str, int]: The hex SHA-256 and size in bytes.
+        """
+        self._file.close()
+        sha256 = self._hash.hexdigest()
+        path = self._store.path(sha256)
+        if path.exists():
+            os.unlink(self._tmp_path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_path, path)
+        return sha256, self._size
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.unlink(self._tmp_path)
+
+    def __enter__(self) -> "BlobWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None or not self._file.closed:
+            self.abort()
+
+
+class BlobStore:
+    """
+    Content-addressed file store keyed by SHA-256.
+
+    Blobs live at ``<root>/<aa>/<bb>/<sha256>`` and are immutable, so identical
+    content is stored once and any path can be cached forever.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.tmp_dir = self.root / "tmp"
+
+    def path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def exists(self, sha256: str) -> bool:
+        return self.path(sha256).exists()
+
+    def writer(self, max_size: Optional[int] = None) -> BlobWriter:
+        return BlobWriter(self, max_size)
+
+    def put(self, data: bytes) -> tuple[str, int]:
+        """
+        Store bytes and return their SHA-256 and size.
+        """
+        with self.writer() as writer:
+            writer.write(data)
+            return writer.commit()
+
+    def read(self, sha256: str) -> bytes:
+        return self.path(sha256).read_bytes()
+
+
+blob_store = BlobStore(settings.BLOB_STORE_PATH)
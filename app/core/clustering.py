@@ -0,0 +1,209 @@
+import math
+import threading
+from typing import Callable, Iterable, NamedTuple, Optional
+
+from app.core.geo import BoundingBox
+
+_MAX_MERCATOR_LATITUDE = 85.05112878
+
+
+class Cluster(NamedTuple):
+    latitude: float
+    longitude: float
+    count: int
+    quest_id: Optional[str]  # Set when the cluster is a single quest
+
+
+def _project(latitude: float, longitude: float) -> tuple[float, float]:
+    """
+    Web Mercator projection onto the unit square, as used by map tiles.
+    """
+    latitude = min(max(latitude, -_MAX_MERCATOR_LATITUDE), _MAX_MERCATOR_LATITUDE)
+    sin_lat = math.sin(math.radians(latitude))
+    x = longitude / 360.0 + 0.5
+    y = 0.5 - 0.25 * math.log((1 + sin_lat) / (1 - sin_lat)) / math.pi
+    return min(max(x, 0.0), 1.0 - 1e-12), min(max(y, 0.0), 1.0 - 1e-12)
+
+
+def _unproject(x: float, y: float) -> tuple[float, float]:
+    longitude = (x - 0.5) * 360.0
+    latitude = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+    return latitude, longitude
+
+
+class _Cell:
+    __slots__ = ("sum_x", "sum_y", "members")
+
+    def __init__(self):
+        self.sum_x = 0.0
+        self.sum_y = 0.0
+        self.members: set[str] = set()
+
+
+class QuestClusterIndex:
+    """
+    Hierarchical grid of quest positions for map clustering.
+
+    Every zoom level keeps a grid whose cells are ``radius_px`` screen pixels
+    wide at that zoom, with a running count and coordinate sum per cell, so a
+    cluster's centroid is available without touching its members. Like
+    supercluster it answers a viewport query from one precomputed level, but
+    because cells are fixed, adding, moving or removing a quest is O(zoom levels)
+    instead of a rebuild.
+    """
+
+    def __init__(self, max_zoom: int = 16, radius_px: int = 60, tile_size: int = 256, max_cells: int = 4096):
+        self.max_zoom = max_zoom
+        self.max_cells = max_cells
+        self._grid_sizes = [math.ceil(tile_size * (1 << z) / radius_px) for z in range(max_zoom + 1)]
+        self._levels: list[dict[tuple[int, int], _Cell]] = [{} for _ in range(max_zoom + 1)]
+        self._positions: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._touched: Optional[set[str]] = None
+
+    def ensure_built(self, loader: Callable[[], Iterable[tuple[str, float, float]]]) -> None:
+        """
+        Load the initial positions once. Events applied while loading win over the snapshot.
+        """
+        if self._built:
+            return
+        with self._build_lock:
+            if self._built:
+                return
+            with self._lock:
+                self._touched = set()
+            rows = list(loader())
+            with self._lock:
+                for quest_id, latitude, longitude in rows:
+                    if quest_id not in self._touched:
+                        self._upsert(quest_id, latitude, longitude)
+                self._touched = None
+                self._built = True
+
+    def rebuild(self, loader: Callable[[], Iterable[tuple[str, float, float]]]) -> int:
+        """
+        Replace the positions with a fresh snapshot, dropping any drift from missed events.
+
+        Events applied while loading win over the snapshot. Does nothing before the
+        first ``ensure_built``.
+
+        Returns:
+            int: Number of quests in the index, or 0 if it was never built.
+        """
+        if not self._built:
+            return 0
+        with self._build_lock:
+            with self._lock:
+                self._touched = set()
+            try:
+                rows = list(loader())
+            except BaseException:
+                with self._lock:
+                    self._touched = None
+                raise
+            with self._lock:
+                kept = {
+                    quest_id: self._positions[quest_id] for quest_id in self._touched if quest_id in self._positions
+                }
+                self._levels = [{} for _ in range(self.max_zoom + 1)]
+                self._positions = {}
+                for quest_id, latitude, longitude in rows:
+                    if quest_id not in self._touched:
+                        self._insert(quest_id, *_project(latitude, longitude))
+                for quest_id, (x, y) in kept.items():
+                    self._insert(quest_id, x, y)
+                self._touched = None
+                return len(self._positions)
+
+    def upsert(self, quest_id: str, latitude: float, longitude: float) -> None:
+        with self._lock:
+            self._touch(quest_id)
+            self._upsert(quest_id, latitude, longitude)
+
+    def remove(self, quest_id: str) -> None:
+        with self._lock:
+            self._touch(quest_id)
+            self._remove(quest_id)
+
+    def query(self, bbox: BoundingBox, zoom: int) -> list[Cluster]:
+        """
+        Clusters with a centroid inside ``bbox`` at ``zoom``.
+
+        Raises:
+            ValueError: If the viewport spans more than ``max_cells`` grid cells.
+        """
+        zoom = min(max(zoom, 0), self.max_zoom)
+        n = self._grid_sizes[zoom]
+        min_x, max_y = _project(bbox.min_latitude, bbox.min_longitude)
+        max_x, min_y = _project(bbox.max_latitude, bbox.max_longitude)
+        if bbox.min_longitude <= bbox.max_longitude:
+            x_ranges = [(int(min_x * n), int(max_x * n))]
+        else:
+            x_ranges = [(int(min_x * n), n - 1), (0, int(max_x * n))]
+        y_range = (int(min_y * n), int(max_y * n))
+        span = sum(hi - lo + 1 for lo, hi in x_ranges) * (y_range[1] - y_range[0] + 1)
+        if span > self.max_cells:
+            raise ValueError("bbox is too large for this zoom level")
+
+        clusters = []
+        with self._lock:
+            level = self._levels[zoom]
+            if span <= len(level):
+                keys = (
+                    (cx, cy)
+                    for lo, hi in x_ranges for cx in range(lo, hi + 1)
+                    for cy in range(y_range[0], y_range[1] + 1)
+                )
+                cells = ((key, level.get(key)) for key in keys)
+            else:
+                cells = (
+                    (key, cell) for key, cell in level.items()
+                    if any(lo <= key[0] <= hi for lo, hi in x_ranges) and y_range[0] <= key[1] <= y_range[1]
+                )
+            for _, cell in cells:
+                if cell is None:
+                    continue
+                count = len(cell.members)
+                latitude, longitude = _unproject(cell.sum_x / count, cell.sum_y / count)
+                if not bbox.contains(latitude, longitude):
+                    continue
+                quest_id = next(iter(cell.members)) if count == 1 else None
+                clusters.append(Cluster(latitude, longitude, count, quest_id))
+        return clusters
+
+    def _touch(self, quest_id: str) -> None:
+        if self._touched is not None:
+            self._touched.add(quest_id)
+
+    def _upsert(self, quest_id: str, latitude: float, longitude: float) -> None:
+        self._remove(quest_id)
+        self._insert(quest_id, *_project(latitude, longitude))
+
+    def _insert(self, quest_id: str, x: float, y: float) -> None:
+        self._positions[quest_id] = (x, y)
+        for z, level in enumerate(self._levels):
+            n = self._grid_sizes[z]
+            cell = level.get((int(x * n), int(y * n)))
+            if cell is None:
+                cell = level[(int(x * n), int(y * n))] = _Cell()
+            cell.sum_x += x
+            cell.sum_y += y
+            cell.members.add(quest_id)
+
+    def _remove(self, quest_id: str) -> None:
+        position = self._positions.pop(quest_id, None)
+        if position is None:
+            return
+        x, y = position
+        for z, level in enumerate(self._levels):
+            n = self._grid_sizes[z]
+            key = (int(x * n), int(y * n))
+            cell = level[key]
+            cell.members.discard(quest_id)
+            if not cell.members:
+                del level[key]
+            else:
+                cell.sum_x -= x
+                cell.sum_y -= y
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -7,6 +9,65 @@ class Settings(BaseSettings):
     POSTGRES_DB: str
     POSTGRES_HOST: str
 
+    # Quest search: distance at which relevance is halved
+    SEARCH_DISTANCE_SCALE_M: float = 5000.0
+
+    # Map clustering
+    CLUSTER_MAX_ZOOM: int = 16
+    CLUSTER_RADIUS_PX: int = 60
+    CLUSTER_MAX_CELLS: int = 4096
+    CLUSTER_RESYNC_INTERVAL_SECONDS: float = 600.0
+
+    # Bulk endpoints
+    QUEST_BULK_CREATE_MAX: int = 5000
+    ITEM_TRANSFER_MAX: int = 5000
+    BATCH_GET_MAX: int = 5000
+
+    # Content-addressed storage for item images
+    BLOB_STORE_PATH: str = "data/blobs"
+    ITEM_IMAGE_MAX_BYTES: int = 10 * 1024 * 1024
+    ITEM_IMAGE_CONTENT_TYPES: list[str] = ["image/png", "image/jpeg", "image/webp", "image/gif"]
+
+    # Resized item images, by preset name: longest side, format and quality
+    DERIVATIVE_CACHE_PATH: str = "data/derivatives"
+    DERIVATIVE_WORKERS: Optional[int] = None
+    ITEM_IMAGE_DERIVATIVES: dict[str, dict] = {
+        "thumb": {"size": 128, "format": "webp", "quality": 80},
+        "small": {"size": 256, "format": "webp", "quality": 80},
+        "medium": {"size": 512, "format": "webp", "quality": 85},
+    }
+
+    # NFT metadata documents served at /metadata/{item_id}.json
+    PUBLIC_BASE_URL: str = "http://localhost:8000"
+    METADATA_CACHE_PATH: str = "data/metadata"
+    METADATA_MAX_AGE_SECONDS: int = 86400
+
+    # Leaderboard: width of the experience buckets in the in-process rank index
+    LEADERBOARD_BUCKET_WIDTH: int = 100
+    LEADERBOARD_RESYNC_INTERVAL_SECONDS: float = 600.0
+
+    # Username autocomplete: users kept in the in-memory trie (0 disables it)
+    USER_SEARCH_HOT_USERS: int = 10000
+
+    # Background jobs
+    SCHEDULER_ENABLED: bool = True
+
+    # Cross-worker event delivery over Postgres LISTEN/NOTIFY
+    EVENTS_LISTEN_ENABLED: bool = True
+
+    # Reward settlement
+    SETTLEMENT_BATCH_SIZE: int = 200
+    SETTLEMENT_INTERVAL_SECONDS: float = 30.0
+
+    # Experience ledger aggregation
+    XP_LEDGER_BATCH_SIZE: int = 5000
+    XP_LEDGER_INTERVAL_SECONDS: float = 5.0
+
+    # Quest expiry sweeper
+    QUEST_EXPIRY_INTERVAL_SECONDS: float = 60.0
+    QUEST_EXPIRY_BATCH_SIZE: int = 500
+    QUEST_EXPIRY_MAX_BATCHES: int = 20
+
     class Config:
         env_file = ".env"
 
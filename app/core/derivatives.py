@@ -0,0 +1,158 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from PIL import Image, ImageOps
+
+from app.core.blobstore import BlobStore, blob_store
+from app.core.config import settings
+
+_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+    "png": ("PNG", "image/png"),
+}
+
+
+class DerivativeSpec(NamedTuple):
+    """
+    Parameters of one derivative: longest side in pixels, output format and quality.
+    """
+    size: int
+    format: str = "webp"
+    quality: int = 80
+
+    @classmethod
+    def from_settings(cls, params: dict) -> "DerivativeSpec":
+        spec = cls(**params)
+        if spec.format not in _FORMATS:
+            raise ValueError(f"Unsupported derivative format {spec.format!r}")
+        return spec
+
+    @property
+    def key(self) -> str:
+        return f"s{self.size}-q{self.quality}.{self.format}"
+
+    @property
+    def media_type(self) -> str:
+        return _FORMATS[self.format][1]
+
+
+def render_derivative(source: str, destination: str, spec: DerivativeSpec) -> None:
+    """
+    Resize ``source`` into ``destination``. Runs in a worker process.
+    """
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail((spec.size, spec.size))
+        pil_format = _FORMATS[spec.format][0]
+        if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(destination))
+        try:
+            with os.fdopen(fd, "wb") as out:
+                image.save(out, pil_format, quality=spec.quality)
+            os.replace(tmp_path, destination)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class DerivativeCache:
+    """
+    On-disk cache of resized images keyed by source SHA-256 plus parameters.
+
+    Derivatives are rendered lazily on a process pool, so resizing never runs on
+    the event loop or the request threadpool; concurrent requests for the same
+    derivative share one render.
+    """
+
+    def __init__(self, store: BlobStore, root: str, max_workers: Optional[int] = None):
+        self._store = store
+        self.root = Path(root)
+        self._max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inflight: dict[Path, asyncio.Future] = {}
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn rather than fork: the server process runs threads that fork would copy mid-flight
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def path(self, source_sha256: str, spec: DerivativeSpec) -> Path:
+        return self.root / source_sha256[:2] / source_sha256 / spec.key
+
+    async def get(self, source_sha256: str, spec: DerivativeSpec) -> Path:
+        """
+        Return the derivative's path, rendering it first if it is not cached.
+
+        Raises:
+            BrokenProcessPool: If a worker died; the pool is replaced for the next call.
+        """
+        path = self.path(source_sha256, spec)
+        if path.exists():
+            return path
+        future = self._inflight.get(path)
+        if future is None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pool = self.pool
+            future = asyncio.get_running_loop().run_in_executor(
+                pool, render_derivative, str(self._store.path(source_sha256)), str(path), spec
+            )
+            self._inflight[path] = future
+            future.add_done_callback(lambda _: self._inflight.pop(path, None))
+        else:
+            pool = None
+        try:
+            await asyncio.shield(future)
+        except BrokenProcessPool:
+            if pool is not None and self._pool is pool:
+                self._pool = None
+                pool.shutdown(wait=False)
+            raise
+        return path
+
+    def prewarm(self, source_sha256s: Iterable[str], specs: Iterable[DerivativeSpec]) -> int:
+        """
+        Render every missing derivative for the given sources. Blocks until done.
+
+        Returns:
+            int: Number of derivatives rendered.
+        """
+        specs = list(specs)
+        futures = []
+        for source_sha256 in source_sha256s:
+            if not self._store.exists(source_sha256):
+                continue
+            for spec in specs:
+                path = self.path(source_sha256, spec)
+                if path.exists():
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                futures.append(
+                    self.pool.submit(render_derivative, str(self._store.path(source_sha256)), str(path), spec)
+                )
+        for future in futures:
+            future.result()
+        return len(futures)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+DERIVATIVE_SPECS = {
+    name: DerivativeSpec.from_settings(params) for name, params in settings.ITEM_IMAGE_DERIVATIVES.items()
+}
+
+derivative_cache = DerivativeCache(blob_store, settings.DERIVATIVE_CACHE_PATH, settings.DERIVATIVE_WORKERS)
@@ -0,0 +1,160 @@
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from app.core.config import settings
+from app.core.events import item_events
+
+try:
+    import brotli
+except ImportError:  # Optional: documents are still served gzip-compressed and uncompressed
+    brotli = None
+
+_FILENAMES = {None: "document", "gzip": "document.gz", "br": "document.br"}
+
+
+class CachedDocument(NamedTuple):
+    etag: str
+    body: bytes
+    encoding: Optional[str]  # Content-Encoding of ``body``, None when uncompressed
+
+
+class DocumentCache:
+    """
+    On-disk cache of rendered documents, each stored alongside precompressed copies.
+
+    An entry is a directory holding the document, its gzip (and, if the ``brotli``
+    package is installed, brotli) encodings and an ETag derived from the content.
+    Entries are written to a temporary directory and renamed into place, and
+    removed by renaming them away first, so readers in any worker process see
+    either a whole entry or none.
+
+    Every invalidation also replaces the key's generation token. A filler reads
+    :meth:`generation` before loading the source row and passes it to
+    :meth:`put`, which discards the write if the key was invalidated in between,
+    so a document rendered from a stale row is never left behind.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.tmp_dir = self.root / "tmp"
+
+    @property
+    def encodings(self) -> tuple[Optional[str], ...]:
+        return ("br", "gzip", None) if brotli is not None else ("gzip", None)
+
+    def _entry(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.root / digest[:2] / digest
+
+    def _generation_file(self, key: str) -> Path:
+        entry = self._entry(key)
+        return entry.with_name(f"{entry.name}.generation")
+
+    def generation(self, key: str) -> str:
+        """
+        Token identifying the key's current generation; changes on every invalidation.
+        """
+        try:
+            return self._generation_file(key).read_text()
+        except FileNotFoundError:
+            return ""
+
+    def get(self, key: str, accepted: Iterable[str] = ()) -> Optional[CachedDocument]:
+        """
+        Return the cached document in the best encoding the client accepts.
+
+        Args:
+            key (str): Document key.
+            accepted (Iterable[str]): Content codings the client accepts.
+
+        Returns:
+            Optional[CachedDocument]: The document, or None if it is not cached.
+        """
+        accepted = set(accepted)
+        entry = self._entry(key)
+        try:
+            etag = (entry / "etag").read_text()
+            for encoding in self.encodings:
+                if encoding is None or encoding in accepted:
+                    body = (entry / _FILENAMES[encoding]).read_bytes()
+                    suffix = f"-{encoding}" if encoding else ""
+                    return CachedDocument(f'"{etag}{suffix}"', body, encoding)
+        except FileNotFoundError:
+            return None
+        return None
+
+    def put(self, key: str, body: bytes, generation: str) -> None:
+        """
+        Store a document and its compressed encodings, replacing any previous entry.
+
+        Args:
+            key (str): Document key.
+            body (bytes): Rendered document.
+            generation (str): :meth:`generation` read before the document's source was loaded.
+                The write is dropped if the key has been invalidated since.
+        """
+        if self.generation(key) != generation:
+            return
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=self.tmp_dir))
+        try:
+            (staging / _FILENAMES[None]).write_bytes(body)
+            (staging / _FILENAMES["gzip"]).write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+            if brotli is not None:
+                (staging / _FILENAMES["br"]).write_bytes(brotli.compress(body, quality=11))
+            (staging / "etag").write_text(hashlib.sha256(body).hexdigest()[:32])
+            entry = self._entry(key)
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            self._remove(entry)
+            try:
+                os.rename(staging, entry)
+            except OSError:
+                return  # Another worker stored the entry first
+            # An invalidation that overlapped the rename replaced the generation before
+            # removing the entry; if its removal ran before our rename, undo ours here.
+            if self.generation(key) != generation:
+                self._remove(entry)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove a document from the cache, if present, and start a new generation for its key.
+        """
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        # The new generation must be visible before the entry goes, so a concurrent
+        # put either sees it and backs out or has its entry removed below.
+        token = self.tmp_dir / f"generation-{uuid.uuid4().hex}"
+        token.write_text(uuid.uuid4().hex)
+        os.replace(token, self._generation_file(key))
+        self._remove(entry)
+
+    def _remove(self, entry: Path) -> None:
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        doomed = self.tmp_dir / f"stale-{uuid.uuid4().hex}"
+        try:
+            os.rename(entry, doomed)
+        except FileNotFoundError:
+            return
+        shutil.rmtree(doomed, ignore_errors=True)
+
+
+metadata_cache = DocumentCache(settings.METADATA_CACHE_PATH)
+
+
+def _invalidate_metadata(event: dict) -> None:
+    """
+    Drop metadata documents changed by any worker, on any host.
+    """
+    metadata_cache.invalidate(event["item_id"])
+
+
+item_events.add_listener(_invalidate_metadata)
@@ -0,0 +1,5 @@
+class ConflictError(ValueError):
+    """
+    Raised when a write conflicts with existing data, such as a duplicate key or
+    rows that still reference the one being deleted. Routers map it to 409.
+    """
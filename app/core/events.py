@@ -0,0 +1,184 @@
+import asyncio
+import json
+import select
+import threading
+import uuid
+from typing import Callable, Optional
+
+import psycopg2
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.logger import Logger
+
+# Identifies this process so the NOTIFY listener can skip its own events.
+ORIGIN = uuid.uuid4().hex
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more.
+_MAX_NOTIFY_PAYLOAD = 7900
+
+
+class Subscription:
+    """
+    A subscriber's queue of events, consumed from the event loop it was created on.
+    """
+
+    def __init__(self, predicate: Callable[[dict], bool], maxsize: int):
+        self.predicate = predicate
+        self.dropped = 0
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def get(self) -> dict:
+        return await self._queue.get()
+
+    def _offer(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow client loses events rather than stalling every publisher.
+            self.dropped += 1
+
+
+class EventBus:
+    """
+    Fans events out to subscribers in this process and, through Postgres
+    NOTIFY on ``channel``, to the buses of every other worker.
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._subscriptions: set[Subscription] = set()
+        self._listeners: list[Callable[[dict], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, predicate: Callable[[dict], bool], maxsize: int = 256) -> Subscription:
+        """
+        Subscribe to events matching ``predicate``. Must be called from a running event loop.
+        """
+        subscription = Subscription(predicate, maxsize)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        """
+        Register a synchronous callback invoked for every event, from the publishing thread.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def dispatch(self, event: dict) -> None:
+        """
+        Deliver an event to local subscribers and listeners only. Thread-safe.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                Logger.error(f"Event listener on {self.channel} failed: {e!r}")
+        for subscription in subscriptions:
+            try:
+                if subscription.predicate(event):
+                    subscription._loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                # The subscriber's loop has closed; it will never read again.
+                self.unsubscribe(subscription)
+
+    def publish(self, db: Session, events: list[dict]) -> None:
+        """
+        Dispatch committed events locally and NOTIFY the other workers in one statement.
+
+        Call this after the write has been committed. Failures to notify are logged,
+        not raised, since the write itself already succeeded.
+        """
+        if not events:
+            return
+        for event in events:
+            self.dispatch(event)
+        try:
+            db.execute(
+                text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+                {"channel": self.channel, "payloads": [self._encode(event) for event in events]},
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            Logger.warning(f"Failed to notify {self.channel}: {e!r}")
+
+    @staticmethod
+    def _encode(event: dict) -> str:
+        payload = json.dumps({**event, "origin": ORIGIN}, separators=(",", ":"), default=str)
+        if len(payload.encode()) > _MAX_NOTIFY_PAYLOAD and event.get("data") is not None:
+            # Too large for NOTIFY: remote subscribers get the envelope without the body.
+            payload = json.dumps({**event, "data": None, "origin": ORIGIN}, separators=(",", ":"), default=str)
+        return payload
+
+
+class NotifyListener:
+    """
+    Background thread that LISTENs on each bus's channel and re-dispatches
+    events published by other workers.
+    """
+
+    def __init__(self, dsn: str, buses: list[EventBus]):
+        self._dsn = dsn
+        self._buses = {bus.channel: bus for bus in buses}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notify-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception as e:
+                Logger.warning(f"NOTIFY listener disconnected: {e!r}; retrying in {backoff:.0f}s")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self) -> None:
+        conn = psycopg2.connect(self._dsn)
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                for channel in self._buses:
+                    cursor.execute(f'LISTEN "{channel}"')
+            while not self._stop.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    event = json.loads(notify.payload)
+                    if event.pop("origin", None) == ORIGIN:
+                        continue
+                    bus = self._buses.get(notify.channel)
+                    if bus is not None:
+                        bus.dispatch(event)
+        finally:
+            conn.close()
+
+
+quest_events = EventBus("quest_events")
+user_events = EventBus("user_events")
+item_events = EventBus("item_events")
@@ -0,0 +1,73 @@
+import json
+import re
+from typing import Any, Iterable, NamedTuple
+
+ATTRIBUTE_PREFIX = "attr."
+MAX_ATTRIBUTE_FILTERS = 10
+
+# Comparison operators accepted as ``attr.<key>[<op>]``; ``eq`` when omitted.
+ATTRIBUTE_OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte")
+RANGE_OPERATORS = ("gt", "gte", "lt", "lte")
+
+_NAME_PATTERN = re.compile(r"^attr\.([A-Za-z0-9_]{1,64})(?:\[([a-z]+)\])?$")
+
+
+class AttributeFilter(NamedTuple):
+    key: str
+    op: str
+    value: Any
+
+
+def _reject_constant(name: str):
+    raise ValueError(f"{name} is not a valid attribute value")
+
+
+def _parse_value(raw: str, op: str) -> Any:
+    if op in RANGE_OPERATORS:
+        try:
+            value = json.loads(raw, parse_constant=_reject_constant)
+        except ValueError:
+            value = None
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Attribute filter [{op}] needs a number, got {raw!r}")
+        return value
+    # JSON scalars (numbers, true/false/null, "quoted strings") are matched as typed values;
+    # anything else is matched as a plain string.
+    try:
+        value = json.loads(raw, parse_constant=_reject_constant)
+    except ValueError:
+        return raw
+    return raw if isinstance(value, (dict, list)) else value
+
+
+def parse_attribute_filters(params: Iterable[tuple[str, str]]) -> list[AttributeFilter]:
+    """
+    Collect ``attr.<key>[<op>]=<value>`` query parameters as filters on item attributes.
+
+    ``attr.rarity=legendary`` matches on equality, ``attr.damage[gt]=100`` compares
+    numerically. Values are read as JSON scalars where possible, so ``attr.level=3``
+    matches the number 3 and ``attr.level="3"`` the string.
+
+    Args:
+        params (Iterable[tuple[str, str]]): Query parameters as ``(name, value)`` pairs.
+
+    Returns:
+        list[AttributeFilter]: One filter per ``attr.`` parameter, in request order.
+
+    Raises:
+        ValueError: If a name, operator or value is malformed, or there are too many filters.
+    """
+    filters = []
+    for name, raw in params:
+        if not name.startswith(ATTRIBUTE_PREFIX):
+            continue
+        match = _NAME_PATTERN.match(name)
+        if match is None:
+            raise ValueError(f"Invalid attribute filter {name!r}")
+        key, op = match.group(1), match.group(2) or "eq"
+        if op not in ATTRIBUTE_OPERATORS:
+            raise ValueError(f"Unknown attribute operator {op!r}, expected one of {list(ATTRIBUTE_OPERATORS)}")
+        filters.append(AttributeFilter(key, op, _parse_value(raw, op)))
+    if len(filters) > MAX_ATTRIBUTE_FILTERS:
+        raise ValueError(f"At most {MAX_ATTRIBUTE_FILTERS} attribute filters are allowed")
+    return filters
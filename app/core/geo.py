@@ -0,0 +1,153 @@
+import math
+
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE = 111_320.0
+
+# Precision stored on quests.geohash (~4.8m x 4.8m cells).
+GEOHASH_PRECISION = 9
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """
+    Encode a coordinate as a geohash string.
+
+    Args:
+        latitude (float): Latitude in degrees.
+        longitude (float): Longitude in degrees.
+        precision (int): Number of base32 characters to produce.
+
+    Returns:
+        str: The geohash of the cell containing the coordinate.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if longitude >= mid:
+                bits = (bits << 1) | 1
+                lon_range[0] = mid
+            else:
+                bits <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> tuple[float, float]:
+    """
+    Size of a geohash cell in degrees.
+
+    Args:
+        precision (int): Geohash length.
+
+    Returns:
+        tuple[float, float]: (latitude degrees, longitude degrees) covered by one cell.
+    """
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def covering_geohashes(latitude: float, longitude: float, radius_m: float) -> set[str]:
+    """
+    Geohash prefixes whose cells together cover a circle.
+
+    Picks the longest prefix whose cell is at least ``radius_m`` wide and tall at
+    the given latitude, then returns the cell containing the centre plus its eight
+    neighbours, so every point within ``radius_m`` falls in one of them.
+
+    Args:
+        latitude (float): Latitude of the centre in degrees.
+        longitude (float): Longitude of the centre in degrees.
+        radius_m (float): Radius of the circle in metres.
+
+    Returns:
+        set[str]: Geohash prefixes to scan.
+    """
+    cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+    precision = 1
+    for candidate in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lon_deg = geohash_cell_size(candidate)
+        if lat_deg * METERS_PER_DEGREE >= radius_m and lon_deg * METERS_PER_DEGREE * cos_lat >= radius_m:
+            precision = candidate
+            break
+
+    lat_deg, lon_deg = geohash_cell_size(precision)
+    cells = set()
+    for d_lat in (-1, 0, 1):
+        lat = min(max(latitude + d_lat * lat_deg, -90.0), 90.0)
+        for d_lon in (-1, 0, 1):
+            lon = (longitude + d_lon * lon_deg + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(lat, lon, precision))
+    return cells
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two coordinates in metres.
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class BoundingBox:
+    """
+    A longitude/latitude rectangle, as sent by map clients.
+
+    ``min_longitude > max_longitude`` describes a box crossing the antimeridian.
+    """
+
+    def __init__(self, min_longitude: float, min_latitude: float, max_longitude: float, max_latitude: float):
+        self.min_longitude = min_longitude
+        self.min_latitude = min_latitude
+        self.max_longitude = max_longitude
+        self.max_latitude = max_latitude
+
+    @classmethod
+    def parse(cls, value: str) -> "BoundingBox":
+        """
+        Parse ``"min_lon,min_lat,max_lon,max_lat"``.
+
+        Raises:
+            ValueError: If the string is not four coordinates in range.
+        """
+        parts = value.split(",")
+        if len(parts) != 4:
+            raise ValueError("bbox must be min_lon,min_lat,max_lon,max_lat")
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in parts)
+        if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180):
+            raise ValueError("bbox longitudes must be within [-180, 180]")
+        if not (-90 <= min_lat <= max_lat <= 90):
+            raise ValueError("bbox latitudes must be within [-90, 90] and ordered")
+        return cls(min_lon, min_lat, max_lon, max_lat)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        if not self.min_latitude <= latitude <= self.max_latitude:
+            return False
+        if self.min_longitude <= self.max_longitude:
+            return self.min_longitude <= longitude <= self.max_longitude
+        return longitude >= self.min_longitude or longitude <= self.max_longitude
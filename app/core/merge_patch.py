@@ -0,0 +1,42 @@
+import json
+from typing import Any
+
+from sqlalchemy import ARRAY, Text, case, cast, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+def _jsonb(value: Any):
+    return cast(literal(json.dumps(value, separators=(",", ":")), Text), JSONB)
+
+
+def merge_patch_expression(target, patch: Any):
+    """
+    Compile an RFC 7396 JSON merge patch into one SQL expression over a ``jsonb`` column.
+
+    An object patch removes the keys it sets to null with ``-``, overwrites the
+    scalar and array members it sets with ``||``, and recurses into object members,
+    so only the keys named in the patch are touched and concurrent patches to
+    different keys both survive. Any other patch replaces the document.
+
+    Args:
+        target: ``jsonb`` column or expression to patch.
+        patch (Any): Decoded merge patch document.
+
+    Returns:
+        A ``jsonb`` SQL expression for the patched document.
+    """
+    if not isinstance(patch, dict):
+        return _jsonb(patch)
+    result = case((func.jsonb_typeof(target) == "object", target), else_=_jsonb({}))
+    removed = [key for key, value in patch.items() if value is None]
+    if removed:
+        result = result.op("-", return_type=JSONB)(cast(literal(removed, ARRAY(Text)), ARRAY(Text)))
+    replaced = {key: value for key, value in patch.items() if value is not None and not isinstance(value, dict)}
+    if replaced:
+        result = result.op("||", return_type=JSONB)(_jsonb(replaced))
+    # One jsonb_build_object per member: a single call would hit Postgres' 100-argument limit.
+    for key, value in patch.items():
+        if isinstance(value, dict):
+            nested = merge_patch_expression(target.op("->", return_type=JSONB)(literal(key, Text)), value)
+            result = result.op("||", return_type=JSONB)(func.jsonb_build_object(literal(key, Text), nested, type_=JSONB))
+    return result
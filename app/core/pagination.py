@@ -0,0 +1,39 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(created_at: datetime, key: object) -> str:
+    """
+    Encode a keyset position as an opaque cursor.
+
+    Args:
+        created_at (datetime): ``created_at`` of the last row on the page.
+        key (object): Primary key of the last row on the page.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    raw = json.dumps([created_at.isoformat(), str(key)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (str): Cursor string from a previous page.
+
+    Returns:
+        tuple[datetime, str]: The ``created_at`` and primary key of the last row seen.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, key = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(key)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,20 @@
+import math
+
+from sqlalchemy import Integer, cast, func
+
+# Reaching level n takes LEVEL_CURVE * (n - 1) ** 2 experience points.
+LEVEL_CURVE = 75
+
+
+def level_for_experience(experience_points: int) -> int:
+    """
+    Level reached with the given amount of experience points.
+    """
+    return math.isqrt(max(experience_points, 0) // LEVEL_CURVE) + 1
+
+
+def level_expression(experience_points):
+    """
+    SQL equivalent of :func:`level_for_experience` for set-based updates.
+    """
+    return cast(func.floor(func.sqrt(func.greatest(experience_points, 0) / LEVEL_CURVE)), Integer) + 1
@@ -0,0 +1,169 @@
+import bisect
+import threading
+from typing import Callable, Iterable, Optional
+
+
+class ExperienceRankIndex:
+    """
+    Order-statistic index of users by experience points.
+
+    Experience is split into buckets ``bucket_width`` points wide. A Fenwick
+    tree holds the number of users per bucket and each bucket keeps its values
+    sorted, so the number of users ahead of a score is one prefix sum plus one
+    bisect: O(log n) per rank lookup and per change, with no scan of the table.
+    The bucket array doubles when a score lands past its end.
+    """
+
+    def __init__(self, bucket_width: int = 100, initial_buckets: int = 1024):
+        self.bucket_width = bucket_width
+        self._experience: dict[str, int] = {}
+        self._buckets: list[list[int]] = [[] for _ in range(initial_buckets)]
+        self._tree = [0] * (initial_buckets + 1)
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._built = False
+        self._touched: Optional[set[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._experience)
+
+    def ensure_built(self, loader: Callable[[], Iterable[tuple[str, int]]]) -> None:
+        """
+        Load the initial scores once. Events applied while loading win over the snapshot.
+        """
+        if self._built:
+            return
+        with self._build_lock:
+            if self._built:
+                return
+            with self._lock:
+                self._touched = set()
+            rows = list(loader())
+            with self._lock:
+                for wallet_address, experience_points in rows:
+                    if wallet_address not in self._touched:
+                        self._set(wallet_address, experience_points)
+                self._touched = None
+                self._built = True
+
+    def rebuild(self, loader: Callable[[], Iterable[tuple[str, int]]]) -> int:
+        """
+        Replace the scores with a fresh snapshot, dropping any drift from missed events.
+
+        Events applied while loading win over the snapshot. Does nothing before the
+        first ``ensure_built``.
+
+        Returns:
+            int: Number of users in the index, or 0 if it was never built.
+        """
+        if not self._built:
+            return 0
+        with self._build_lock:
+            with self._lock:
+                self._touched = set()
+            try:
+                rows = list(loader())
+            except BaseException:
+                with self._lock:
+                    self._touched = None
+                raise
+            with self._lock:
+                kept = {
+                    wallet_address: self._experience[wallet_address]
+                    for wallet_address in self._touched if wallet_address in self._experience
+                }
+                self._experience = {}
+                self._buckets = [[] for _ in self._buckets]
+                self._tree = [0] * len(self._tree)
+                for wallet_address, experience_points in rows:
+                    if wallet_address not in self._touched:
+                        self._set(wallet_address, experience_points)
+                for wallet_address, experience_points in kept.items():
+                    self._set(wallet_address, experience_points)
+                self._touched = None
+                return len(self._experience)
+
+    def set(self, wallet_address: str, experience_points: int) -> None:
+        with self._lock:
+            self._touch(wallet_address)
+            self._set(wallet_address, experience_points)
+
+    def remove(self, wallet_address: str) -> None:
+        with self._lock:
+            self._touch(wallet_address)
+            self._remove(wallet_address)
+
+    def experience(self, wallet_address: str) -> Optional[int]:
+        with self._lock:
+            return self._experience.get(wallet_address)
+
+    def rank_of(self, experience_points: int) -> int:
+        """
+        Rank a user with ``experience_points`` has, i.e. one more than the number of users ahead.
+        """
+        with self._lock:
+            return self._count_above(experience_points) + 1
+
+    def _touch(self, wallet_address: str) -> None:
+        if self._touched is not None:
+            self._touched.add(wallet_address)
+
+    def _bucket(self, experience_points: int) -> int:
+        return max(experience_points, 0) // self.bucket_width
+
+    def _set(self, wallet_address: str, experience_points: int) -> None:
+        self._remove(wallet_address)
+        bucket = self._bucket(experience_points)
+        if bucket >= len(self._buckets):
+            self._grow(bucket + 1)
+        bisect.insort(self._buckets[bucket], experience_points)
+        self._add(bucket, 1)
+        self._experience[wallet_address] = experience_points
+
+    def _remove(self, wallet_address: str) -> None:
+        experience_points = self._experience.pop(wallet_address, None)
+        if experience_points is None:
+            return
+        bucket = self._bucket(experience_points)
+        values = self._buckets[bucket]
+        del values[bisect.bisect_left(values, experience_points)]
+        self._add(bucket, -1)
+
+    def _count_above(self, experience_points: int) -> int:
+        bucket = self._bucket(experience_points)
+        if bucket >= len(self._buckets):
+            return 0
+        values = self._buckets[bucket]
+        in_bucket = len(values) - bisect.bisect_right(values, experience_points)
+        return len(self._experience) - self._prefix(bucket + 1) + in_bucket
+
+    def _add(self, bucket: int, delta: int) -> None:
+        i = bucket + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, end: int) -> int:
+        """
+        Number of users in buckets ``[0, end)``.
+        """
+        total = 0
+        i = end
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _grow(self, minimum: int) -> None:
+        size = len(self._buckets)
+        while size < minimum:
+            size *= 2
+        self._buckets.extend([] for _ in range(size - len(self._buckets)))
+        # Rebuild the tree in O(buckets) from the per-bucket counts.
+        tree = [0] * (size + 1)
+        for i, values in enumerate(self._buckets, start=1):
+            tree[i] += len(values)
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from app.core.logger import Logger
+
+
+@dataclass
+class JobStats:
+    """
+    Counters for one periodic job.
+    """
+    runs: int = 0
+    failures: int = 0
+    last_rows: int = 0
+    total_rows: int = 0
+    last_duration_s: float = 0.0
+    last_run_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+
+class Scheduler:
+    """
+    Runs periodic jobs on the event loop for the lifetime of the app.
+
+    Jobs are plain synchronous callables returning the number of rows they
+    touched; each run executes in a worker thread so the loop stays free.
+    """
+
+    def __init__(self):
+        self._jobs: dict[str, tuple[Callable[[], int], float]] = {}
+        self._stats: dict[str, JobStats] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(self, name: str, func: Callable[[], int], interval_seconds: float) -> None:
+        """
+        Register a job to run every ``interval_seconds``.
+        """
+        self._jobs[name] = (func, interval_seconds)
+        self._stats[name] = JobStats()
+
+    def start(self) -> None:
+        """
+        Start one task per registered job.
+        """
+        for name, (func, interval) in self._jobs.items():
+            self._tasks.append(asyncio.create_task(self._run_forever(name, func, interval), name=f"job:{name}"))
+
+    async def stop(self) -> None:
+        """
+        Cancel all running job tasks.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def stats(self) -> dict[str, JobStats]:
+        """
+        Current counters for every registered job.
+        """
+        return dict(self._stats)
+
+    async def _run_forever(self, name: str, func: Callable[[], int], interval: float) -> None:
+        stats = self._stats[name]
+        while True:
+            await asyncio.sleep(interval)
+            started = time.monotonic()
+            try:
+                rows = await asyncio.to_thread(func)
+            except Exception as e:
+                stats.failures += 1
+                stats.last_error = repr(e)
+                Logger.error(f"Job {name} failed: {e!r}")
+                rows = 0
+            else:
+                stats.last_error = None
+            stats.runs += 1
+            stats.last_rows = rows
+            stats.total_rows += rows
+            stats.last_duration_s = time.monotonic() - started
+            stats.last_run_at = datetime.now(timezone.utc)
+
+
+scheduler = Scheduler()
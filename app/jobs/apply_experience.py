@@ -0,0 +1,40 @@
+"""
+Fold pending experience awards from the ledger into users.
+
+Usage:
+    python -m app.jobs.apply_experience [--batch-size N] [--max-batches N]
+
+Safe to run from several processes at once; each claims its own batches.
+"""
+import argparse
+import logging
+from typing import Optional
+
+from app.api.services.experience import ExperienceService
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+
+def run(batch_size: int = settings.XP_LEDGER_BATCH_SIZE, max_batches: Optional[int] = None) -> int:
+    """
+    Apply the pending awards and return the number of ledger entries applied.
+    """
+    db = SessionLocal()
+    try:
+        return ExperienceService.apply_pending(db, batch_size, max_batches)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply pending experience awards.")
+    parser.add_argument("--batch-size", type=int, default=settings.XP_LEDGER_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(args.batch_size, args.max_batches)
+
+
+if __name__ == "__main__":
+    main()
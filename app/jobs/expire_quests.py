@@ -0,0 +1,44 @@
+"""
+Cancel open quests whose time window has ended.
+
+Usage:
+    python -m app.jobs.expire_quests [--batch-size N] [--max-batches N]
+"""
+import argparse
+import logging
+
+from app.api.services.quest import QuestService
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import Logger
+
+
+def run(
+    batch_size: int = settings.QUEST_EXPIRY_BATCH_SIZE,
+    max_batches: int = settings.QUEST_EXPIRY_MAX_BATCHES,
+) -> int:
+    """
+    Run one sweep and return the number of quests cancelled.
+    """
+    db = SessionLocal()
+    try:
+        expired = QuestService.expire_quests(db, batch_size, max_batches)
+    finally:
+        db.close()
+    if expired:
+        Logger.info(f"Expired {expired} quests")
+    return expired
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cancel quests past their time window.")
+    parser.add_argument("--batch-size", type=int, default=settings.QUEST_EXPIRY_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=settings.QUEST_EXPIRY_MAX_BATCHES)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(args.batch_size, args.max_batches)
+
+
+if __name__ == "__main__":
+    main()
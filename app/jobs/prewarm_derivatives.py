@@ -0,0 +1,45 @@
+"""
+Render every configured derivative for existing item images.
+
+Usage:
+    python -m app.jobs.prewarm_derivatives [--preset NAME ...]
+"""
+import argparse
+import logging
+from typing import Iterable, Optional
+
+from app.api.services.item import ItemService
+from app.core.database import SessionLocal
+from app.core.derivatives import DERIVATIVE_SPECS, derivative_cache
+from app.core.logger import Logger
+
+
+def run(presets: Optional[Iterable[str]] = None) -> int:
+    """
+    Render missing derivatives and return how many were rendered.
+    """
+    specs = [DERIVATIVE_SPECS[name] for name in presets] if presets else list(DERIVATIVE_SPECS.values())
+    db = SessionLocal()
+    try:
+        hashes = ItemService.get_image_hashes(db)
+    finally:
+        db.close()
+    rendered = derivative_cache.prewarm(hashes, specs)
+    Logger.info(f"Rendered {rendered} derivatives for {len(hashes)} images")
+    return rendered
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-render item image derivatives.")
+    parser.add_argument("--preset", action="append", choices=sorted(DERIVATIVE_SPECS), dest="presets")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        run(args.presets)
+    finally:
+        derivative_cache.shutdown()
+
+
+if __name__ == "__main__":
+    main()
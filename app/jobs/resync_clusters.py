@@ -0,0 +1,19 @@
+"""
+Reload the quest cluster index from the database.
+
+The index lives in the server process, so this job is only scheduled in-process
+and has no command-line entry point.
+"""
+from app.api.services.quest import QuestService
+from app.core.database import SessionLocal
+
+
+def run() -> int:
+    """
+    Run one resync and return the number of quests in the index.
+    """
+    db = SessionLocal()
+    try:
+        return QuestService.resync_clusters(db)
+    finally:
+        db.close()
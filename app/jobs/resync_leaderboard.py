@@ -0,0 +1,20 @@
+"""
+Reload the leaderboard rank index and the username search trie from the database.
+
+Both indexes live in the server process, so this job is only scheduled
+in-process and has no command-line entry point.
+"""
+from app.api.services.leaderboard import LeaderboardService
+from app.api.services.user import UserService
+from app.core.database import SessionLocal
+
+
+def run() -> int:
+    """
+    Run one resync and return the number of users reloaded into either index.
+    """
+    db = SessionLocal()
+    try:
+        return LeaderboardService.resync_ranks(db) + UserService.resync_hot_users(db)
+    finally:
+        db.close()
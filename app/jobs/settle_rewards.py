@@ -0,0 +1,40 @@
+"""
+Settle rewards for completed quests.
+
+Usage:
+    python -m app.jobs.settle_rewards [--batch-size N] [--max-batches N]
+
+Safe to run from several processes at once; each claims its own batches.
+"""
+import argparse
+import logging
+from typing import Optional
+
+from app.api.services.settlement import SettlementService
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+
+def run(batch_size: int = settings.SETTLEMENT_BATCH_SIZE, max_batches: Optional[int] = None) -> int:
+    """
+    Settle the current backlog and return the number of quests settled.
+    """
+    db = SessionLocal()
+    try:
+        return SettlementService.settle_completed_quests(db, batch_size, max_batches)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Settle rewards for completed quests.")
+    parser.add_argument("--batch-size", type=int, default=settings.SETTLEMENT_BATCH_SIZE)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run(args.batch_size, args.max_batches)
+
+
+if __name__ == "__main__":
+    main()
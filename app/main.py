@@ -1,12 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routers.avatar import router as avatar_router
 from app.api.routers.item import router as item_router
+from app.api.routers.leaderboard import router as leaderboard_router
+from app.api.routers.metadata import router as metadata_router
+from app.api.routers.metrics import router as metrics_router
+from app.api.routers.profile import router as profile_router
 from app.api.routers.quest import router as quest_router
 from app.api.routers.user import router as user_router
+from app.core.config import settings
+from app.core.derivatives import derivative_cache
+from app.core.events import NotifyListener, item_events, quest_events, user_events
+from app.core.scheduler import scheduler
+from app.jobs import apply_experience, expire_quests, resync_clusters, resync_leaderboard, settle_rewards
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    notify_listener = NotifyListener(settings.DATABASE_URL, [quest_events, user_events, item_events])
+    if settings.EVENTS_LISTEN_ENABLED:
+        notify_listener.start()
+    if settings.SCHEDULER_ENABLED:
+        scheduler.add_job("quest_expiry", expire_quests.run, settings.QUEST_EXPIRY_INTERVAL_SECONDS)
+        scheduler.add_job("reward_settlement", settle_rewards.run, settings.SETTLEMENT_INTERVAL_SECONDS)
+        scheduler.add_job("experience_ledger", apply_experience.run, settings.XP_LEDGER_INTERVAL_SECONDS)
+        scheduler.add_job("cluster_resync", resync_clusters.run, settings.CLUSTER_RESYNC_INTERVAL_SECONDS)
+        scheduler.add_job("leaderboard_resync", resync_leaderboard.run, settings.LEADERBOARD_RESYNC_INTERVAL_SECONDS)
+        scheduler.start()
+    yield
+    await scheduler.stop()
+    notify_listener.stop()
+    derivative_cache.shutdown()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Specify origins allowed to make requests
 origins = [
@@ -28,3 +58,7 @@ app.include_router(user_router)
 app.include_router(quest_router)
 app.include_router(item_router)
 app.include_router(avatar_router)
+app.include_router(leaderboard_router)
+app.include_router(metadata_router)
+app.include_router(profile_router)
+app.include_router(metrics_router)
@@ -1,4 +1,5 @@
 from .avatar import *
+from .experience import *
 from .item import *
 from .quest import *
 from .user import *
@@ -1,4 +1,6 @@
 from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
@@ -8,6 +10,8 @@ class Avatar(Base):
 
     wallet_address = Column(String, ForeignKey('users.wallet_address'), primary_key=True)
     equipped_items = Column(JSON)  # List of item IDs
-    cosmetic_details = Column(JSON)
-    preferences = Column(JSON)
+    cosmetic_details = Column(JSONB)
+    preferences = Column(JSONB)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    user = relationship('User', back_populates='avatar', lazy='raise')
@@ -0,0 +1,22 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, Integer, String, func, text
+
+from app.core.database import Base
+
+
+class ExperienceLedgerEntry(Base):
+    __tablename__ = 'xp_ledger'
+
+    entry_id = Column(BigInteger, primary_key=True, autoincrement=True)
+    wallet_address = Column(String, ForeignKey('users.wallet_address', ondelete='CASCADE'), nullable=False)
+    amount = Column(Integer, nullable=False)
+    reason = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    applied_at = Column(DateTime(timezone=True), nullable=True)  # Set once folded into users.experience_points
+
+    __table_args__ = (
+        # Only unapplied entries are scanned, by the aggregator and for pending totals.
+        Index(
+            'ix_xp_ledger_pending', 'wallet_address', 'entry_id',
+            postgresql_where=text('applied_at IS NULL'),
+        ),
+    )
@@ -1,8 +1,17 @@
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, String, func, LargeBinary
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
 
+def attribute_path(attributes, key: str):
+    """
+    ``attributes -> 'key'``, written the same way as the expression indexes so the planner can match them.
+    """
+    return attributes.op('->', return_type=JSONB)(literal(key, String))
+
+
 class Item(Base):
     __tablename__ = 'items'
 
@@ -10,9 +19,24 @@ class Item(Base):
     owner_wallet = Column(String, ForeignKey('users.wallet_address'))
     name = Column(String)
     description = Column(String)
-    attributes = Column(JSON)
+    attributes = Column(JSONB)
     image_url = Column(String)
-    image_data = Column(LargeBinary)
+    image_sha256 = Column(String(64), nullable=True)  # Key of the image bytes in the blob store
+    image_size = Column(Integer, nullable=True)
+    image_content_type = Column(String, nullable=True)
     metadata_uri = Column(String)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    owner = relationship('User', back_populates='items', lazy='raise')
+
+    __table_args__ = (
+        # Keyset pagination over one wallet's inventory, or over all items
+        Index('ix_items_owner_wallet_created_at_item_id', 'owner_wallet', 'created_at', 'item_id'),
+        Index('ix_items_created_at_item_id', 'created_at', 'item_id'),
+        # Containment (@>) and key-existence lookups on any attribute
+        Index('ix_items_attributes', 'attributes', postgresql_using='gin'),
+        # Range comparisons on hot attributes
+        Index('ix_items_attributes_damage', attribute_path(attributes, 'damage')),
+        Index('ix_items_attributes_durability', attribute_path(attributes, 'durability')),
+    )
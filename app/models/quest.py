@@ -1,8 +1,9 @@
 import enum
 import uuid
 
-from sqlalchemy import JSON, Column, DateTime, Enum, ForeignKey, String, func, Float
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import JSON, Column, Computed, DateTime, Enum, Float, ForeignKey, Index, String, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -15,6 +16,12 @@ class QuestStatus(enum.Enum):
     cancelled = "cancelled"
 
 
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
 class Quest(Base):
     __tablename__ = 'quests'
 
@@ -26,8 +33,40 @@ class Quest(Base):
     location = Column(String)
     longitude = Column(Float, nullable=False)  # Longitude of the location
     latitude = Column(Float, nullable=False)  # Latitude of the location
+    geohash = Column(String(12))  # Derived from latitude/longitude for spatial lookups
     time_window = Column(JSON)  # Store start and end times as JSON
+    starts_at = Column(DateTime(timezone=True))  # Derived from time_window.start_time
+    ends_at = Column(DateTime(timezone=True))  # Derived from time_window.end_time
     rewards = Column(JSON)      # Store EXP and items as JSON
     status = Column(Enum(QuestStatus), default=QuestStatus.available)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    settled_at = Column(DateTime(timezone=True), nullable=True)  # When rewards were paid out
+    # Generated by Postgres for full-text search; deferred so ordinary loads skip it
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
+
+    creator = relationship('User', back_populates='created_quests', foreign_keys=[creator_wallet], lazy='raise')
+    participant = relationship(
+        'User', back_populates='participating_quests', foreign_keys=[participant_wallet], lazy='raise',
+    )
+
+    __table_args__ = (
+        # text_pattern_ops lets `geohash LIKE 'prefix%'` use the B-tree regardless of collation
+        Index('ix_quests_geohash', 'geohash', postgresql_ops={'geohash': 'text_pattern_ops'}),
+        # Keyset pagination on (created_at, quest_id), optionally scoped by a filter column
+        Index('ix_quests_created_at_quest_id', 'created_at', 'quest_id'),
+        Index('ix_quests_status_created_at_quest_id', 'status', 'created_at', 'quest_id'),
+        Index('ix_quests_creator_wallet_created_at_quest_id', 'creator_wallet', 'created_at', 'quest_id'),
+        Index('ix_quests_participant_wallet_created_at_quest_id', 'participant_wallet', 'created_at', 'quest_id'),
+        # Time-window range scans: "starting soon" on starts_at, "active at" on ends_at
+        Index('ix_quests_starts_at', 'starts_at'),
+        Index('ix_quests_ends_at_starts_at', 'ends_at', 'starts_at'),
+        # Small partial index over the settlement backlog only
+        Index(
+            'ix_quests_unsettled_updated_at', 'updated_at',
+            postgresql_where=text("status = 'completed' AND settled_at IS NULL"),
+        ),
+        # Full-text search, plus trigram matching on titles to tolerate typos
+        Index('ix_quests_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_quests_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
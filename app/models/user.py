@@ -1,4 +1,5 @@
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
+from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
@@ -14,3 +15,26 @@ class User(Base):
     level = Column(Integer, default=1)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Never lazy-loaded: load explicitly (joinedload/selectinload) to keep queries countable.
+    avatar = relationship('Avatar', back_populates='user', uselist=False, lazy='raise')
+    items = relationship('Item', back_populates='owner', lazy='raise')
+    created_quests = relationship(
+        'Quest', back_populates='creator', foreign_keys='Quest.creator_wallet', lazy='raise',
+    )
+    participating_quests = relationship(
+        'Quest', back_populates='participant', foreign_keys='Quest.participant_wallet', lazy='raise',
+    )
+
+    __table_args__ = (
+        # Serves the leaderboard in rank order, ties broken by wallet address.
+        Index(
+            'ix_users_experience_points_wallet_address',
+            experience_points.desc().nulls_last(), wallet_address,
+        ),
+        # Case-insensitive username prefix search (LIKE 'abc%').
+        Index(
+            'ix_users_username_lower', func.lower(username).label('username_lower'),
+            postgresql_ops={'username_lower': 'text_pattern_ops'},
+        ),
+    )
@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.item import ItemRead
+
 
 class AvatarBase(BaseModel):
     """
@@ -69,6 +71,25 @@ class AvatarUpdate(BaseModel):
     preferences: Optional[Dict[str, Any]] = Field(None, example={"theme": "light", "notifications": False})
 
 
+class AvatarPatch(AvatarUpdate):
+    """
+    Schema for an RFC 7396 JSON merge patch of an avatar.
+
+    ``cosmetic_details`` and ``preferences`` are merged key by key: members set to
+    null are removed, nested objects are merged recursively and other values
+    replace what was there. ``equipped_items`` is replaced when present.
+
+    Example:
+        {
+            "cosmetic_details": {"hair_color": "red", "hat": null},
+            "preferences": {"notifications": false}
+        }
+    """
+
+    class Config:
+        extra = "forbid"
+
+
 class AvatarRead(AvatarBase):
     """
     Schema for reading avatar data.
@@ -92,6 +113,25 @@ class AvatarRead(AvatarBase):
     updated_at: Optional[datetime] = Field(None, example="2023-01-15T18:45:00Z")
 
 
+class AvatarWithItems(AvatarRead):
+    """
+    Schema for reading avatar data with its equipped items resolved.
+
+    Example:
+        {
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "equipped_items": ["sword_of_truth"],
+            "cosmetic_details": {"hair_color": "blonde"},
+            "preferences": {"theme": "dark"},
+            "updated_at": "2023-01-15T18:45:00Z",
+            "equipped": [{...}]
+        }
+    """
+    equipped: Optional[List[ItemRead]] = Field(
+        None, description="Equipped items the wallet owns, in equipped order. Only returned when expanded."
+    )
+
+
 class AvatarDelete(BaseModel):
     """
     Schema for deleting an avatar.
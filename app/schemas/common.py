@@ -0,0 +1,36 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class BatchGetRequest(BaseModel):
+    """
+    Schema for fetching many records by ID in one request.
+
+    Example:
+        {
+            "ids": ["sword_of_truth", "shield_of_dawn"]
+        }
+    """
+    ids: List[str] = Field(..., min_length=1, max_length=settings.BATCH_GET_MAX, example=["sword_of_truth", "shield_of_dawn"], description="IDs to fetch.")
+
+
+class BatchGetResponse(BaseModel, Generic[T]):
+    """
+    Schema for the response of a batch get.
+
+    ``results`` is aligned with the requested ``ids``: position ``i`` holds the
+    record for ``ids[i]``, or null if it does not exist.
+
+    Example:
+        {
+            "results": [{...}, null],
+            "missing": ["shield_of_dawn"]
+        }
+    """
+    results: List[Optional[T]]
+    missing: List[str] = Field(..., description="Requested IDs that were not found, in request order.")
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ExperienceAward(BaseModel):
+    """
+    Schema for awarding experience points to a user.
+
+    Example:
+        {
+            "amount": 150,
+            "reason": "daily_login"
+        }
+    """
+    amount: int = Field(..., gt=0, le=1_000_000, example=150)
+    reason: Optional[str] = Field(None, max_length=200, example="daily_login")
+
+
+class ExperienceLedgerEntryRead(BaseModel):
+    """
+    Schema for reading an entry of the experience ledger.
+
+    Example:
+        {
+            "entry_id": 1024,
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "amount": 150,
+            "reason": "daily_login",
+            "created_at": "2023-01-15T18:45:00Z",
+            "applied_at": null
+        }
+    """
+    entry_id: int = Field(..., example=1024)
+    wallet_address: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+    amount: int = Field(..., example=150)
+    reason: Optional[str] = Field(None, example="daily_login")
+    created_at: Optional[datetime] = Field(None, example="2023-01-15T18:45:00Z")
+    applied_at: Optional[datetime] = Field(None, example=None, description="When the entry was folded into the user's total.")
+
+    class Config:
+        orm_mode = True
+
+
+class ExperienceRead(BaseModel):
+    """
+    Schema for a user's experience total.
+
+    Example:
+        {
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "experience_points": 1650,
+            "pending_experience_points": 150,
+            "level": 5,
+            "include_pending": true
+        }
+    """
+    wallet_address: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+    experience_points: int = Field(..., example=1650, description="Settled total, plus pending awards if include_pending.")
+    pending_experience_points: int = Field(..., example=150, description="Awarded but not yet applied to the user.")
+    level: int = Field(..., example=5, description="Level for experience_points.")
+    include_pending: bool = Field(..., example=True)
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from app.core.config import settings
+
 
 class ItemBase(BaseModel):
     """
@@ -72,6 +74,28 @@ class ItemUpdate(BaseModel):
     metadata_uri: Optional[str] = Field(None, example="https://metadata.example.com/items/enhanced_sword_of_truth.json", description="Updated metadata URI for the item.")
 
 
+class ItemPatch(ItemUpdate):
+    """
+    Schema for an RFC 7396 JSON merge patch of an item.
+
+    ``attributes`` is merged key by key: members set to null are removed, nested
+    objects are merged recursively and other values replace what was there. The
+    remaining fields are replaced when present.
+
+    Example:
+        {
+            "attributes": {
+                "damage": 175,
+                "enchantment": {"element": "fire"},
+                "cursed": null
+            }
+        }
+    """
+
+    class Config:
+        extra = "forbid"
+
+
 class ItemRead(ItemBase):
     """
     Schema for reading item data.
@@ -88,12 +112,18 @@ class ItemRead(ItemBase):
             },
             "image_url": "https://example.com/items/sword_of_truth.png",
             "metadata_uri": "https://metadata.example.com/items/sword_of_truth.json",
+            "image_sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+            "image_size": 48213,
+            "image_content_type": "image/png",
             "created_at": "2023-01-05T14:00:00Z",
             "updated_at": "2023-01-10T16:30:00Z"
         }
     """
     item_id: str = Field(..., example="sword_of_truth", description="Unique identifier for the item.")
     owner_wallet: str = Field(..., example="0xabcdefabcdefabcdefabcdefabcdefabcdef", description="Wallet address of the item's owner.")
+    image_sha256: Optional[str] = Field(None, example="9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08", description="SHA-256 of the stored image, if any.")
+    image_size: Optional[int] = Field(None, example=48213, description="Size of the stored image in bytes.")
+    image_content_type: Optional[str] = Field(None, example="image/png", description="MIME type of the stored image.")
     created_at: Optional[datetime] = Field(None, example="2023-01-05T14:00:00Z", description="Timestamp when the item was created.")
     updated_at: Optional[datetime] = Field(None, example="2023-01-10T16:30:00Z", description="Timestamp when the item was last updated.")
 
@@ -102,6 +132,87 @@ class ItemRead(ItemBase):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class ItemPage(BaseModel):
+    """
+    Schema for a page of items returned by keyset pagination.
+
+    Example:
+        {
+            "items": [...],
+            "next_cursor": "WyIyMDIzLTAxLTA1VDE0OjAwOjAwKzAwOjAwIiwic3dvcmRfb2ZfdHJ1dGgiXQ"
+        }
+    """
+    items: List[ItemRead]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page.")
+
+
+class ItemTransferRequest(BaseModel):
+    """
+    Schema for moving a set of items from one wallet to another.
+
+    Example:
+        {
+            "from_wallet": "0xabcdefabcdefabcdefabcdefabcdefabcdef",
+            "to_wallet": "0x1234567890abcdef1234567890abcdef12345678",
+            "item_ids": ["sword_of_truth", "shield_of_dawn"]
+        }
+    """
+    from_wallet: str = Field(..., example="0xabcdefabcdefabcdefabcdefabcdefabcdef", description="Wallet address the items are moved from.")
+    to_wallet: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678", description="Wallet address the items are moved to.")
+    item_ids: List[str] = Field(..., min_length=1, max_length=settings.ITEM_TRANSFER_MAX, example=["sword_of_truth", "shield_of_dawn"], description="IDs of the items to move.")
+
+
+class ItemTransferFailure(BaseModel):
+    """
+    An item that blocked a transfer.
+
+    Example:
+        {
+            "item_id": "shield_of_dawn",
+            "reason": "not_owned"
+        }
+    """
+    item_id: str = Field(..., example="shield_of_dawn")
+    reason: str = Field(..., example="not_owned", description="`not_found` or `not_owned`.")
+
+
+class ItemTransferConflictDetail(BaseModel):
+    """
+    Why a transfer was rejected, and which items blocked it.
+    """
+    message: str = Field(..., example="Some items cannot be transferred")
+    failures: List[ItemTransferFailure]
+
+
+class ItemTransferConflict(BaseModel):
+    """
+    Schema for the 409 response of a rejected transfer.
+
+    Example:
+        {
+            "detail": {
+                "message": "Some items cannot be transferred",
+                "failures": [{"item_id": "shield_of_dawn", "reason": "not_owned"}]
+            }
+        }
+    """
+    detail: ItemTransferConflictDetail
+
+
+class ItemTransferResponse(BaseModel):
+    """
+    Schema for the response of a successful transfer.
+
+    Example:
+        {
+            "to_wallet": "0x1234567890abcdef1234567890abcdef12345678",
+            "transferred": ["sword_of_truth", "shield_of_dawn"]
+        }
+    """
+    to_wallet: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+    transferred: List[str] = Field(..., example=["sword_of_truth", "shield_of_dawn"], description="IDs of the moved items.")
+
+
 class ItemDelete(BaseModel):
     """
     Schema for deleting an item.
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobStatsRead(BaseModel):
+    """
+    Schema for the counters of a background job.
+
+    Example:
+        {
+            "runs": 42,
+            "failures": 0,
+            "last_rows": 120,
+            "total_rows": 5310,
+            "last_duration_s": 0.084,
+            "last_run_at": "2023-01-15T18:45:00Z",
+            "last_error": null
+        }
+    """
+    runs: int = Field(..., example=42, description="Completed runs since startup.")
+    failures: int = Field(..., example=0, description="Runs that raised an error.")
+    last_rows: int = Field(..., example=120, description="Rows processed by the last run.")
+    total_rows: int = Field(..., example=5310, description="Rows processed since startup.")
+    last_duration_s: float = Field(..., example=0.084, description="Duration of the last run in seconds.")
+    last_run_at: Optional[datetime] = Field(None, example="2023-01-15T18:45:00Z")
+    last_error: Optional[str] = Field(None, example=None)
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,27 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.schemas.avatar import AvatarWithItems
+from app.schemas.quest import QuestRead
+from app.schemas.user import UserRead
+
+
+class ProfileRead(BaseModel):
+    """
+    Schema for a player profile.
+
+    Example:
+        {
+            "user": {...},
+            "avatar": {...},
+            "item_count": 42,
+            "created_quests": [...],
+            "participating_quests": [...]
+        }
+    """
+    user: UserRead
+    avatar: Optional[AvatarWithItems] = None
+    item_count: int = Field(..., example=42)
+    created_quests: List[QuestRead] = Field(..., description="Most recent quests the user created, newest first.")
+    participating_quests: List[QuestRead] = Field(..., description="Most recent quests the user takes part in, newest first.")
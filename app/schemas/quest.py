@@ -192,7 +192,8 @@ class QuestRead(QuestBase):
             },
             "status": "available",
             "created_at": "2023-01-10T10:00:00Z",
-            "updated_at": "2023-01-12T12:00:00Z"
+            "updated_at": "2023-01-12T12:00:00Z",
+            "settled_at": null
         }
     """
     quest_id: UUID = Field(..., example="f47ac10b-58cc-4372-a567-0e02b2c3d479")
@@ -201,12 +202,92 @@ class QuestRead(QuestBase):
     status: QuestStatus = Field(..., example="available")
     created_at: Optional[datetime] = Field(None, example="2023-01-10T10:00:00Z")
     updated_at: Optional[datetime] = Field(None, example="2023-01-12T12:00:00Z")
+    settled_at: Optional[datetime] = Field(None, example="2023-01-12T12:05:00Z")
 
     class Config:
         orm_mode = True
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+class QuestParticipant(BaseModel):
+    """
+    Schema identifying the wallet that accepts, starts or completes a quest.
+
+    Example:
+        {
+            "participant_wallet": "0x1234567890abcdef1234567890abcdef12345678"
+        }
+    """
+    participant_wallet: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+
+
+class QuestPage(BaseModel):
+    """
+    Schema for a page of quests returned by keyset pagination.
+
+    Example:
+        {
+            "items": [...],
+            "next_cursor": "WyIyMDIzLTAxLTEwVDEwOjAwOjAwKzAwOjAwIiwiZjQ3YWMxMGIiXQ"
+        }
+    """
+    items: List[QuestRead]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page.")
+
+
+class QuestCluster(BaseModel):
+    """
+    Schema for a cluster of quests on the map.
+
+    Example:
+        {
+            "latitude": 34.05,
+            "longitude": -118.24,
+            "count": 12,
+            "quest_id": null
+        }
+    """
+    latitude: float = Field(..., example=34.05, description="Latitude of the cluster centroid.")
+    longitude: float = Field(..., example=-118.24, description="Longitude of the cluster centroid.")
+    count: int = Field(..., example=12, description="Number of quests in the cluster.")
+    quest_id: Optional[UUID] = Field(None, example=None, description="The quest, when the cluster holds exactly one.")
+
+
+class QuestBulkResult(BaseModel):
+    """
+    Outcome of one row of a bulk quest creation.
+
+    Example:
+        {
+            "index": 0,
+            "quest_id": "f47ac10b-58cc-4372-a567-0e02b2c3d479",
+            "error": null
+        }
+    """
+    index: int = Field(..., example=0, description="Position of the row in the request.")
+    quest_id: Optional[UUID] = Field(None, example="f47ac10b-58cc-4372-a567-0e02b2c3d479")
+    error: Optional[str] = Field(None, example=None, description="Why the row was rejected.")
+
+
+class QuestBulkCreateResponse(BaseModel):
+    """
+    Schema for the response of a bulk quest creation.
+
+    Example:
+        {
+            "created": 1,
+            "failed": 1,
+            "results": [
+                {"index": 0, "quest_id": "f47ac10b-58cc-4372-a567-0e02b2c3d479", "error": null},
+                {"index": 1, "quest_id": null, "error": "latitude: Field required"}
+            ]
+        }
+    """
+    created: int = Field(..., example=1)
+    failed: int = Field(..., example=1)
+    results: List[QuestBulkResult]
+
+
 class QuestDelete(BaseModel):
     """
     Schema for deleting a quest.
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -88,3 +88,71 @@ class UserDelete(BaseModel):
         }
     """
     wallet_address: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+
+
+class LeaderboardEntry(BaseModel):
+    """
+    Schema for one row of the experience leaderboard.
+
+    Example:
+        {
+            "rank": 1,
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "username": "john_doe",
+            "experience_points": 1500,
+            "level": 5
+        }
+    """
+    rank: int = Field(..., example=1, description="1-based position; users with equal experience share a rank.")
+    wallet_address: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+    username: Optional[str] = Field(None, example="john_doe")
+    experience_points: int = Field(0, example=1500)
+    level: int = Field(1, example=5)
+
+
+class LeaderboardPage(BaseModel):
+    """
+    Schema for a page of the experience leaderboard.
+
+    Example:
+        {
+            "entries": [...],
+            "total": 1024
+        }
+    """
+    entries: List[LeaderboardEntry]
+    total: int = Field(..., example=1024, description="Number of ranked users.")
+
+
+class UserRank(BaseModel):
+    """
+    Schema for a user's position on the experience leaderboard.
+
+    Example:
+        {
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "experience_points": 1500,
+            "rank": 42,
+            "total": 1024
+        }
+    """
+    wallet_address: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+    experience_points: int = Field(..., example=1500)
+    rank: int = Field(..., example=42)
+    total: int = Field(..., example=1024, description="Number of ranked users.")
+
+
+class UserSuggestion(BaseModel):
+    """
+    Schema for a username autocomplete match.
+
+    Example:
+        {
+            "wallet_address": "0x1234567890abcdef1234567890abcdef12345678",
+            "username": "john_doe",
+            "experience_points": 1500
+        }
+    """
+    wallet_address: str = Field(..., example="0x1234567890abcdef1234567890abcdef12345678")
+    username: str = Field(..., example="john_doe")
+    experience_points: int = Field(0, example=1500)